@@ -23,7 +23,7 @@ def basic_import_example():
     
     # 1. Create configuration
     print("1. Setting up configuration...")
-    config = ConfigurationManager("examples/example_config.ini")
+    config = ConfigurationManager.get_instance("examples/example_config.ini")
     
     # Override some settings for this example
     config.set_value('IMPORT', 'max_coins', '10')  # Import only 10 coins
@@ -36,9 +36,10 @@ def basic_import_example():
     print("\n2. Creating components...")
     try:
         data_provider, exchange_mappers, database_adapter = create_components_from_config(config)
-        print(f"✓ Data provider: {type(data_provider).__name__}")
-        print(f"✓ Exchange mappers: {[type(m).__name__ for m in exchange_mappers]}")
-        print(f"✓ Database adapter: {type(database_adapter).__name__}")
+        print(f"✓ Data provider: {type(data_provider).__name__}",
+              f"✓ Exchange mappers: {[type(m).__name__ for m in exchange_mappers]}",
+              f"✓ Database adapter: {type(database_adapter).__name__}",
+              sep="\n")
     except Exception as e:
         print(f"✗ Failed to create components: {e}")
         return False
@@ -58,20 +59,24 @@ def basic_import_example():
     try:
         result = orchestrator.run_import()
         
-        print(f"\n=== Import Results ===")
-        print(f"Total processed: {result.total_processed}")
-        print(f"New records: {result.new_records}")
-        print(f"Updated records: {result.updated_records}")
-        print(f"Kraken tradeable: {result.kraken_count}")
-        print(f"Failed: {result.failed_count}")
-        print(f"Execution time: {result.execution_time:.2f} seconds")
+        # Collect the report and write it in one go
+        lines = [
+            f"\n=== Import Results ===",
+            f"Total processed: {result.total_processed}",
+            f"New records: {result.new_records}",
+            f"Updated records: {result.updated_records}",
+            f"Kraken tradeable: {result.kraken_count}",
+            f"Failed: {result.failed_count}",
+            f"Execution time: {result.execution_time:.2f} seconds",
+        ]
         
         if result.errors:
-            print(f"\nErrors encountered:")
-            for error in result.errors[:3]:  # Show first 3 errors
-                print(f"  - {error}")
+            lines.append(f"\nErrors encountered:")
+            lines.extend(f"  - {error}" for error in result.errors[:3])  # Show first 3 errors
             if len(result.errors) > 3:
-                print(f"  ... and {len(result.errors) - 3} more")
+                lines.append(f"  ... and {len(result.errors) - 3} more")
+        
+        print(*lines, sep="\n")
         
         return result.failed_count == 0
         
@@ -92,7 +97,7 @@ def update_example():
     print("\n=== Update Example ===\n")
     
     # Quick setup
-    config = ConfigurationManager("examples/example_config.ini")
+    config = ConfigurationManager.get_instance("examples/example_config.ini")
     data_provider, exchange_mappers, database_adapter = create_components_from_config(config)
     orchestrator = ImportOrchestrator("examples/example_config.ini")
     orchestrator.initialize(data_provider, exchange_mappers, database_adapter)
@@ -118,26 +123,26 @@ def status_example():
     
     print("\n=== Status Example ===\n")
     
-    config = ConfigurationManager("examples/example_config.ini")
-    
-    # Check database status
-    db_path = config.get('DATABASE', 'database_path')
-    print(f"Database path: {db_path}")
-    print(f"Database exists: {'✓' if os.path.exists(db_path) else '✗'}")
+    config = ConfigurationManager.get_instance("examples/example_config.ini")
+    snap = config.snapshot()
     
-    # Check configuration
-    print(f"\nConfiguration:")
-    print(f"  Max coins: {config.get('IMPORT', 'max_coins')}")
-    print(f"  Min market cap: ${config.getfloat('IMPORT', 'min_market_cap'):,.0f}")
-    print(f"  Exclude stablecoins: {config.getboolean('FILTERING', 'exclude_stablecoins')}")
+    # Check database status and configuration
+    print(f"Database path: {snap.db_path}",
+          f"Database exists: {'✓' if os.path.exists(snap.db_path) else '✗'}",
+          f"\nConfiguration:",
+          f"  Max coins: {snap.max_coins}",
+          f"  Min market cap: ${snap.min_market_cap:,.0f}",
+          f"  Exclude stablecoins: {snap.exclude_stablecoins}",
+          sep="\n")
     
     # Try to create components
     try:
         data_provider, exchange_mappers, database_adapter = create_components_from_config(config)
-        print(f"\nComponents:")
-        print(f"  ✓ Data provider available")
-        print(f"  ✓ {len(exchange_mappers)} exchange mapper(s) available")
-        print(f"  ✓ Database adapter available")
+        print(f"\nComponents:",
+              f"  ✓ Data provider available",
+              f"  ✓ {len(exchange_mappers)} exchange mapper(s) available",
+              f"  ✓ Database adapter available",
+              sep="\n")
         return True
     except Exception as e:
         print(f"\n✗ Component creation failed: {e}")
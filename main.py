@@ -5,10 +5,14 @@ Updated for proper package structure with improved error handling and security
 
 import sys
 import os
+import stat
+import time
 import logging
 import functools
+import contextlib
+import weakref
 from pathlib import Path
-from typing import Tuple, Optional, Any
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 # Add src to Python path for development with security validation
 try:
@@ -24,8 +28,10 @@ except (OSError, ValueError) as e:
     sys.exit(1)
 
 from core.configuration_manager import ConfigurationManager
-from orchestrators.import_orchestrator import ImportOrchestrator
-from core.factory_classes import create_components_from_config, get_factory_status
+
+# The orchestrator and factory modules pull in the provider, mapper and
+# adapter stacks (requests, pandas, COM). They are imported inside the
+# commands that need them so cheap commands like 'help' skip that cost.
 
 logger = logging.getLogger(__name__)
 
@@ -39,45 +45,100 @@ class ExitCodes:
     INITIALIZATION_ERROR = 4
 
 
-class SystemOutput:
-    """Unified output system for consistent messaging"""
-    
-    @staticmethod
-    def info(message: str, use_logger: bool = True):
-        """Output info message"""
-        if use_logger and logger.isEnabledFor(logging.INFO):
-            logger.info(message)
-        else:
-            print(f"INFO: {message}")
-    
-    @staticmethod
-    def warning(message: str, use_logger: bool = True):
-        """Output warning message"""
-        if use_logger and logger.isEnabledFor(logging.WARNING):
-            logger.warning(message)
-        else:
-            print(f"WARNING: {message}")
+# Unified output functions for consistent messaging
+
+
+def info(message: str, use_logger: bool = True):
+    """Output info message"""
+    if use_logger and logger.isEnabledFor(logging.INFO):
+        logger.info(message)
+    else:
+        print(f"INFO: {message}")
+
+
+def warning(message: str, use_logger: bool = True):
+    """Output warning message"""
+    if use_logger and logger.isEnabledFor(logging.WARNING):
+        logger.warning(message)
+    else:
+        print(f"WARNING: {message}")
+
+
+def error(message: str, use_logger: bool = True):
+    """Output error message"""
+    if use_logger and logger.isEnabledFor(logging.ERROR):
+        logger.error(message)
+    else:
+        print(f"ERROR: {message}")
+
+
+def success(message: str, use_logger: bool = True):
+    """Output success message"""
+    if use_logger and logger.isEnabledFor(logging.INFO):
+        logger.info(message)
+    else:
+        print(f"✓ {message}")
+
+
+def _safe_stat(path: str) -> Optional[os.stat_result]:
+    """Stat a path, returning None if it does not exist
     
-    @staticmethod
-    def error(message: str, use_logger: bool = True):
-        """Output error message"""
-        if use_logger and logger.isEnabledFor(logging.ERROR):
-            logger.error(message)
-        else:
-            print(f"ERROR: {message}")
+    Args:
+        path: Path to stat
+        
+    Returns:
+        The stat result, or None if the path does not exist
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _is_safe_path(path: str) -> bool:
+    """Check that a path has no parent-directory components"""
+    normalized = os.path.normpath(path)
+    return os.sep + os.pardir + os.sep not in os.sep + normalized + os.sep
+
+
+def _stat_satisfies(path_stat: Optional[os.stat_result], must_exist: bool = False,
+                    must_be_file: bool = False) -> bool:
+    """Check existence/type requirements against an already obtained stat result"""
+    if path_stat is None:
+        return not must_exist
+    if must_be_file and not stat.S_ISREG(path_stat.st_mode):
+        return False
+    return True
+
+
+# Recent database existence checks: path -> (monotonic timestamp, exists)
+_db_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def _db_exists(path: str, ttl: float = 1.0) -> bool:
+    """Check whether a database path exists, reusing results younger than ttl seconds
     
-    @staticmethod
-    def success(message: str, use_logger: bool = True):
-        """Output success message"""
-        if use_logger and logger.isEnabledFor(logging.INFO):
-            logger.info(message)
-        else:
-            print(f"✓ {message}")
+    Args:
+        path: Database path to check
+        ttl: Maximum age in seconds of a cached result
+        
+    Returns:
+        True if the path exists, False otherwise
+    """
+    now = time.monotonic()
+    cached = _db_exists_cache.get(path)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    exists = _safe_stat(path) is not None
+    _db_exists_cache[path] = (now, exists)
+    return exists
 
 
 def validate_path(path: str, must_exist: bool = False, must_be_file: bool = False) -> bool:
     """Validate file paths for security and existence
     
+    Uses a single stat call.
+    
     Args:
         path: Path to validate
         must_exist: Whether the path must already exist
@@ -87,20 +148,12 @@ def validate_path(path: str, must_exist: bool = False, must_be_file: bool = Fals
         True if path is valid, False otherwise
     """
     try:
-        resolved_path = Path(path).resolve()
-        
         # Security check: prevent directory traversal
-        if '..' in str(resolved_path) or str(resolved_path).count('..') > 0:
+        if not _is_safe_path(path):
             return False
         
-        if must_exist and not resolved_path.exists():
-            return False
-            
-        if must_be_file and resolved_path.exists() and not resolved_path.is_file():
-            return False
-            
-        return True
-    except (OSError, ValueError, PermissionError):
+        return _stat_satisfies(_safe_stat(os.path.normpath(path)), must_exist, must_be_file)
+    except (OSError, ValueError, TypeError):
         return False
 
 
@@ -111,17 +164,21 @@ def ensure_factories_registered() -> None:
         from core.factory_classes import register_default_implementations
         register_default_implementations()
     except ImportError as e:
-        SystemOutput.error(f"Failed to register factory implementations: {e}")
+        error(f"Failed to register factory implementations: {e}")
         raise
 
 
-def initialize_system(config_path: str = "config.ini") -> Tuple[ConfigurationManager, Tuple[Any, Any, Any]]:
+@contextlib.contextmanager
+def initialize_system(config_path: str = "config.ini") -> Iterator[Tuple[ConfigurationManager, Tuple[Any, Any, Any]]]:
     """Common initialization logic with proper validation
     
+    Used as a context manager; the created components are cleaned up when
+    the block exits, whether normally or through an exception.
+    
     Args:
         config_path: Path to configuration file
         
-    Returns:
+    Yields:
         Tuple of (config_manager, (data_provider, exchange_mappers, database_adapter))
         
     Raises:
@@ -135,7 +192,7 @@ def initialize_system(config_path: str = "config.ini") -> Tuple[ConfigurationMan
     
     # Initialize configuration
     try:
-        config = ConfigurationManager(config_path)
+        config = ConfigurationManager.get_instance(config_path)
     except Exception as e:
         raise ValueError(f"Failed to load configuration: {e}")
     
@@ -144,7 +201,8 @@ def initialize_system(config_path: str = "config.ini") -> Tuple[ConfigurationMan
     
     # Create components using factories
     try:
-        SystemOutput.info("Creating components from configuration...")
+        info("Creating components from configuration...")
+        from core.factory_classes import create_components_from_config
         components = create_components_from_config(config)
         if components is None or len(components) != 3:
             raise RuntimeError("Component creation returned invalid result")
@@ -154,10 +212,36 @@ def initialize_system(config_path: str = "config.ini") -> Tuple[ConfigurationMan
         if data_provider is None or database_adapter is None:
             raise RuntimeError("Failed to create required components")
             
-        return config, (data_provider, exchange_mappers, database_adapter)
-        
     except Exception as e:
         raise RuntimeError(f"Failed to create components: {e}")
+    
+    try:
+        yield config, (data_provider, exchange_mappers, database_adapter)
+    finally:
+        cleanup_resources(database_adapter, data_provider)
+
+
+# Cleanup method name resolved per resource class, so repeated cleanups of
+# the same adapter class skip the hasattr probes
+_CLEANUP_METHOD_NAMES = ('cleanup', 'close', 'disconnect')
+_CLEANUP_CACHE: "weakref.WeakKeyDictionary[type, Optional[str]]" = weakref.WeakKeyDictionary()
+
+
+def _cleanup_method_name(resource: Any) -> Optional[str]:
+    """Return the cleanup method name for a resource, resolving it once per class"""
+    resource_type = type(resource)
+    try:
+        return _CLEANUP_CACHE[resource_type]
+    except KeyError:
+        pass
+    method_name = next(
+        (name for name in _CLEANUP_METHOD_NAMES if hasattr(resource, name)), None
+    )
+    try:
+        _CLEANUP_CACHE[resource_type] = method_name
+    except TypeError:
+        pass  # Type cannot be weakly referenced; resolve again next time
+    return method_name
 
 
 def cleanup_resources(*resources) -> None:
@@ -174,175 +258,173 @@ def cleanup_resources(*resources) -> None:
             
         resource_name = f"resource_{i}"
         try:
-            # Try different cleanup method names
-            if hasattr(resource, 'cleanup'):
-                resource.cleanup()
-            elif hasattr(resource, 'close'):
-                resource.close()
-            elif hasattr(resource, 'disconnect'):
-                resource.disconnect()
+            method_name = _cleanup_method_name(resource)
+            if method_name is not None:
+                getattr(resource, method_name)()
         except Exception as e:
             cleanup_errors.append(f"{resource_name}: {e}")
     
     if cleanup_errors:
-        SystemOutput.warning(f"Cleanup errors: {'; '.join(cleanup_errors)}")
+        warning(f"Cleanup errors: {'; '.join(cleanup_errors)}")
 
 
 def main() -> int:
     """Main execution function with modular architecture"""
     
     config_path = "config.ini"
-    orchestrator = None
-    data_provider = None
-    database_adapter = None
     
     try:
-        # Check if configuration file exists
-        if not os.path.exists(config_path):
-            SystemOutput.error(f"Configuration file not found: {config_path}")
-            SystemOutput.info("Run 'python main.py create-config' to create a sample configuration")
-            return ExitCodes.CONFIG_ERROR
-        
-        # Initialize system components
-        try:
-            config, (data_provider, exchange_mappers, database_adapter) = initialize_system(config_path)
-        except FileNotFoundError as e:
-            SystemOutput.error(str(e))
-            return ExitCodes.CONFIG_ERROR
-        except (ValueError, RuntimeError) as e:
-            SystemOutput.error(str(e))
-            return ExitCodes.INITIALIZATION_ERROR
-        
-        # Print current configuration
-        config.print_config()
-        
-        # Print factory status
-        factory_status = get_factory_status()
-        SystemOutput.info("Factory Status:")
-        for component_type, status in factory_status.items():
-            SystemOutput.info(f"  {component_type}: {status['count']} available - {status['available']}")
-        
-        # Initialize orchestrator
-        orchestrator = ImportOrchestrator(config_path)
-        
-        if not orchestrator.initialize(data_provider, exchange_mappers, database_adapter):
-            SystemOutput.error("Failed to initialize orchestrator")
-            return ExitCodes.INITIALIZATION_ERROR
-        
-        # Check database creation if needed
-        database_path = config.get('DATABASE', 'database_path')
-        
-        # Validate database path
-        if not validate_path(database_path):
-            SystemOutput.error(f"Invalid database path: {database_path}")
-            return ExitCodes.DATABASE_ERROR
-        
-        create_if_not_exists = config.getboolean('DATABASE', 'create_if_not_exists')
-        
-        if not os.path.exists(database_path) and create_if_not_exists:
-            SystemOutput.info(f"Database not found, creating: {database_path}")
+        with contextlib.ExitStack() as stack:
+            # Initialize system components (this also checks the config file exists)
             try:
-                if database_adapter.create_database(database_path):
-                    SystemOutput.success("Database created successfully")
-                    # Reconnect to the new database
-                    if not database_adapter.connect(database_path):
-                        SystemOutput.error("Failed to connect to newly created database")
+                config, (data_provider, exchange_mappers, database_adapter) = stack.enter_context(
+                    initialize_system(config_path))
+            except FileNotFoundError as e:
+                error(str(e))
+                info("Run 'python main.py create-config' to create a sample configuration")
+                return ExitCodes.CONFIG_ERROR
+            except (ValueError, RuntimeError) as e:
+                error(str(e))
+                return ExitCodes.INITIALIZATION_ERROR
+            
+            # Print current configuration
+            config.print_config()
+            
+            # Print factory status
+            from core.factory_classes import get_factory_status
+            factory_status = get_factory_status()
+            info("Factory Status:")
+            for component_type, status in factory_status.items():
+                info(f"  {component_type}: {status['count']} available - {status['available']}")
+            
+            # Initialize orchestrator
+            from orchestrators.import_orchestrator import ImportOrchestrator
+            orchestrator = ImportOrchestrator(config_path)
+            stack.callback(cleanup_resources, orchestrator)
+            
+            if not orchestrator.initialize(data_provider, exchange_mappers, database_adapter):
+                error("Failed to initialize orchestrator")
+                return ExitCodes.INITIALIZATION_ERROR
+            
+            # Check database creation if needed
+            snap = config.snapshot()
+            database_path = snap.db_path
+            
+            # Validate database path
+            if not _is_safe_path(database_path):
+                error(f"Invalid database path: {database_path}")
+                return ExitCodes.DATABASE_ERROR
+            if not _db_exists(database_path) and snap.create_if_not_exists:
+                info(f"Database not found, creating: {database_path}")
+                _db_exists_cache.pop(database_path, None)  # about to change
+                try:
+                    if database_adapter.create_and_connect(database_path):
+                        success("Database created successfully")
+                    else:
+                        error("Failed to create database")
                         return ExitCodes.DATABASE_ERROR
-                else:
-                    SystemOutput.error("Failed to create database")
+                except Exception as e:
+                    error(f"Database creation failed: {e}")
                     return ExitCodes.DATABASE_ERROR
-            except Exception as e:
-                SystemOutput.error(f"Database creation failed: {e}")
-                return ExitCodes.DATABASE_ERROR
-        
-        # Run the import process
-        SystemOutput.info("Starting import process...")
-        result = orchestrator.run_import()
-        
-        # Validate import result
-        if result is None:
-            SystemOutput.error("Import process returned no result")
-            return ExitCodes.GENERAL_ERROR
-        
-        if result.errors:
-            SystemOutput.warning(f"Import completed with {len(result.errors)} errors")
-            for error in result.errors:
-                SystemOutput.error(f"  - {error}")
-            return ExitCodes.GENERAL_ERROR
-        else:
-            SystemOutput.success("Import process completed successfully")
-            return ExitCodes.SUCCESS
+            
+            # Run the import process
+            info("Starting import process...")
+            result = orchestrator.run_import()
+            
+            # Validate import result
+            if result is None:
+                error("Import process returned no result")
+                return ExitCodes.GENERAL_ERROR
+            
+            if result.errors:
+                warning(f"Import completed with {len(result.errors)} errors")
+                if logger.isEnabledFor(logging.ERROR):
+                    # Let logging do the %-formatting, only for records it emits
+                    for import_error in result.errors:
+                        logger.error("  - %s", import_error)
+                else:
+                    for import_error in result.errors:
+                        error(f"  - {import_error}")
+                return ExitCodes.GENERAL_ERROR
+            else:
+                success("Import process completed successfully")
+                return ExitCodes.SUCCESS
         
     except FileNotFoundError as e:
-        SystemOutput.error(f"File not found: {e}")
+        error(f"File not found: {e}")
         return ExitCodes.CONFIG_ERROR
     except PermissionError as e:
-        SystemOutput.error(f"Permission denied: {e}")
+        error(f"Permission denied: {e}")
         return ExitCodes.GENERAL_ERROR
     except Exception as e:
-        SystemOutput.error(f"Unexpected error during import: {e}")
+        error(f"Unexpected error during import: {e}")
         logger.exception("Full traceback:")  # Log full traceback for debugging
         return ExitCodes.GENERAL_ERROR
-    finally:
-        # Comprehensive cleanup
-        cleanup_resources(orchestrator, database_adapter, data_provider)
 
 
 def create_sample_config() -> int:
     """Create a sample configuration file"""
     try:
-        config_manager = ConfigurationManager("sample_config.ini")
+        # Lazy: the sample file is written, never read. The fixed name needs
+        # no path validation or atomic replace
+        config_manager = ConfigurationManager("sample_config.ini", lazy=True, sanitize=False)
         config_manager.create_default_config()
-        SystemOutput.success("Sample configuration created: sample_config.ini")
-        SystemOutput.info("Edit this file with your preferred settings, then rename to config.ini")
+        success("Sample configuration created: sample_config.ini")
+        info("Edit this file with your preferred settings, then rename to config.ini")
         return ExitCodes.SUCCESS
     except PermissionError as e:
-        SystemOutput.error(f"Permission denied creating config file: {e}")
+        error(f"Permission denied creating config file: {e}")
         return ExitCodes.GENERAL_ERROR
     except Exception as e:
-        SystemOutput.error(f"Failed to create sample config: {e}")
+        error(f"Failed to create sample config: {e}")
         return ExitCodes.GENERAL_ERROR
 
 
-def validate_config(config_path: str = "config.ini") -> int:
-    """Validate configuration file"""
+def validate_config(config_path: str = "config.ini", path_validated: bool = False) -> int:
+    """Validate configuration file
+    
+    Args:
+        config_path: Path to configuration file
+        path_validated: True if the caller has already run validate_path on config_path
+    """
     try:
         # Validate path first
-        if not validate_path(config_path, must_exist=True, must_be_file=True):
-            SystemOutput.error(f"Configuration file not found or invalid: {config_path}")
+        if not path_validated and not validate_path(config_path, must_exist=True, must_be_file=True):
+            error(f"Configuration file not found or invalid: {config_path}")
             return ExitCodes.CONFIG_ERROR
         
-        config_manager = ConfigurationManager(config_path)
+        config_manager = ConfigurationManager.get_instance(config_path)
         config_manager.print_config()
-        SystemOutput.success(f"Configuration file '{config_path}' is valid!")
+        success(f"Configuration file '{config_path}' is valid!")
         
         # Check database path
-        db_path = config_manager.get('DATABASE', 'database_path')
-        if validate_path(db_path, must_exist=True):
-            SystemOutput.success(f"Database exists: {db_path}")
+        snap = config_manager.snapshot()
+        if _is_safe_path(snap.db_path) and _db_exists(snap.db_path):
+            success(f"Database exists: {snap.db_path}")
         else:
-            SystemOutput.warning(f"Database not found: {db_path}")
-            if config_manager.getboolean('DATABASE', 'create_if_not_exists'):
-                SystemOutput.info("  (Will be created automatically)")
+            warning(f"Database not found: {snap.db_path}")
+            if snap.create_if_not_exists:
+                info("  (Will be created automatically)")
         
         # Check factory components
         try:
             ensure_factories_registered()
+            from core.factory_classes import get_factory_status
             factory_status = get_factory_status()
             
-            SystemOutput.info("\nAvailable Components:")
+            info("\nAvailable Components:")
             for component_type, status in factory_status.items():
-                SystemOutput.info(f"  {component_type.title()}: {', '.join(status['available'])}")
+                info(f"  {component_type.title()}: {', '.join(status['available'])}")
         except Exception as e:
-            SystemOutput.warning(f"Error checking components: {e}")
+            warning(f"Error checking components: {e}")
         
         return ExitCodes.SUCCESS
         
     except FileNotFoundError as e:
-        SystemOutput.error(f"Configuration file error: {e}")
+        error(f"Configuration file error: {e}")
         return ExitCodes.CONFIG_ERROR
     except Exception as e:
-        SystemOutput.error(f"Configuration validation failed: {e}")
+        error(f"Configuration validation failed: {e}")
         return ExitCodes.CONFIG_ERROR
 
 
@@ -351,59 +433,56 @@ def list_components() -> int:
     try:
         ensure_factories_registered()
         
+        from core.factory_classes import get_factory_status
         factory_status = get_factory_status()
         
-        SystemOutput.info("Available Components:")
-        SystemOutput.info("=" * 40)
-        
+        # Collect the listing and emit it as a single message
+        lines = ["Available Components:", "=" * 40]
         for component_type, status in factory_status.items():
-            SystemOutput.info(f"\n{component_type.title()}:")
-            for component in status['available']:
-                SystemOutput.info(f"  - {component}")
+            lines.append(f"\n{component_type.title()}:")
+            lines.extend(f"  - {component}" for component in status['available'])
+        info("\n".join(lines))
         
         return ExitCodes.SUCCESS
         
     except Exception as e:
-        SystemOutput.error(f"Error listing components: {e}")
+        error(f"Error listing components: {e}")
         return ExitCodes.GENERAL_ERROR
 
 
 def run_update_only(config_path: str = "config.ini") -> int:
     """Run update process only (no full import)"""
     
-    orchestrator = None
-    data_provider = None
-    database_adapter = None
-    
     try:
-        # Initialize system components
-        try:
-            config, (data_provider, exchange_mappers, database_adapter) = initialize_system(config_path)
-        except (FileNotFoundError, ValueError, RuntimeError) as e:
-            SystemOutput.error(str(e))
-            return ExitCodes.INITIALIZATION_ERROR
-        
-        # Initialize orchestrator
-        orchestrator = ImportOrchestrator(config_path)
-        if not orchestrator.initialize(data_provider, exchange_mappers, database_adapter):
-            SystemOutput.error("Failed to initialize orchestrator")
-            return ExitCodes.INITIALIZATION_ERROR
-        
-        # Run update only
-        SystemOutput.info("Running update process...")
-        if orchestrator.run_update():
-            SystemOutput.success("Update process completed successfully")
-            return ExitCodes.SUCCESS
-        else:
-            SystemOutput.error("Update process failed")
-            return ExitCodes.GENERAL_ERROR
+        with contextlib.ExitStack() as stack:
+            # Initialize system components
+            try:
+                config, (data_provider, exchange_mappers, database_adapter) = stack.enter_context(
+                    initialize_system(config_path))
+            except (FileNotFoundError, ValueError, RuntimeError) as e:
+                error(str(e))
+                return ExitCodes.INITIALIZATION_ERROR
+            
+            # Initialize orchestrator
+            from orchestrators.import_orchestrator import ImportOrchestrator
+            orchestrator = ImportOrchestrator(config_path)
+            stack.callback(cleanup_resources, orchestrator)
+            if not orchestrator.initialize(data_provider, exchange_mappers, database_adapter):
+                error("Failed to initialize orchestrator")
+                return ExitCodes.INITIALIZATION_ERROR
+            
+            # Run update only
+            info("Running update process...")
+            if orchestrator.run_update():
+                success("Update process completed successfully")
+                return ExitCodes.SUCCESS
+            else:
+                error("Update process failed")
+                return ExitCodes.GENERAL_ERROR
             
     except Exception as e:
-        SystemOutput.error(f"Update process failed: {e}")
+        error(f"Update process failed: {e}")
         return ExitCodes.GENERAL_ERROR
-    finally:
-        # Cleanup resources
-        cleanup_resources(orchestrator, database_adapter, data_provider)
 
 
 def show_status(config_path: str = "config.ini") -> int:
@@ -411,41 +490,45 @@ def show_status(config_path: str = "config.ini") -> int:
     try:
         # Validate configuration file first
         if not validate_path(config_path, must_exist=True, must_be_file=True):
-            SystemOutput.error(f"Configuration file not found: {config_path}")
+            error(f"Configuration file not found: {config_path}")
             return ExitCodes.CONFIG_ERROR
         
-        config = ConfigurationManager(config_path)
+        snap = ConfigurationManager.get_instance(config_path).snapshot()
         
-        SystemOutput.info("System Status:")
-        SystemOutput.info("=" * 40)
+        # Collect the report and emit it as a single message
+        lines = ["System Status:", "=" * 40]
         
         # Database status
-        db_path = config.get('DATABASE', 'database_path')
-        SystemOutput.info(f"Database: {db_path}")
-        if validate_path(db_path, must_exist=True):
-            SystemOutput.info("  Status: ✓ Exists")
+        lines.append(f"Database: {snap.db_path}")
+        if _is_safe_path(snap.db_path) and _db_exists(snap.db_path):
+            lines.append("  Status: ✓ Exists")
         else:
-            SystemOutput.info("  Status: ✗ Not found")
+            lines.append("  Status: ✗ Not found")
         
         # Configuration status
-        SystemOutput.info(f"\nConfiguration:")
-        SystemOutput.info(f"  Data Provider: {config.get('PROVIDERS', 'data_provider')}")
-        SystemOutput.info(f"  Exchanges: {', '.join(config.getlist('PROVIDERS', 'exchanges'))}")
-        SystemOutput.info(f"  Database Adapter: {config.get('PROVIDERS', 'database_adapter')}")
-        SystemOutput.info(f"  Max Coins: {config.get('IMPORT', 'max_coins')}")
-        SystemOutput.info(f"  Min Market Cap: ${config.getfloat('IMPORT', 'min_market_cap'):,.0f}")
+        lines.extend([
+            "\nConfiguration:",
+            f"  Data Provider: {snap.data_provider}",
+            f"  Exchanges: {', '.join(snap.exchanges)}",
+            f"  Database Adapter: {snap.db_adapter}",
+            f"  Max Coins: {snap.max_coins}",
+            f"  Min Market Cap: ${snap.min_market_cap:,.0f}",
+        ])
         
         # Component status
         ensure_factories_registered()
+        from core.factory_classes import get_factory_status
         factory_status = get_factory_status()
-        SystemOutput.info(f"\nAvailable Components:")
+        lines.append("\nAvailable Components:")
         for component_type, status in factory_status.items():
-            SystemOutput.info(f"  {component_type.title()}: {status['count']} registered")
+            lines.append(f"  {component_type.title()}: {status['count']} registered")
+        
+        info("\n".join(lines))
         
         return ExitCodes.SUCCESS
         
     except Exception as e:
-        SystemOutput.error(f"Error getting status: {e}")
+        error(f"Error getting status: {e}")
         return ExitCodes.GENERAL_ERROR
 
 
@@ -489,7 +572,40 @@ Exit Codes:
 
 For more information, see the documentation in CLAUDE.md
 """
-    print(help_text)
+    sys.stdout.write(help_text)
+
+
+def run_validate_config_command() -> int:
+    """Handle 'validate-config [config_file_path]'"""
+    config_file = "config.ini"
+    if len(sys.argv) > 2:
+        config_file = sys.argv[2]
+        # CVE-002 Remediation: Validate config path for security
+        if not validate_path(config_file, must_exist=True, must_be_file=True):
+            error(f"Configuration file not found or invalid: {config_file}")
+            error("CVE-002: Path validation failed - potential path traversal attempt")
+            return ExitCodes.CONFIG_ERROR
+        return validate_config(config_file, path_validated=True)
+    return validate_config(config_file)
+
+
+def run_help_command() -> int:
+    """Handle 'help'"""
+    print_help()
+    return ExitCodes.SUCCESS
+
+
+# Command dispatch table: command name -> handler returning an exit code
+COMMANDS = {
+    "create-config": create_sample_config,
+    "validate-config": run_validate_config_command,
+    "list-components": list_components,
+    "update-only": run_update_only,
+    "status": show_status,
+    "help": run_help_command,
+    "-h": run_help_command,
+    "--help": run_help_command,
+}
 
 
 if __name__ == "__main__":
@@ -497,32 +613,13 @@ if __name__ == "__main__":
     # Parse command line arguments with improved validation
     if len(sys.argv) > 1:
         command = sys.argv[1].lower()
+        handler = COMMANDS.get(command)
         
-        if command == "create-config":
-            sys.exit(create_sample_config())
-        elif command == "validate-config":
-            config_file = "config.ini"
-            if len(sys.argv) > 2:
-                config_file = sys.argv[2]
-                # CVE-002 Remediation: Validate config path for security
-                if not validate_path(config_file, must_exist=True, must_be_file=True):
-                    SystemOutput.error(f"Configuration file not found or invalid: {config_file}")
-                    SystemOutput.error("CVE-002: Path validation failed - potential path traversal attempt")
-                    sys.exit(ExitCodes.CONFIG_ERROR)
-            sys.exit(validate_config(config_file))
-        elif command == "list-components":
-            sys.exit(list_components())
-        elif command == "update-only":
-            sys.exit(run_update_only())
-        elif command == "status":
-            sys.exit(show_status())
-        elif command in ["help", "-h", "--help"]:
-            print_help()
-            sys.exit(ExitCodes.SUCCESS)
-        else:
-            SystemOutput.error(f"Unknown command: {command}")
-            SystemOutput.info("Use 'python main.py help' for available commands")
+        if handler is None:
+            error(f"Unknown command: {command}")
+            info("Use 'python main.py help' for available commands")
             sys.exit(ExitCodes.GENERAL_ERROR)
+        sys.exit(handler())
     else:
         # Normal execution - run full import
-        sys.exit(main())
\ No newline at end of file
+        sys.exit(main())
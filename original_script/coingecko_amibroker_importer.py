@@ -1,97 +1,74 @@
-import requests
-import pandas as pd
+from __future__ import annotations
+
+import atexit
 import time
-import win32com.client
+import functools
+import hashlib
 import logging
 import os
+import queue
+import re
 import configparser
 import json
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Final, Iterator, List, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlencode
+
+# requests, pandas and the AmiBroker COM client are heavy to import; they are
+# imported in the methods that use them so ConfigManager and module import
+# stay cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
+# orjson is an optional, faster drop-in for the mapping file and API
+# responses; fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _response_json(response):
+        return orjson.loads(response.content)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _response_json(response):
+        return response.json()
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class ConfigManager:
-    """Manages configuration files for the CoinGecko AmiBroker Importer"""
-    
-    def __init__(self, config_path: Optional[str] = None):
-        self.config_path = config_path or "config.ini"
-        self.config = configparser.ConfigParser()
-        self.default_config = self._get_default_config()
-        self.load_config()
-    
-    def _get_default_config(self) -> Dict:
-        """Return default configuration values"""
-        return {
-            'DATABASE': {
-                'database_path': r'C:\AmiBroker\Databases\Crypto\crypto.adb',
-                'create_if_not_exists': 'true',
-                'auto_backup': 'false',
-                'backup_path': r'C:\AmiBroker\Backups\Crypto'
-            },
-            'IMPORT': {
-                'max_coins': '500',
-                'min_market_cap': '10000000',
-                'historical_days': '365',
-                'force_full_update': 'false',
-                'rate_limit_delay': '1.5'
-            },
-            'MAPPING': {
-                'use_cached_mapping': 'true',
-                'mapping_file': 'coingecko_kraken_mapping.json',
-                'rebuild_mapping_days': '7',
-                'cache_expiry_hours': '24'
-            },
-            'FILTERING': {
-                'include_kraken_only': 'false',
-                'exclude_stablecoins': 'false',
-                'min_volume_24h': '0',
-                'excluded_symbols': '',
-                'included_symbols': ''
-            },
-            'UPDATES': {
-                'auto_update_enabled': 'true',
-                'update_frequency_hours': '6',
-                'update_days_back': '7',
-                'update_on_startup': 'true'
-            },
-            'LOGGING': {
-                'log_level': 'INFO',
-                'log_file': 'crypto_importer.log',
-                'max_log_size_mb': '10',
-                'backup_count': '5'
-            },
-            'API': {
-                'coingecko_api_key': '',
-                'requests_per_minute': '40',
-                'timeout_seconds': '30',
-                'retry_attempts': '3'
-            }
-        }
-    
-    def create_default_config(self):
-        """Create a default configuration file"""
-        logger.info(f"Creating default configuration file: {self.config_path}")
-        
-        for section, options in self.default_config.items():
-            self.config.add_section(section)
-            for key, value in options.items():
-                self.config.set(section, key, value)
-        
-        # Add comments to the config file
-        config_content = self._generate_config_with_comments()
-        
-        with open(self.config_path, 'w') as config_file:
-            config_file.write(config_content)
-        
-        logger.info(f"Default configuration created at: {self.config_path}")
-    
-    def _generate_config_with_comments(self) -> str:
-        """Generate configuration file with detailed comments"""
-        return '''# CoinGecko AmiBroker Importer Configuration
+# Background listener owning the console/file handlers (see _setup_logging)
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Flush queued log records and stop the background listener"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+# Commented template written by ConfigManager.create_default_config()
+_DEFAULT_CONFIG_TEXT: Final[str] = '''# CoinGecko AmiBroker Importer Configuration
 # ==========================================
 
 [DATABASE]
@@ -191,28 +168,195 @@ timeout_seconds = 30
 # Number of retry attempts for failed requests
 retry_attempts = 3
 '''
+
+# The default template parsed once at import; ConfigManager copies from it
+_DEFAULT_CONFIG_PARSER: Final = configparser.ConfigParser(interpolation=None)
+_DEFAULT_CONFIG_PARSER.read_string(_DEFAULT_CONFIG_TEXT, source='<defaults>')
+
+# Directory holding cached API responses (see _http_get_cached)
+HTTP_CACHE_DIR = '.cache'
+
+# Seconds a cached market_chart response is reused; only the most recent
+# day of a coin's history changes, so an hour keeps re-runs cheap
+MARKET_DATA_CACHE_TTL = 3600
+
+# Worker threads used for per-coin CoinGecko lookups; the token bucket,
+# not the pool size, bounds the request rate
+MAPPING_LOOKUP_WORKERS = 8
+
+# Worker threads prefetching market data while the main thread writes to
+# AmiBroker; again the token bucket bounds the request rate
+MARKET_DATA_WORKERS = 8
+
+# Coins checked between saves of the per-coin mapping checkpoint
+MAPPING_CHECKPOINT_INTERVAL = 200
+
+# Symbols treated as stablecoins when exclude_stablecoins is set; "usd" also
+# covers usdt, usdc, usdn, busd and tusd
+STABLECOIN_PATTERN = re.compile(r'usd|dai|fei', re.IGNORECASE)
+
+# Format of the LastUpdated extra data written on each symbol
+LAST_UPDATED_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _atomic_write_text(path: str, text: str):
+    """Write text to a temp file next to path and swap it in with os.replace()
+    
+    Readers never see a partially written file, even if the process dies
+    mid-write.
+    """
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.tmp', delete=False,
+                                         dir=os.path.dirname(os.path.abspath(path))) as f:
+            temp_path = f.name
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing a fixed number of calls per minute
+    
+    Holds at most `burst` tokens, so concurrent workers cannot fire a
+    minute's worth of requests at once on top of the steady refill.
+    """
+    
+    def __init__(self, requests_per_minute: int, burst: int = 1):
+        self.capacity = max(1, burst)
+        self.refill_rate = max(1, requests_per_minute) / 60.0  # tokens per second
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+
+class ConfigManager:
+    """Manages configuration files for the CoinGecko AmiBroker Importer"""
+    
+    def __init__(self, config_path: Optional[str] = None):
+        self.config_path = config_path or "config.ini"
+        # Values never use %-interpolation, so skip scanning them for it
+        self.config = configparser.ConfigParser(interpolation=None)
+        self._reset_value_caches()
+        self.default_config = self._get_default_config()
+        self.load_config()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_default_config(cls) -> Dict:
+        """Return default configuration values
+        
+        Built once and shared by every instance; treat it as read-only.
+        """
+        return {section: dict(_DEFAULT_CONFIG_PARSER.items(section))
+                for section in _DEFAULT_CONFIG_PARSER.sections()}
+    
+    def create_default_config(self):
+        """Create a default configuration file"""
+        logger.info("Creating default configuration file: %s", self.config_path)
+        
+        self.config.read_dict(self.default_config)
+        
+        # Add comments to the config file
+        config_content = self._generate_config_with_comments()
+        
+        with open(self.config_path, 'w') as config_file:
+            config_file.write(config_content)
+        
+        logger.info("Default configuration created at: %s", self.config_path)
+    
+    def _generate_config_with_comments(self) -> str:
+        """Generate configuration file with detailed comments"""
+        return _DEFAULT_CONFIG_TEXT
     
     def load_config(self):
         """Load configuration from file, create default if not exists"""
         if not os.path.exists(self.config_path):
-            logger.info(f"Configuration file not found: {self.config_path}")
+            logger.info("Configuration file not found: %s", self.config_path)
             self.create_default_config()
         
         try:
-            self.config.read(self.config_path)
-            logger.info(f"Configuration loaded from: {self.config_path}")
+            try:
+                config_text = Path(self.config_path).read_text(encoding='utf-8')
+            except UnicodeDecodeError as e:
+                # Older hand-edited configs may be in the locale encoding (e.g. cp1252)
+                logger.warning("Config file %s is not valid UTF-8 (%s); re-reading it with the locale encoding",
+                               self.config_path, e)
+                config_text = Path(self.config_path).read_text()
+            self.config.read_string(config_text, source=self.config_path)
+            logger.info("Configuration loaded from: %s", self.config_path)
             self._validate_config()
         except Exception as e:
-            logger.error(f"Error loading configuration: {e}")
+            logger.error("Error loading configuration: %s", e)
             logger.info("Using default configuration")
             self._load_defaults()
+        
+        self._materialize()
+    
+    def _reset_value_caches(self):
+        """Empty the per-section value caches"""
+        self._cache: Dict[str, Dict[str, str]] = {}
+        self._bool_cache: Dict[str, Dict[str, bool]] = {}
+        self._int_cache: Dict[str, Dict[str, int]] = {}
+        self._float_cache: Dict[str, Dict[str, float]] = {}
+        self._list_cache: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+    
+    def _materialize(self):
+        """Flatten the parsed configuration into dicts with values coerced once"""
+        self._reset_value_caches()
+        for section in self.config.sections():
+            for key in self.config.options(section):
+                self._cache_option(section, key)
+    
+    def _cache_option(self, section: str, key: str):
+        """Store the raw and coerced forms of a single option"""
+        try:
+            value = self.config.get(section, key)
+        except configparser.Error:
+            return
+        
+        self._cache.setdefault(section, {})[key] = value
+        
+        for typed_cache in (self._bool_cache, self._int_cache, self._float_cache):
+            typed_cache.get(section, {}).pop(key, None)
+        
+        boolean = self.config.BOOLEAN_STATES.get(value.lower())
+        if boolean is not None:
+            self._bool_cache.setdefault(section, {})[key] = boolean
+        try:
+            self._int_cache.setdefault(section, {})[key] = int(value)
+        except ValueError:
+            pass
+        try:
+            self._float_cache.setdefault(section, {})[key] = float(value)
+        except ValueError:
+            pass
+        self._list_cache.setdefault(section, {})[key] = tuple(
+            item.strip() for item in value.split(',') if item.strip()
+        )
     
     def _load_defaults(self):
         """Load default configuration values"""
-        for section, options in self.default_config.items():
-            self.config.add_section(section)
-            for key, value in options.items():
-                self.config.set(section, key, value)
+        # Merges into any sections already read, unlike add_section()
+        self.config.read_dict(self.default_config)
     
     def _validate_config(self):
         """Validate configuration values"""
@@ -220,7 +364,7 @@ retry_attempts = 3
         required_sections = ['DATABASE', 'IMPORT', 'MAPPING']
         for section in required_sections:
             if not self.config.has_section(section):
-                logger.warning(f"Missing configuration section: {section}")
+                logger.warning("Missing configuration section: %s", section)
                 self.config.add_section(section)
         
         # Add missing options with defaults
@@ -230,27 +374,44 @@ retry_attempts = 3
             
             for key, default_value in options.items():
                 if not self.config.has_option(section, key):
-                    logger.info(f"Adding missing config option: [{section}] {key}")
+                    logger.info("Adding missing config option: [%s] %s", section, key)
                     self.config.set(section, key, default_value)
     
     def get(self, section: str, key: str, fallback: str = '') -> str:
         """Get configuration value as string"""
-        return self.config.get(section, key, fallback=fallback)
+        try:
+            return self._cache[section][key]
+        except KeyError:
+            return self.config.get(section, key, fallback=fallback)
     
     def getint(self, section: str, key: str, fallback: int = 0) -> int:
         """Get configuration value as integer"""
-        return self.config.getint(section, key, fallback=fallback)
+        try:
+            return self._int_cache[section][key]
+        except KeyError:
+            return self.config.getint(section, key, fallback=fallback)
     
     def getfloat(self, section: str, key: str, fallback: float = 0.0) -> float:
         """Get configuration value as float"""
-        return self.config.getfloat(section, key, fallback=fallback)
+        try:
+            return self._float_cache[section][key]
+        except KeyError:
+            return self.config.getfloat(section, key, fallback=fallback)
     
     def getboolean(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get configuration value as boolean"""
-        return self.config.getboolean(section, key, fallback=fallback)
+        try:
+            return self._bool_cache[section][key]
+        except KeyError:
+            return self.config.getboolean(section, key, fallback=fallback)
     
     def getlist(self, section: str, key: str, delimiter: str = ',') -> List[str]:
         """Get configuration value as list"""
+        if delimiter == ',':
+            try:
+                return list(self._list_cache[section][key])
+            except KeyError:
+                pass
         value = self.get(section, key)
         if not value.strip():
             return []
@@ -261,6 +422,7 @@ retry_attempts = 3
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, key, str(value))
+        self._cache_option(section, self.config.optionxform(key))
     
     def save_config(self):
         """Save current configuration to file"""
@@ -295,6 +457,7 @@ class CoinGeckoAmiBrokerImporter:
         
         # API configuration
         self.base_url = "https://api.coingecko.com/api/v3"
+        import requests
         self.session = requests.Session()
         
         # Set API key if provided
@@ -311,10 +474,30 @@ class CoinGeckoAmiBrokerImporter:
         self.requests_per_minute = self.config.getint('API', 'requests_per_minute')
         self.timeout = self.config.getint('API', 'timeout_seconds')
         self.retry_attempts = self.config.getint('API', 'retry_attempts')
+        self.http_cache_ttl = self.config.getint('MAPPING', 'cache_expiry_hours') * 3600
+        
+        # Filter settings read once; _apply_filters runs for every coin
+        self._excluded_symbols = frozenset(s.upper() for s in self.config.getlist('FILTERING', 'excluded_symbols'))
+        self._included_symbols = frozenset(s.upper() for s in self.config.getlist('FILTERING', 'included_symbols'))
+        self._kraken_only = self.config.getboolean('FILTERING', 'include_kraken_only')
+        self._exclude_stablecoins = self.config.getboolean('FILTERING', 'exclude_stablecoins')
+        
+        # Pool connections per host for the concurrent mapping lookups and let
+        # the adapter retry transient failures, honouring Retry-After on 429s
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        retry = Retry(total=self.retry_attempts, backoff_factor=1.0,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Initialize AmiBroker COM object
         try:
+            import win32com.client
             self.ab = win32com.client.Dispatch("Broker.Application")
+            self._quote_extra_data = None  # Whether quotations support SetExtraData, probed on first write
             logger.info("AmiBroker COM connection established")
             
             # Load specific database if provided
@@ -331,9 +514,12 @@ class CoinGeckoAmiBrokerImporter:
         # Cache for Kraken data
         self.kraken_pairs = {}  # Maps Kraken symbol to asset info
         self.coingecko_kraken_map = {}  # Maps CoinGecko ID to Kraken symbol
+        self.mapping_built_at = None  # When the loaded mapping was built
+        self.kraken_altname_index = {}  # Maps upper-cased altname to pair name
+        self.kraken_wsname_index = {}  # Maps upper-cased wsname to pair name
         
         # Load Kraken data if needed
-        if not self.config.getboolean('FILTERING', 'include_kraken_only'):
+        if not self._kraken_only:
             logger.info("Kraken filtering disabled, loading Kraken data for mapping only")
         self._load_kraken_data()
     
@@ -352,15 +538,17 @@ class CoinGeckoAmiBrokerImporter:
         # Clear existing handlers
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+        _stop_log_listener()
         
         # Setup console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(numeric_level)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # Setup file handler if specified
+        file_error = None
         if log_file:
             try:
                 from logging.handlers import RotatingFileHandler
@@ -372,11 +560,23 @@ class CoinGeckoAmiBrokerImporter:
                 )
                 file_handler.setLevel(numeric_level)
                 file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
-                
-                logger.info(f"Logging to file: {log_file}")
+                handlers.append(file_handler)
             except Exception as e:
-                logger.warning(f"Could not setup file logging: {e}")
+                file_error = e
+        
+        # Logging threads only enqueue records; the listener thread does the
+        # console and file I/O (including rollovers)
+        from logging.handlers import QueueHandler, QueueListener
+        global _log_listener
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        
+        if file_error is not None:
+            logger.warning(f"Could not setup file logging: {file_error}")
+        elif log_file:
+            logger.info(f"Logging to file: {log_file}")
     
     def _should_rebuild_mapping(self) -> bool:
         """Check if mapping should be rebuilt based on configuration"""
@@ -385,13 +585,14 @@ class CoinGeckoAmiBrokerImporter:
         if not os.path.exists(mapping_file):
             return True
         
-        # Check file age
+        # Check mapping age
         rebuild_days = self.config.getint('MAPPING', 'rebuild_mapping_days')
         if rebuild_days <= 0:
             return False
         
-        file_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(mapping_file))
-        return file_age.days >= rebuild_days
+        # Prefer the build time recorded in the file; older files only have mtime
+        built_at = self.mapping_built_at or datetime.fromtimestamp(os.path.getmtime(mapping_file))
+        return (datetime.now() - built_at).days >= rebuild_days
     
     def _load_database(self):
         """Load specified AmiBroker database"""
@@ -545,13 +746,61 @@ class CoinGeckoAmiBrokerImporter:
         except Exception as e:
             logger.error(f"Error listing recent databases: {e}")
             return []
+    
+    def _http_get_cached(self, url: str, ttl_seconds: float) -> Optional[Dict]:
+        """GET a JSON resource, reusing an on-disk copy younger than ttl_seconds
+        
+        Returns:
+            The decoded JSON, or None if the request did not return HTTP 200
+        """
+        cache_path = self._http_cache_path(url)
+        data = self._read_http_cache(cache_path, ttl_seconds)
+        if data is not None:
+            return data
+        
+        response = self.session.get(url)
+        if response.status_code != 200:
+            return None
+        data = _response_json(response)
+        self._write_http_cache(cache_path, data)
+        
+        return data
+    
+    @staticmethod
+    def _http_cache_path(url: str, params: Optional[Dict] = None) -> str:
+        """Cache file for a GET request, keyed on the URL and its query parameters"""
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        return os.path.join(HTTP_CACHE_DIR, hashlib.blake2b(key.encode('utf-8')).hexdigest()[:16] + '.json')
+    
+    @staticmethod
+    def _read_http_cache(cache_path: str, ttl_seconds: float) -> Optional[Dict]:
+        """Return the cached JSON at cache_path if it is younger than ttl_seconds, else None"""
+        try:
+            if time.time() - os.path.getmtime(cache_path) < ttl_seconds:
+                with open(cache_path, 'rb') as f:
+                    return _json_loads(f.read())
+        except (OSError, ValueError):
+            pass  # Missing, unreadable or corrupt - fetch again
+        return None
+    
+    @staticmethod
+    def _write_http_cache(cache_path: str, data) -> None:
+        """Store a decoded JSON response, skipping API-level errors"""
+        # Don't keep an API-level error around for the whole TTL
+        if isinstance(data, dict) and data.get('error'):
+            return
+        try:
+            os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+            _atomic_write_text(cache_path, _json_dumps(data))
+        except OSError as e:
+            logger.warning(f"Could not cache response {cache_path}: {e}")
+    
     def _load_kraken_data(self):
         """Load Kraken assets and create mapping with CoinGecko"""
         try:
             # Get Kraken assets
-            response = self.session.get("https://api.kraken.com/0/public/Assets")
-            if response.status_code == 200:
-                data = response.json()
+            data = self._http_get_cached("https://api.kraken.com/0/public/Assets", self.http_cache_ttl)
+            if data is not None:
                 if data.get('error') == []:
                     assets = data.get('result', {})
                     for symbol, asset_info in assets.items():
@@ -567,116 +816,207 @@ class CoinGeckoAmiBrokerImporter:
             logger.error(f"Failed to load Kraken data: {e}")
     
     def _build_coingecko_kraken_mapping(self):
-        """Build mapping between CoinGecko IDs and Kraken symbols using exchange data"""
+        """Build mapping between CoinGecko IDs and Kraken symbols using exchange data
+        
+        A saved mapping that is still within rebuild_mapping_days is reused
+        instead of querying every coin again.
+        """
+        if (self.config.getboolean('MAPPING', 'use_cached_mapping')
+                and self.load_mapping_from_file()
+                and not self._should_rebuild_mapping()):
+            logger.info("Using cached Kraken mapping")
+            return
+        
+        self.coingecko_kraken_map = {}
+        self.mapping_built_at = None
+        
         try:
-            # Get exchange list from CoinGecko
-            exchanges_url = f"{self.base_url}/exchanges"
-            response = self.session.get(exchanges_url)
+            # Also get Kraken asset pairs for additional metadata
+            kraken_pairs_info = self._get_kraken_asset_pairs()
             
-            if response.status_code != 200:
-                logger.warning("Failed to get exchanges list from CoinGecko")
-                return
-                
-            exchanges = response.json()
-            kraken_exchange_id = None
+            # The Kraken tickers listing covers every pair in a handful of
+            # pages; per-coin lookups are only a fallback when it fails
+            if not self._map_from_kraken_tickers(kraken_pairs_info):
+                logger.warning("Falling back to per-coin exchange lookups (this may take a while...)")
+                self._map_from_coin_details(kraken_pairs_info)
             
-            # Find Kraken exchange ID
-            for exchange in exchanges:
-                if exchange.get('id', '').lower() == 'kraken':
-                    kraken_exchange_id = exchange['id']
-                    break
+            logger.info(f"Built CoinGecko-Kraken mapping for {len(self.coingecko_kraken_map)} coins")
             
-            if not kraken_exchange_id:
-                logger.warning("Kraken exchange not found in CoinGecko exchanges")
-                return
+            # Only persist a usable mapping so a failed build is retried next run
+            if self.coingecko_kraken_map:
+                self.save_mapping_to_file()
             
-            logger.info(f"Found Kraken exchange ID: {kraken_exchange_id}")
-            
-            # Also get Kraken asset pairs for additional metadata
-            kraken_pairs_info = self._get_kraken_asset_pairs()
+        except Exception as e:
+            logger.error(f"Failed to build CoinGecko-Kraken mapping: {e}")
+    
+    def _add_kraken_mapping(self, coin_id: str, ticker: Dict, kraken_pairs_info: dict) -> bool:
+        """Map a CoinGecko ID to the Kraken pair described by a CoinGecko ticker"""
+        # Extract Kraken symbol from ticker
+        base = ticker.get('base', '')
+        target = ticker.get('target', '')
+        
+        if not (base and target):
+            return False
+        
+        kraken_symbol = f"{base}{target}"
+        
+        # Try to find the pair name from Kraken API
+        pair_name = self._find_kraken_pair_name(base, target, kraken_pairs_info)
+        
+        self.coingecko_kraken_map[coin_id] = {
+            'kraken_symbol': kraken_symbol,
+            'base': base,
+            'target': target,
+            'ticker_url': ticker.get('trade_url', ''),
+            'pair_name': pair_name or kraken_symbol,
+            'alt_name': kraken_pairs_info.get(pair_name, {}).get('altname', '') if pair_name else ''
+        }
+        return True
+    
+    def _map_from_kraken_tickers(self, kraken_pairs_info: dict) -> bool:
+        """Map coins using CoinGecko's paginated list of Kraken tickers
+        
+        Returns:
+            True if every page was read, False if the listing is unavailable
+            (any partial map is discarded so the caller can fall back)
+        """
+        from requests.exceptions import RequestException
+        
+        tickers_url = f"{self.base_url}/exchanges/kraken/tickers"
+        page = 1
+        
+        while True:
+            try:
+                response = self.session.get(tickers_url, params={'page': page})
+                ok = response.status_code == 200
+                tickers = _response_json(response).get('tickers', []) if ok else None
+            except (RequestException, ValueError) as e:
+                logger.warning(f"Error reading Kraken tickers page {page} from CoinGecko: {e}")
+                ok = False
+            
+            if not ok:
+                logger.warning(f"Failed to get Kraken tickers page {page} from CoinGecko")
+                self.coingecko_kraken_map = {}
+                return False
             
-            # Get coins with exchange data
-            coins_url = f"{self.base_url}/coins/list"
-            params = {'include_platform': 'false'}
-            response = self.session.get(coins_url, params=params)
+            if not tickers:
+                return True
             
-            if response.status_code != 200:
-                logger.warning("Failed to get coins list from CoinGecko")
-                return
-                
-            all_coins = response.json()
+            # Keep the first Kraken pair listed for each coin
+            for ticker in tickers:
+                coin_id = ticker.get('coin_id')
+                if coin_id and coin_id not in self.coingecko_kraken_map:
+                    self._add_kraken_mapping(coin_id, ticker, kraken_pairs_info)
             
-            # Process coins in batches to get exchange data
-            batch_size = 50
-            mapped_count = 0
+            logger.info(f"Processed Kraken tickers page {page} ({len(self.coingecko_kraken_map)} coins mapped)")
+            page += 1
+            time.sleep(self.rate_limit_delay)
+    
+    def _map_from_coin_details(self, kraken_pairs_info: dict):
+        """Map coins by checking the tickers of every CoinGecko coin individually"""
+        # Get coins with exchange data
+        all_coins = self._http_get_cached(f"{self.base_url}/coins/list", self.http_cache_ttl)
+        
+        if all_coins is None:
+            logger.warning("Failed to get coins list from CoinGecko")
+            return
+        
+        # Pick up where an interrupted crawl left off
+        started_at, processed_ids = self._load_mapping_checkpoint()
+        coin_ids = [coin['id'] for coin in all_coins if coin['id'] not in processed_ids]
+        
+        # Lookups are latency bound, so overlap them across worker threads
+        # while the token bucket keeps the total within requests_per_minute
+        bucket = TokenBucket(self.requests_per_minute)
+        params = {'tickers': 'true', 'community_data': 'false', 
+                  'developer_data': 'false', 'sparkline': 'false'}
+        
+        def fetch_tickers(coin_id: str) -> List[Dict]:
+            bucket.acquire()
+            response = self.session.get(f"{self.base_url}/coins/{coin_id}", params=params)
+            response.raise_for_status()
+            return _response_json(response).get('tickers', [])
+        
+        with ThreadPoolExecutor(max_workers=MAPPING_LOOKUP_WORKERS) as executor:
+            futures = {executor.submit(fetch_tickers, coin_id): coin_id for coin_id in coin_ids}
             
-            for i in range(0, len(all_coins), batch_size):
-                batch = all_coins[i:i + batch_size]
-                batch_ids = [coin['id'] for coin in batch]
+            # Results are collected on this thread, so the map needs no lock
+            for done, future in enumerate(as_completed(futures), 1):
+                coin_id = futures[future]
+                try:
+                    # Check tickers for Kraken
+                    for ticker in future.result():
+                        market = ticker.get('market', {})
+                        if market.get('identifier', '').lower() == 'kraken':
+                            if self._add_kraken_mapping(coin_id, ticker, kraken_pairs_info):
+                                break
+                    # Failed lookups are left out so a resumed crawl retries them
+                    processed_ids.add(coin_id)
+                except Exception as e:
+                    logger.debug("Failed to get exchange data for %s: %s", coin_id, e)
                 
-                # Get detailed coin data including tickers
-                for coin_id in batch_ids:
-                    try:
-                        coin_detail_url = f"{self.base_url}/coins/{coin_id}"
-                        params = {'tickers': 'true', 'community_data': 'false', 
-                                'developer_data': 'false', 'sparkline': 'false'}
-                        
-                        detail_response = self.session.get(coin_detail_url, params=params)
-                        
-                        if detail_response.status_code == 200:
-                            coin_data = detail_response.json()
-                            
-                            # Check tickers for Kraken
-                            tickers = coin_data.get('tickers', [])
-                            for ticker in tickers:
-                                market = ticker.get('market', {})
-                                if market.get('identifier', '').lower() == 'kraken':
-                                    # Extract Kraken symbol from ticker
-                                    base = ticker.get('base', '')
-                                    target = ticker.get('target', '')
-                                    
-                                    # Map CoinGecko ID to Kraken symbol
-                                    if base and target:
-                                        kraken_symbol = f"{base}{target}"
-                                        
-                                        # Try to find the pair name from Kraken API
-                                        pair_name = self._find_kraken_pair_name(base, target, kraken_pairs_info)
-                                        
-                                        self.coingecko_kraken_map[coin_id] = {
-                                            'kraken_symbol': kraken_symbol,
-                                            'base': base,
-                                            'target': target,
-                                            'ticker_url': ticker.get('trade_url', ''),
-                                            'pair_name': pair_name or kraken_symbol,
-                                            'alt_name': kraken_pairs_info.get(pair_name, {}).get('altname', '') if pair_name else ''
-                                        }
-                                        mapped_count += 1
-                                        break
-                        
-                        # Rate limiting
-                        time.sleep(0.1)
-                        
-                    except Exception as e:
-                        logger.debug(f"Failed to get exchange data for {coin_id}: {e}")
-                        continue
+                if done % MAPPING_CHECKPOINT_INTERVAL == 0:
+                    self._flush_mapping_checkpoint(started_at, processed_ids)
                 
-                logger.info(f"Processed {min(i + batch_size, len(all_coins))}/{len(all_coins)} coins")
-                time.sleep(1)  # Rate limiting between batches
-            
-            logger.info(f"Built CoinGecko-Kraken mapping for {mapped_count} coins")
-            
-        except Exception as e:
-            logger.error(f"Failed to build CoinGecko-Kraken mapping: {e}")
+                if done % 50 == 0 or done == len(coin_ids):
+                    logger.info(f"Processed {done}/{len(coin_ids)} coins")
+        
+        # The crawl finished; the caller saves the complete mapping
+        try:
+            os.remove(self._mapping_checkpoint_path())
+        except FileNotFoundError:
+            pass
+    
+    def _mapping_checkpoint_path(self) -> str:
+        """Path of the partial mapping written during a per-coin crawl"""
+        return self.config.get('MAPPING', 'mapping_file') + '.partial'
+    
+    def _flush_mapping_checkpoint(self, started_at: datetime, processed_ids: set):
+        """Save the mapping built so far and the coins already checked"""
+        payload = {
+            'started_at': started_at.isoformat(),
+            'map': self.coingecko_kraken_map,
+            'processed': sorted(processed_ids)
+        }
+        
+        try:
+            _atomic_write_text(self._mapping_checkpoint_path(), _json_dumps(payload))
+        except OSError as e:
+            logger.warning(f"Could not save mapping checkpoint: {e}")
+    
+    def _load_mapping_checkpoint(self) -> Tuple[datetime, set]:
+        """Restore a checkpoint from a crawl started within rebuild_mapping_days
+        
+        Returns:
+            Tuple of (crawl start time, set of coin IDs already checked)
+        """
+        try:
+            with open(self._mapping_checkpoint_path(), 'rb') as f:
+                data = _json_loads(f.read())
+            
+            started_at = datetime.fromisoformat(data['started_at'])
+            rebuild_days = self.config.getint('MAPPING', 'rebuild_mapping_days')
+            if rebuild_days <= 0 or (datetime.now() - started_at).days < rebuild_days:
+                processed_ids = set(data['processed'])
+                self.coingecko_kraken_map.update(data['map'])
+                logger.info(f"Resuming Kraken mapping from checkpoint ({len(processed_ids)} coins already checked)")
+                return started_at, processed_ids
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable mapping checkpoint: {e}")
+        
+        return datetime.now(), set()
     
     def _get_kraken_asset_pairs(self):
         """Get Kraken asset pairs with their official names"""
         try:
-            response = self.session.get("https://api.kraken.com/0/public/AssetPairs")
-            if response.status_code == 200:
-                data = response.json()
+            data = self._http_get_cached("https://api.kraken.com/0/public/AssetPairs", self.http_cache_ttl)
+            if data is not None:
                 if data.get('error') == []:
                     pairs = data.get('result', {})
                     logger.info(f"Retrieved {len(pairs)} Kraken asset pairs")
+                    self._index_kraken_pairs(pairs)
                     return pairs
                 else:
                     logger.warning(f"Kraken AssetPairs API error: {data.get('error')}")
@@ -685,6 +1025,20 @@ class CoinGeckoAmiBrokerImporter:
             logger.error(f"Failed to get Kraken asset pairs: {e}")
             return {}
     
+    def _index_kraken_pairs(self, kraken_pairs: dict):
+        """Index asset pairs by altname and wsname for O(1) pair-name lookups"""
+        self.kraken_altname_index = {}
+        self.kraken_wsname_index = {}
+        
+        # First pair wins, as the linear scan it replaces did
+        for pair_name, pair_info in kraken_pairs.items():
+            altname = pair_info.get('altname', '')
+            if altname:
+                self.kraken_altname_index.setdefault(altname.upper(), pair_name)
+            wsname = pair_info.get('wsname', '')
+            if wsname:
+                self.kraken_wsname_index.setdefault(wsname.upper(), pair_name)
+    
     def _find_kraken_pair_name(self, base: str, target: str, kraken_pairs: dict) -> Optional[str]:
         """Find the official Kraken pair name for base/target currencies"""
         if not kraken_pairs:
@@ -710,30 +1064,34 @@ class CoinGeckoAmiBrokerImporter:
             if combo in kraken_pairs:
                 return combo
         
-        # Try matching by altname
-        for pair_name, pair_info in kraken_pairs.items():
-            altname = pair_info.get('altname', '')
-            if altname == f"{base}{target}" or altname == f"{base.upper()}{target.upper()}":
-                return pair_name
-        
-        return None
+        # Try matching by altname (e.g. XBTUSD), then by wsname (e.g. XBT/USD)
+        return (self.kraken_altname_index.get(f"{base}{target}".upper())
+                or self.kraken_wsname_index.get(f"{base}/{target}".upper()))
     
     def get_all_coins(self) -> List[Dict]:
-        """Get list of all coins from CoinGecko"""
+        """Get list of all coins from CoinGecko
+        
+        The multi-megabyte list is cached on disk for cache_expiry_hours,
+        so repeated runs do not download it again.
+        """
         try:
-            url = f"{self.base_url}/coins/list"
-            response = self.session.get(url)
-            response.raise_for_status()
+            coins = self._http_get_cached(f"{self.base_url}/coins/list", self.http_cache_ttl)
+            if coins is None:
+                raise RuntimeError("CoinGecko /coins/list request failed")
             
-            coins = response.json()
             logger.info(f"Retrieved {len(coins)} coins from CoinGecko")
             return coins
         except Exception as e:
             logger.error(f"Failed to get coins list: {e}")
             return []
     
-    def get_coin_market_data(self, coin_id: str, days: Optional[int] = None) -> Optional[Dict]:
-        """Get historical market data for a specific coin"""
+    def get_coin_market_data(self, coin_id: str, days: Optional[int] = None,
+                             rate_limiter: Optional[TokenBucket] = None) -> Optional[Dict]:
+        """Get historical market data for a specific coin
+        
+        Responses are cached on disk for MARKET_DATA_CACHE_TTL seconds; the
+        optional rate_limiter is only consulted when the API is actually called.
+        """
         if days is None:
             days = self.config.getint('IMPORT', 'historical_days')
         
@@ -745,59 +1103,77 @@ class CoinGeckoAmiBrokerImporter:
                 'interval': 'daily'
             }
             
-            for attempt in range(self.retry_attempts):
-                try:
-                    response = self.session.get(url, params=params, timeout=self.timeout)
-                    response.raise_for_status()
-                    
-                    data = response.json()
-                    return data
-                except requests.exceptions.RequestException as e:
-                    if attempt < self.retry_attempts - 1:
-                        logger.warning(f"Request failed for {coin_id}, attempt {attempt + 1}: {e}")
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        raise
+            cache_path = self._http_cache_path(url, params)
+            data = self._read_http_cache(cache_path, MARKET_DATA_CACHE_TTL)
+            if data is not None:
+                return data
+            
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            
+            # Retries and backoff are handled by the session's HTTPAdapter
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            
+            data = _response_json(response)
+            self._write_http_cache(cache_path, data)
+            return data
         except Exception as e:
             logger.error(f"Failed to get market data for {coin_id}: {e}")
             return None
     
+    def _prefetch_market_data(self, coin_ids: List[str], days: Optional[int] = None) -> Iterator[Optional[Dict]]:
+        """Fetch market data for several coins concurrently
+        
+        Requests run on worker threads within requests_per_minute, while
+        results are yielded in coin_ids order to the caller's thread, which
+        keeps all AmiBroker COM calls on the thread that created the object.
+        """
+        bucket = TokenBucket(self.requests_per_minute)
+        
+        executor = ThreadPoolExecutor(max_workers=MARKET_DATA_WORKERS)
+        futures = [executor.submit(self.get_coin_market_data, coin_id, days, bucket) for coin_id in coin_ids]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Drop outstanding requests if the caller stops early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
     def _apply_filters(self, coin: Dict) -> bool:
         """Apply configured filters to determine if coin should be imported"""
         coin_id = coin['id']
         symbol = coin['symbol'].upper()
         
         # Check excluded symbols
-        excluded_symbols = self.config.getlist('FILTERING', 'excluded_symbols')
-        if symbol in excluded_symbols:
-            logger.debug(f"Excluded symbol: {symbol}")
+        if symbol in self._excluded_symbols:
+            logger.debug("Excluded symbol: %s", symbol)
             return False
         
         # Check included symbols (if specified, only import these)
-        included_symbols = self.config.getlist('FILTERING', 'included_symbols')
-        if included_symbols and symbol not in included_symbols:
-            logger.debug(f"Not in included symbols: {symbol}")
+        if self._included_symbols and symbol not in self._included_symbols:
+            logger.debug("Not in included symbols: %s", symbol)
             return False
         
         # Check if Kraken-only mode is enabled
-        if self.config.getboolean('FILTERING', 'include_kraken_only'):
-            is_kraken, _, _ = self.is_kraken_tradeable(coin_id, symbol)
-            if not is_kraken:
-                logger.debug(f"Not on Kraken: {symbol}")
-                return False
+        if self._kraken_only and coin_id not in self.coingecko_kraken_map:
+            logger.debug("Not on Kraken: %s", symbol)
+            return False
         
         # Check stablecoin exclusion
-        if self.config.getboolean('FILTERING', 'exclude_stablecoins'):
-            stablecoin_indicators = ['usd', 'usdt', 'usdc', 'dai', 'busd', 'tusd', 'usdn', 'fei']
-            if any(indicator in symbol.lower() for indicator in stablecoin_indicators):
-                logger.debug(f"Excluded stablecoin: {symbol}")
-                return False
+        if self._exclude_stablecoins and STABLECOIN_PATTERN.search(symbol):
+            logger.debug("Excluded stablecoin: %s", symbol)
+            return False
         
         return True
     
     def format_market_data(self, coin_data: Dict, coin_info: Dict) -> Optional[pd.DataFrame]:
         """Format CoinGecko data into AmiBroker-compatible format"""
+        import numpy as np
+        import pandas as pd
+        
         try:
             prices = coin_data.get('prices', [])
             market_caps = coin_data.get('market_caps', [])
@@ -806,29 +1182,35 @@ class CoinGeckoAmiBrokerImporter:
             if not prices:
                 return None
             
-            # Create DataFrame
-            df_data = []
-            for i, price_point in enumerate(prices):
-                timestamp = price_point[0]
-                price = price_point[1]
-                
-                # Get corresponding market cap and volume
-                market_cap = market_caps[i][1] if i < len(market_caps) else 0
-                volume = volumes[i][1] if i < len(volumes) else 0
-                
-                df_data.append({
-                    'Date': pd.to_datetime(timestamp, unit='ms'),
-                    'Open': price,  # CoinGecko returns single daily price
-                    'High': price,
-                    'Low': price,
-                    'Close': price,
-                    'Volume': volume,
-                    'MarketCap': market_cap
-                })
-            
-            df = pd.DataFrame(df_data)
-            df.set_index('Date', inplace=True)
-            df.sort_index(inplace=True)
+            # Build the columns as arrays in one pass; CoinGecko returns a
+            # single daily price, so it fills every OHLC column
+            price_array = np.asarray(prices, dtype=np.float64)
+            timestamps = pd.to_datetime(price_array[:, 0], unit='ms')
+            price = price_array[:, 1]
+            
+            # Market caps and volumes can be shorter than prices; pad with 0
+            market_cap = np.zeros(len(price))
+            if market_caps:
+                values = np.asarray(market_caps, dtype=np.float64)[:len(price), 1]
+                market_cap[:len(values)] = values
+            
+            volume = np.zeros(len(price))
+            if volumes:
+                values = np.asarray(volumes, dtype=np.float64)[:len(price), 1]
+                volume[:len(values)] = values
+            
+            df = pd.DataFrame({
+                'Open': price,
+                'High': price,
+                'Low': price,
+                'Close': price,
+                'Volume': volume,
+                'MarketCap': market_cap
+            }, index=pd.DatetimeIndex(timestamps, name='Date'))
+            
+            # CoinGecko returns points in order; only sort if it ever does not
+            if not df.index.is_monotonic_increasing:
+                df.sort_index(inplace=True)
             
             return df
         except Exception as e:
@@ -842,20 +1224,18 @@ class CoinGeckoAmiBrokerImporter:
             tuple: (is_tradeable, kraken_symbol, kraken_pair_name)
         """
         # First check our reliable mapping
-        if coin_id in self.coingecko_kraken_map:
-            kraken_info = self.coingecko_kraken_map[coin_id]
+        kraken_info = self.coingecko_kraken_map.get(coin_id)
+        if kraken_info:
             kraken_symbol = kraken_info['kraken_symbol']
             pair_name = kraken_info['pair_name']
-            logger.debug(f"Found {coin_id} on Kraken as {kraken_symbol} (pair: {pair_name})")
+            logger.debug("Found %s on Kraken as %s (pair: %s)", coin_id, kraken_symbol, pair_name)
             return True, kraken_symbol, pair_name
         
         return False, None, None
     
     def get_kraken_info(self, coin_id: str) -> Optional[dict]:
         """Get full Kraken information for a CoinGecko coin ID"""
-        if coin_id in self.coingecko_kraken_map:
-            return self.coingecko_kraken_map[coin_id]
-        return None
+        return self.coingecko_kraken_map.get(coin_id)
     
     def get_existing_data_range(self, ticker_symbol: str) -> tuple[Optional[datetime], Optional[datetime]]:
         """Get the date range of existing data for a symbol"""
@@ -876,12 +1256,14 @@ class CoinGeckoAmiBrokerImporter:
             return first_date, last_date
             
         except Exception as e:
-            logger.debug(f"Could not get existing data range for {ticker_symbol}: {e}")
+            logger.debug("Could not get existing data range for %s: %s", ticker_symbol, e)
             return None, None
     
     def filter_new_data(self, df: pd.DataFrame, existing_start: Optional[datetime], 
                        existing_end: Optional[datetime]) -> pd.DataFrame:
         """Filter DataFrame to only include new data that doesn't overlap with existing data"""
+        import pandas as pd
+        
         if existing_start is None or existing_end is None:
             return df
         
@@ -889,56 +1271,142 @@ class CoinGeckoAmiBrokerImporter:
         if not isinstance(df.index, pd.DatetimeIndex):
             df.index = pd.to_datetime(df.index)
         
-        # Filter out data that already exists
-        # Keep data that's before existing start or after existing end
-        new_data = df[(df.index < existing_start) | (df.index > existing_end)]
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         
-        return new_data
+        # Filter out data that already exists
+        # Keep data that's before existing start or after existing end; on a
+        # sorted index the existing range is one contiguous block of rows
+        start_pos = df.index.searchsorted(existing_start, side='left')
+        end_pos = max(start_pos, df.index.searchsorted(existing_end, side='right'))
+        
+        if start_pos == 0:
+            return df.iloc[end_pos:]  # Common case: only newer data
+        return pd.concat([df.iloc[:start_pos], df.iloc[end_pos:]])
     
     def update_existing_quotations(self, stock, df: pd.DataFrame, existing_start: datetime, 
                                  existing_end: datetime) -> int:
         """Update existing quotations that might have changed"""
-        updated_count = 0
+        import numpy as np
+        
         quotations = stock.Quotations
         
         # Update data within existing range (in case of corrections)
         overlap_data = df[(df.index >= existing_start) & (df.index <= existing_end)]
+        if overlap_data.empty:
+            return 0
+        
+        if not overlap_data.index.is_monotonic_increasing:
+            overlap_data = overlap_data.sort_index()
+        
+        # Read the overlapping tail of the quotations once, in date order.
+        # Quotations are kept sorted, so walk back from the newest one and
+        # stop before the first overlapping day
+        first_day = overlap_data.index[0].date()
+        tail_days = []
+        tail_quotes = []
+        for i in range(quotations.Count - 1, -1, -1):
+            quote = quotations(i)
+            quote_date = quote.Date
+            day = datetime(quote_date.year, quote_date.month, quote_date.day).date()
+            if day < first_day:
+                break
+            tail_days.append(day)
+            tail_quotes.append(quote)
+        tail_days.reverse()
+        tail_quotes.reverse()
+        
+        # Both sides are sorted by day, so match them with a single merge
+        # (searchsorted) rather than hashing every date. 'left' lands on the
+        # first quote of a day, matching AmiBroker's own lookup order
+        stored_days = np.array(tail_days, dtype='datetime64[D]')
+        new_days = overlap_data.index.values.astype('datetime64[D]')
+        positions = np.searchsorted(stored_days, new_days, side='left')
+        found = positions < len(stored_days)
+        found[found] = stored_days[positions[found]] == new_days[found]
+        if not found.any():
+            return 0
+        matched_quotes = [tail_quotes[pos] if hit else None
+                          for pos, hit in zip(positions.tolist(), found.tolist())]
+        
+        # Corrections are rare: compare all rows at once and only touch the
+        # quotations whose values have changed
+        stored_closes = np.array([np.nan if q is None else q.Close for q in matched_quotes], dtype=np.float64)
+        stored_volumes = np.array([np.nan if q is None else q.Volume for q in matched_quotes], dtype=np.float64)
+        opens, highs, lows, closes, volumes, market_caps = (
+            overlap_data[column].to_numpy(dtype=np.float64)
+            for column in ('Open', 'High', 'Low', 'Close', 'Volume', 'MarketCap')
+        )
+        changed = (np.abs(stored_closes - closes) > 0.0001) | (np.abs(stored_volumes - volumes) > 0.1)
+        
+        for i in np.flatnonzero(changed).tolist():
+            existing_quote = matched_quotes[i]
+            existing_quote.Open = float(opens[i])
+            existing_quote.High = float(highs[i])
+            existing_quote.Low = float(lows[i])
+            existing_quote.Close = float(closes[i])
+            existing_quote.Volume = float(volumes[i])
+            
+            if self._quote_extra_data is None:
+                self._quote_extra_data = hasattr(existing_quote, 'SetExtraData')
+            if self._quote_extra_data:
+                existing_quote.SetExtraData('MarketCap', float(market_caps[i]))
+        
+        return int(changed.sum())
+    
+    def _add_quotations(self, quotations, df: pd.DataFrame) -> int:
+        """Append every row of an OHLCV DataFrame to an AmiBroker Quotations collection
         
-        for date, row in overlap_data.iterrows():
-            dt = date.to_pydatetime()
-            
-            # Find existing quotation for this date
-            existing_quote = None
-            for i in range(quotations.Count):
-                quote = quotations(i)
-                quote_date = datetime(quote.Date.year, quote.Date.month, quote.Date.day)
-                if quote_date == dt.date():
-                    existing_quote = quote
-                    break
-            
-            if existing_quote:
-                # Update existing quotation if values have changed
-                if (abs(existing_quote.Close - float(row['Close'])) > 0.0001 or
-                    abs(existing_quote.Volume - float(row['Volume'])) > 0.1):
-                    existing_quote.Open = float(row['Open'])
-                    existing_quote.High = float(row['High'])
-                    existing_quote.Low = float(row['Low'])
-                    existing_quote.Close = float(row['Close'])
-                    existing_quote.Volume = float(row['Volume'])
-                    
-                    try:
-                        existing_quote.SetExtraData('MarketCap', float(row['MarketCap']))
-                    except AttributeError:
-                        pass
-                    
-                    updated_count += 1
-        
-        return updated_count
+        Returns:
+            Number of quotations added
+        """
+        import numpy as np
+        
+        if df.empty:
+            return 0
+        
+        # Pull each column out once as plain floats instead of building a
+        # Series per row with iterrows()
+        dates = df.index.to_pydatetime()
+        opens, highs, lows, closes, volumes, market_caps = (
+            df[column].to_numpy(dtype=np.float64).tolist()
+            for column in ('Open', 'High', 'Low', 'Close', 'Volume', 'MarketCap')
+        )
+        
+        # Resolve the dispatch method once; attribute lookups on a dynamic
+        # COM object go through Python-level __getattr__ every time
+        add_quote = quotations.Add
+        
+        for dt, open_, high, low, close, volume, market_cap in zip(
+                dates, opens, highs, lows, closes, volumes, market_caps):
+            quote = add_quote(dt)
+            quote.Open = open_
+            quote.High = high
+            quote.Low = low
+            quote.Close = close
+            quote.Volume = volume
+            
+            # SetExtraData support depends on the AmiBroker build, not the
+            # row, so probe it once instead of catching AttributeError per row
+            if self._quote_extra_data is None:
+                self._quote_extra_data = hasattr(quote, 'SetExtraData')
+            if self._quote_extra_data:
+                quote.SetExtraData('MarketCap', market_cap)
+        
+        return len(dates)
     
     def import_to_amibroker(self, df: pd.DataFrame, symbol: str, name: str, coin_id: str, 
                            is_kraken: bool, kraken_info: Optional[dict] = None, 
-                           force_full_update: bool = False):
-        """Import or update data in AmiBroker"""
+                           force_full_update: bool = False, last_updated: Optional[str] = None,
+                           save: bool = True):
+        """Import or update data in AmiBroker
+        
+        Pass save=False when importing many symbols and call save_database()
+        once afterwards instead of saving the stock on every call.
+        """
+        if last_updated is None:
+            last_updated = datetime.now().strftime(LAST_UPDATED_FORMAT)
+        
         try:
             # Determine the ticker symbol and display name
             if is_kraken and kraken_info:
@@ -970,7 +1438,7 @@ class CoinGeckoAmiBrokerImporter:
                 stock.SetExtraData('OriginalSymbol', symbol)
                 stock.SetExtraData('OriginalName', name)
                 stock.SetExtraData('Kraken', 1 if is_kraken else 0)
-                stock.SetExtraData('LastUpdated', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+                stock.SetExtraData('LastUpdated', last_updated)
                 
                 if is_kraken and kraken_info:
                     stock.SetExtraData('KrakenSymbol', kraken_symbol)
@@ -995,21 +1463,7 @@ class CoinGeckoAmiBrokerImporter:
                     # Clear existing data
                     quotations.Clear()
                 
-                for date, row in df.iterrows():
-                    dt = date.to_pydatetime()
-                    quote = quotations.Add(dt)
-                    quote.Open = float(row['Open'])
-                    quote.High = float(row['High'])
-                    quote.Low = float(row['Low'])
-                    quote.Close = float(row['Close'])
-                    quote.Volume = float(row['Volume'])
-                    
-                    try:
-                        quote.SetExtraData('MarketCap', float(row['MarketCap']))
-                    except AttributeError:
-                        pass
-                
-                new_records = len(df)
+                new_records = self._add_quotations(quotations, df)
                 
             else:
                 # Update existing symbol with new data only
@@ -1021,24 +1475,10 @@ class CoinGeckoAmiBrokerImporter:
                 # Add only new data
                 new_data = self.filter_new_data(df, existing_start, existing_end)
                 
-                for date, row in new_data.iterrows():
-                    dt = date.to_pydatetime()
-                    quote = quotations.Add(dt)
-                    quote.Open = float(row['Open'])
-                    quote.High = float(row['High'])
-                    quote.Low = float(row['Low'])
-                    quote.Close = float(row['Close'])
-                    quote.Volume = float(row['Volume'])
-                    
-                    try:
-                        quote.SetExtraData('MarketCap', float(row['MarketCap']))
-                    except AttributeError:
-                        pass
-                
-                new_records = len(new_data)
+                new_records = self._add_quotations(quotations, new_data)
             
-            # Save the stock
-            stock.Save()
+            if save:
+                stock.Save()
             
             # Enhanced logging
             status_parts = []
@@ -1068,9 +1508,13 @@ class CoinGeckoAmiBrokerImporter:
         if filename is None:
             filename = self.config.get('MAPPING', 'mapping_file')
         
+        built_at = datetime.now()
+        payload = {'built_at': built_at.isoformat(), 'map': self.coingecko_kraken_map}
+        
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.coingecko_kraken_map, f, indent=2)
+            # Compact JSON: smaller on disk and faster to parse back than indented
+            _atomic_write_text(filename, _json_dumps(payload))
+            self.mapping_built_at = built_at
             logger.info(f"Saved mapping to {filename}")
         except Exception as e:
             logger.error(f"Failed to save mapping: {e}")
@@ -1081,8 +1525,16 @@ class CoinGeckoAmiBrokerImporter:
             filename = self.config.get('MAPPING', 'mapping_file')
         
         try:
-            with open(filename, 'r') as f:
-                self.coingecko_kraken_map = json.load(f)
+            with open(filename, 'rb') as f:
+                data = _json_loads(f.read())
+            
+            # Files written before built_at was recorded hold the bare mapping
+            if 'map' in data and 'built_at' in data:
+                self.coingecko_kraken_map = data['map']
+                self.mapping_built_at = datetime.fromisoformat(data['built_at'])
+            else:
+                self.coingecko_kraken_map = data
+                self.mapping_built_at = None
             logger.info(f"Loaded mapping from {filename} ({len(self.coingecko_kraken_map)} entries)")
             return True
         except FileNotFoundError:
@@ -1109,6 +1561,14 @@ class CoinGeckoAmiBrokerImporter:
         except Exception as e:
             logger.error(f"Failed to create AmiBroker groups: {e}")
     
+    def save_database(self):
+        """Write all pending symbol changes to the AmiBroker database in one go"""
+        try:
+            self.ab.SaveDatabase()
+            logger.info("AmiBroker database saved")
+        except Exception as e:
+            logger.error(f"Failed to save AmiBroker database: {e}")
+    
     def print_kraken_mapping_stats(self):
         """Print statistics about the Kraken mapping"""
         total_mapped = len(self.coingecko_kraken_map)
@@ -1157,17 +1617,15 @@ class CoinGeckoAmiBrokerImporter:
         if force_full_update is None:
             force_full_update = self.config.getboolean('IMPORT', 'force_full_update')
         
-        # Determine if we should use cached mapping
-        use_cached_mapping = self.config.getboolean('MAPPING', 'use_cached_mapping')
+        # Read once rather than re-parsing the option for every coin
+        min_volume = self.config.getfloat('FILTERING', 'min_volume_24h')
+        last_updated = datetime.now().strftime(LAST_UPDATED_FORMAT)
         
-        # Load or build mapping
-        if use_cached_mapping and not self._should_rebuild_mapping() and self.load_mapping_from_file():
-            logger.info("Using cached Kraken mapping")
-        else:
+        # The mapping is loaded or built (and saved) during initialization;
+        # only retry here if that produced nothing
+        if not self.coingecko_kraken_map:
             logger.info("Building new Kraken mapping (this may take a while...)")
             self._build_coingecko_kraken_mapping()
-            # Save mapping for future use
-            self.save_mapping_to_file()
         
         # Print mapping statistics
         self.print_kraken_mapping_stats()
@@ -1197,68 +1655,72 @@ class CoinGeckoAmiBrokerImporter:
         updated_records_total = 0
         skipped_count = 0
         
-        for i, coin in enumerate(filtered_coins):
-            coin_id = coin['id']
-            symbol = coin['symbol'].upper()
-            name = coin['name']
-            
-            logger.info(f"Processing {i+1}/{len(filtered_coins)}: {symbol} ({name})")
-            
-            try:
-                # Get market data
-                market_data = self.get_coin_market_data(coin_id)
-                if not market_data:
-                    failed_count += 1
-                    continue
-                
-                # Format data
-                df = self.format_market_data(market_data, coin)
-                if df is None or df.empty:
-                    logger.warning(f"No data available for {symbol}")
-                    failed_count += 1
-                    continue
-                
-                # Filter by market cap if specified
-                if min_market_cap > 0:
-                    latest_market_cap = df['MarketCap'].iloc[-1]
-                    if latest_market_cap < min_market_cap:
-                        logger.info(f"Skipping {symbol} - market cap too low: ${latest_market_cap:,.0f}")
-                        skipped_count += 1
+        # Market data is fetched ahead on worker threads while each coin is
+        # formatted and written to AmiBroker here
+        market_data_results = self._prefetch_market_data([coin['id'] for coin in filtered_coins])
+        
+        # Symbols are saved with one database write at the end (even if the
+        # loop is interrupted) instead of a Save() per coin
+        try:
+            for i, (coin, market_data) in enumerate(zip(filtered_coins, market_data_results)):
+                coin_id = coin['id']
+                symbol = coin['symbol'].upper()
+                name = coin['name']
+
+                logger.info(f"Processing {i+1}/{len(filtered_coins)}: {symbol} ({name})")
+
+                try:
+                    if not market_data:
+                        failed_count += 1
                         continue
-                
-                # Filter by volume if specified
-                min_volume = self.config.getfloat('FILTERING', 'min_volume_24h')
-                if min_volume > 0:
-                    latest_volume = df['Volume'].iloc[-1]
-                    if latest_volume < min_volume:
-                        logger.info(f"Skipping {symbol} - volume too low: ${latest_volume:,.0f}")
-                        skipped_count += 1
+
+                    # Format data
+                    df = self.format_market_data(market_data, coin)
+                    if df is None or df.empty:
+                        logger.warning(f"No data available for {symbol}")
+                        failed_count += 1
                         continue
-                
-                # Check if tradeable on Kraken
-                is_kraken, kraken_symbol, kraken_pair_name = self.is_kraken_tradeable(coin_id, symbol)
-                kraken_info = self.get_kraken_info(coin_id) if is_kraken else None
-                
-                if is_kraken:
-                    kraken_count += 1
-                
-                # Import/update to AmiBroker
-                new_records, updated_records = self.import_to_amibroker(
-                    df, symbol, name, coin_id, is_kraken, kraken_info, force_full_update
-                )
-                
-                new_records_total += new_records
-                updated_records_total += updated_records
-                imported_count += 1
-                
-                # Rate limiting
-                time.sleep(self.rate_limit_delay)
-                
-            except Exception as e:
-                logger.error(f"Failed to process {symbol}: {e}")
-                failed_count += 1
-                continue
-        
+
+                    # Filter by market cap if specified
+                    if min_market_cap > 0:
+                        latest_market_cap = df['MarketCap'].iloc[-1]
+                        if latest_market_cap < min_market_cap:
+                            logger.info(f"Skipping {symbol} - market cap too low: ${latest_market_cap:,.0f}")
+                            skipped_count += 1
+                            continue
+
+                    # Filter by volume if specified
+                    if min_volume > 0:
+                        latest_volume = df['Volume'].iloc[-1]
+                        if latest_volume < min_volume:
+                            logger.info(f"Skipping {symbol} - volume too low: ${latest_volume:,.0f}")
+                            skipped_count += 1
+                            continue
+
+                    # Check if tradeable on Kraken
+                    is_kraken, kraken_symbol, kraken_pair_name = self.is_kraken_tradeable(coin_id, symbol)
+                    kraken_info = self.get_kraken_info(coin_id) if is_kraken else None
+
+                    if is_kraken:
+                        kraken_count += 1
+
+                    # Import/update to AmiBroker
+                    new_records, updated_records = self.import_to_amibroker(
+                        df, symbol, name, coin_id, is_kraken, kraken_info, force_full_update, last_updated,
+                        save=False
+                    )
+
+                    new_records_total += new_records
+                    updated_records_total += updated_records
+                    imported_count += 1
+
+                except Exception as e:
+                    logger.error(f"Failed to process {symbol}: {e}")
+                    failed_count += 1
+                    continue
+        finally:
+            self.save_database()
+
         logger.info(f"Import completed:")
         logger.info(f"  Total processed: {imported_count}")
         logger.info(f"  New records added: {new_records_total}")
@@ -1331,7 +1793,7 @@ class CoinGeckoAmiBrokerImporter:
                 
                 # Import/update to AmiBroker
                 new_records, updated_records = self.import_to_amibroker(
-                    df, symbol, name, coin_id, is_kraken, kraken_info, force_full_update
+                    df, symbol, name, coin_id, is_kraken, kraken_info, force_full_update, last_updated
                 )
                 
                 new_records_total += new_records
@@ -1363,109 +1825,110 @@ class CoinGeckoAmiBrokerImporter:
             stocks = self.ab.Stocks
             updated_count = 0
             failed_count = 0
+            last_updated = datetime.now().strftime(LAST_UPDATED_FORMAT)
             
             # If specific symbols provided, filter to those
             if symbols:
-                symbol_set = set(symbols)
+                # Look each symbol up by ticker rather than walking the whole
+                # Stocks collection; tickers without quotations are skipped
                 stocks_to_update = []
-                for i in range(stocks.Count):
-                    stock = stocks(i)
-                    if stock.Ticker in symbol_set:
-                        stocks_to_update.append(stock)
+                for ticker in dict.fromkeys(symbols):
+                    try:
+                        stock = stocks(ticker)
+                        if stock is not None and stock.Quotations.Count > 0:
+                            stocks_to_update.append(stock)
+                            continue
+                    except Exception as e:
+                        logger.debug("Could not look up %s: %s", ticker, e)
+                    logger.warning(f"Symbol {ticker} not found in database, skipping")
             else:
                 stocks_to_update = [stocks(i) for i in range(stocks.Count)]
             
             logger.info(f"Updating {len(stocks_to_update)} symbols")
             
-            for i, stock in enumerate(stocks_to_update):
+            # Resolve CoinGecko IDs up front (COM calls stay on this thread)
+            # so the market data requests can be issued concurrently
+            update_targets = []
+            for stock in stocks_to_update:
                 ticker = stock.Ticker
                 
                 if not ticker:
                     continue
                 
-                logger.info(f"Updating {i+1}/{len(stocks_to_update)}: {ticker}")
-                
+                # Get CoinGecko ID from metadata
+                coin_id = None
                 try:
-                    # Get CoinGecko ID from metadata
-                    coin_id = None
+                    coin_id = stock.GetExtraData('CoinGeckoID')
+                except:
+                    # Fallback to using ticker as coin_id (simplified approach)
+                    coin_id = ticker.lower()
+                
+                if not coin_id:
+                    logger.warning(f"No CoinGecko ID found for {ticker}, skipping")
+                    continue
+                
+                update_targets.append((stock, ticker, coin_id))
+            
+            market_data_results = self._prefetch_market_data(
+                [coin_id for _, _, coin_id in update_targets], days_back
+            )
+            
+            # Save once at the end, keeping partial progress on failure
+            try:
+                for i, ((stock, ticker, coin_id), market_data) in enumerate(zip(update_targets, market_data_results)):
+                    logger.info(f"Updating {i+1}/{len(update_targets)}: {ticker}")
+
                     try:
-                        coin_id = stock.GetExtraData('CoinGeckoID')
-                    except:
-                        # Fallback to using ticker as coin_id (simplified approach)
-                        coin_id = ticker.lower()
-                    
-                    if not coin_id:
-                        logger.warning(f"No CoinGecko ID found for {ticker}, skipping")
-                        continue
-                    
-                    # Get recent market data
-                    market_data = self.get_coin_market_data(coin_id, days_back)
-                    if not market_data:
-                        failed_count += 1
-                        continue
-                    
-                    # Format data
-                    df = self.format_market_data(market_data, {'id': coin_id, 'symbol': ticker, 'name': stock.FullName})
-                    if df is None or df.empty:
-                        logger.warning(f"No recent data available for {ticker}")
-                        failed_count += 1
-                        continue
-                    
-                    # Get existing data range
-                    existing_start, existing_end = self.get_existing_data_range(ticker)
-                    
-                    if existing_start is None:
-                        logger.warning(f"No existing data found for {ticker}, skipping update")
-                        continue
-                    
-                    # Update quotations
-                    quotations = stock.Quotations
-                    new_records = 0
-                    updated_records = 0
-                    
-                    # Update overlapping data
-                    updated_records = self.update_existing_quotations(stock, df, existing_start, existing_end)
-                    
-                    # Add new data
-                    new_data = self.filter_new_data(df, existing_start, existing_end)
-                    
-                    for date, row in new_data.iterrows():
-                        dt = date.to_pydatetime()
-                        quote = quotations.Add(dt)
-                        quote.Open = float(row['Open'])
-                        quote.High = float(row['High'])
-                        quote.Low = float(row['Low'])
-                        quote.Close = float(row['Close'])
-                        quote.Volume = float(row['Volume'])
-                        
+                        if not market_data:
+                            failed_count += 1
+                            continue
+
+                        # Format data
+                        df = self.format_market_data(market_data, {'id': coin_id, 'symbol': ticker, 'name': stock.FullName})
+                        if df is None or df.empty:
+                            logger.warning(f"No recent data available for {ticker}")
+                            failed_count += 1
+                            continue
+
+                        # Get existing data range
+                        existing_start, existing_end = self.get_existing_data_range(ticker)
+
+                        if existing_start is None:
+                            logger.warning(f"No existing data found for {ticker}, skipping update")
+                            continue
+
+                        # Update quotations
+                        quotations = stock.Quotations
+                        new_records = 0
+                        updated_records = 0
+
+                        # Update overlapping data
+                        updated_records = self.update_existing_quotations(stock, df, existing_start, existing_end)
+
+                        # Add new data
+                        new_data = self.filter_new_data(df, existing_start, existing_end)
+
+                        new_records = self._add_quotations(quotations, new_data)
+
+                        # Update last updated timestamp
                         try:
-                            quote.SetExtraData('MarketCap', float(row['MarketCap']))
+                            stock.SetExtraData('LastUpdated', last_updated)
                         except AttributeError:
                             pass
-                        
-                        new_records += 1
-                    
-                    # Update last updated timestamp
-                    try:
-                        stock.SetExtraData('LastUpdated', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-                    except AttributeError:
-                        pass
-                    
-                    stock.Save()
-                    
-                    if new_records > 0 or updated_records > 0:
-                        logger.info(f"Updated {ticker}: {new_records} new, {updated_records} updated")
-                        updated_count += 1
-                    else:
-                        logger.info(f"No updates needed for {ticker}")
-                    
-                    time.sleep(1.5)  # Rate limiting
-                    
-                except Exception as e:
-                    logger.error(f"Failed to update {ticker}: {e}")
-                    failed_count += 1
-                    continue
-            
+
+                        if new_records > 0 or updated_records > 0:
+                            logger.info(f"Updated {ticker}: {new_records} new, {updated_records} updated")
+                            updated_count += 1
+                        else:
+                            logger.info(f"No updates needed for {ticker}")
+
+                    except Exception as e:
+                        logger.error(f"Failed to update {ticker}: {e}")
+                        failed_count += 1
+                        continue
+            finally:
+                self.save_database()
+
             logger.info(f"Update completed: {updated_count} symbols updated, {failed_count} failed")
                     
         except Exception as e:
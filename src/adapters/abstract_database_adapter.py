@@ -4,7 +4,8 @@ Defines the interface for database operations
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 import pandas as pd
 from datetime import datetime
 import logging
@@ -15,10 +16,16 @@ logger = logging.getLogger(__name__)
 class AbstractDatabaseAdapter(ABC):
     """Abstract base class for database adapter implementations"""
     
+    # OHLCV columns every imported DataFrame must provide
+    REQUIRED_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+    
     def __init__(self, config):
         self.config = config
         self.database_path = None
         self.connection_verified = False
+        self._symbol_cache: Optional[set] = None
+        # Largest number of rows written in one go (0 = no limit)
+        self.chunk_size = config.getint('DATABASE', 'import_chunk_size', fallback=20000)
     
     @abstractmethod
     def connect(self, database_path: str) -> bool:
@@ -43,7 +50,20 @@ class AbstractDatabaseAdapter(ABC):
             True if creation successful, False otherwise
         """
         pass
-    
+
+    def create_and_connect(self, path: str) -> bool:
+        """Create a new database and leave it connected
+
+        Args:
+            path: Path where to create the database
+
+        Returns:
+            True if the database was created and connected, False otherwise
+        """
+        # Default implementation - subclasses whose create step already
+        # opens the database should override to skip the second connect
+        return self.create_database(path) and self.connect(path)
+
     @abstractmethod
     def import_data(self, symbol: str, data: pd.DataFrame, metadata: Dict = None) -> bool:
         """Import new data for a symbol
@@ -92,6 +112,29 @@ class AbstractDatabaseAdapter(ABC):
         """
         pass
     
+    @contextmanager
+    def batch_writes(self):
+        """Group a series of writes so they can be persisted together
+        
+        Callers wrap their per-symbol loop in ``with adapter.batch_writes():``.
+        Default implementation persists each write as it happens - subclasses
+        that can defer saving should override.
+        """
+        yield
+    
+    def _iter_chunks(self, data: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Split a DataFrame into consecutive chunks of at most chunk_size rows
+        
+        Args:
+            data: DataFrame to split
+            
+        Yields:
+            Row slices of data, in order
+        """
+        step = self.chunk_size if self.chunk_size > 0 else max(len(data), 1)
+        for start in range(0, len(data), step):
+            yield data.iloc[start:start + step]
+    
     def validate_connection(self) -> bool:
         """Validate the current database connection
         
@@ -115,6 +158,26 @@ class AbstractDatabaseAdapter(ABC):
         logger.warning("get_symbol_list not implemented in base class")
         return []
     
+    def get_symbol_count(self) -> int:
+        """Get the number of symbols in the database
+        
+        Returns:
+            Number of symbols
+        """
+        # Default implementation - subclasses that can count without
+        # listing every symbol should override
+        return len(self.get_symbol_list())
+    
+    def _get_sample_symbol(self) -> Optional[str]:
+        """Get any one symbol from the database, used for statistics
+        
+        Returns:
+            A symbol, or None if the database is empty
+        """
+        # Default implementation - subclasses should override
+        symbols = self.get_symbol_list()
+        return symbols[0] if symbols else None
+    
     def symbol_exists(self, symbol: str) -> bool:
         """Check if a symbol exists in the database
         
@@ -124,8 +187,15 @@ class AbstractDatabaseAdapter(ABC):
         Returns:
             True if symbol exists, False otherwise
         """
-        symbols = self.get_symbol_list()
-        return symbol in symbols
+        # The symbol list is read once and kept in a set; adapters update
+        # it on import/delete and invalidate_symbol_cache() drops it
+        if self._symbol_cache is None:
+            self._symbol_cache = set(self.get_symbol_list())
+        return symbol in self._symbol_cache
+    
+    def invalidate_symbol_cache(self):
+        """Forget the cached symbol list, e.g. after the database changed externally"""
+        self._symbol_cache = None
     
     def delete_symbol(self, symbol: str) -> bool:
         """Delete a symbol and all its data from the database
@@ -219,8 +289,6 @@ class AbstractDatabaseAdapter(ABC):
         Returns:
             True if format is valid, False otherwise
         """
-        required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-        
         if not isinstance(data, pd.DataFrame):
             logger.error("Data must be a pandas DataFrame")
             return False
@@ -229,7 +297,8 @@ class AbstractDatabaseAdapter(ABC):
             logger.error("Data DataFrame is empty")
             return False
         
-        missing_columns = [col for col in required_columns if col not in data.columns]
+        columns = set(data.columns)
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in columns]
         if missing_columns:
             logger.error(f"Missing required columns: {missing_columns}")
             return False
@@ -239,14 +308,42 @@ class AbstractDatabaseAdapter(ABC):
             logger.error("Data must have a DatetimeIndex")
             return False
         
-        # Check for numeric data types
-        for col in required_columns:
-            if not pd.api.types.is_numeric_dtype(data[col]):
-                logger.error(f"Column {col} must be numeric")
-                return False
+        # Check for numeric data types on the dtypes alone, without
+        # pulling out a Series per column
+        dtypes = data.dtypes
+        numeric = [pd.api.types.is_numeric_dtype(dtypes[col]) for col in self.REQUIRED_COLUMNS]
+        if not all(numeric):
+            col = self.REQUIRED_COLUMNS[numeric.index(False)]
+            logger.error(f"Column {col} must be numeric")
+            return False
         
         return True
     
+    def _normalize_ohlcv(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Cast the OHLCV columns to float64 in one vectorised step
+        
+        Args:
+            data: DataFrame to import
+            
+        Returns:
+            DataFrame whose OHLCV columns are float64, or data unchanged if
+            it is not a DataFrame, lacks columns or cannot be cast (so that
+            validate_data_format reports the problem)
+        """
+        if not isinstance(data, pd.DataFrame):
+            return data
+        
+        dtypes = data.dtypes
+        casts = {col: 'float64' for col in self.REQUIRED_COLUMNS
+                 if col in dtypes and dtypes[col] != 'float64'}
+        if not casts:
+            return data
+        
+        try:
+            return data.astype(casts)
+        except (TypeError, ValueError):
+            return data
+    
     def get_database_stats(self) -> Dict:
         """Get statistics about the database
         
@@ -254,16 +351,16 @@ class AbstractDatabaseAdapter(ABC):
             Dictionary containing database statistics
         """
         try:
-            symbols = self.get_symbol_list()
+            total_symbols = self.get_symbol_count()
             stats = {
-                'total_symbols': len(symbols),
+                'total_symbols': total_symbols,
                 'database_path': self.database_path,
                 'connection_status': self.connection_verified
             }
             
-            if symbols:
+            sample_symbol = self._get_sample_symbol() if total_symbols else None
+            if sample_symbol:
                 # Get data range for first symbol as sample
-                sample_symbol = symbols[0]
                 start_date, end_date = self.get_existing_range(sample_symbol)
                 if start_date and end_date:
                     stats['sample_date_range'] = {
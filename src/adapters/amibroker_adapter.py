@@ -4,9 +4,13 @@ Handles all AmiBroker-specific database operations
 """
 
 import os
+import tempfile
+import time
+from contextlib import contextmanager
 import win32com.client
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 
@@ -14,6 +18,16 @@ from .abstract_database_adapter import AbstractDatabaseAdapter
 
 logger = logging.getLogger(__name__)
 
+# AmiBroker ASCII importer definition for the CSV written by import_data_bulk.
+# Import() looks the definition up by name in AmiBroker's Formats directory.
+ASCII_IMPORT_FORMAT = """$FORMAT Date_YMD, Ticker, Open, High, Low, Close, Volume
+$SEPARATOR ,
+$SKIPLINES 0
+$AUTOADD 1
+$DEBUG 0
+"""
+ASCII_IMPORT_FORMAT_NAME = 'crypto_importer.format'
+
 
 class AmiBrokerAdapter(AbstractDatabaseAdapter):
     """AmiBroker-specific implementation of AbstractDatabaseAdapter"""
@@ -22,13 +36,27 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
         super().__init__(config)
         self.com_object = None
         self.current_database = None
+        self._in_batch = False
+        # Whether quotations/stocks expose SetExtraData; probed on first use per connection
+        self._quote_extra_data: Optional[bool] = None
+        self._stock_extra_data: Optional[bool] = None
+        # Stocks collection, fetched once per loaded database
+        self._stocks = None
+        # Frames at least this long go through the ASCII importer (0 = never);
+        # it also needs AmiBroker's Formats directory to install its definition
+        self.ascii_import_min_rows = config.getint('DATABASE', 'ascii_import_min_rows', fallback=0)
+        self.formats_dir = config.get('DATABASE', 'amibroker_formats_dir', '')
+        self._ascii_format_installed = False
+        # Normalized path of the database this adapter last loaded or created
+        self._loaded_db_normalized: Optional[str] = None
         
     def connect(self, database_path: str) -> bool:
         """Connect to AmiBroker and load specified database"""
         try:
             # Initialize COM object
-            self.com_object = win32com.client.Dispatch("Broker.Application")
+            self.com_object = self._dispatch_broker()
             logger.info("AmiBroker COM connection established")
+            self._reset_connection_caches()
             
             self.database_path = database_path
             
@@ -51,6 +79,31 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
             logger.error(f"Failed to connect to AmiBroker: {e}")
             return False
     
+    def _dispatch_broker(self):
+        """Create the Broker.Application COM object, early-bound when possible"""
+        try:
+            # Generated (makepy) proxies call members by DISPID instead of
+            # resolving every name through GetIDsOfNames
+            return win32com.client.gencache.EnsureDispatch("Broker.Application")
+        except Exception as e:
+            logger.debug("Early-bound dispatch unavailable, using late binding: %s", e)
+            return win32com.client.Dispatch("Broker.Application")
+    
+    def _reset_connection_caches(self):
+        """Drop everything cached from the previously loaded database"""
+        self.invalidate_symbol_cache()
+        self._stocks = None
+        self._quote_extra_data = None
+        self._stock_extra_data = None
+        # A new COM object may have opened a different database
+        self._loaded_db_normalized = None
+    
+    def _get_stocks(self):
+        """Return the Stocks collection, fetching the COM property only once"""
+        if self._stocks is None:
+            self._stocks = self.com_object.Stocks
+        return self._stocks
+    
     def _load_database(self, database_path: str) -> bool:
         """Load specified AmiBroker database"""
         try:
@@ -58,15 +111,22 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
                 logger.error(f"Database path does not exist: {database_path}")
                 return False
             
+            # Normalize paths for comparison
+            target_db_normalized = os.path.normpath(database_path).lower()
+            
+            # Skip probing AmiBroker when this adapter loaded the path itself
+            if target_db_normalized == self._loaded_db_normalized:
+                logger.debug(f"Database already loaded by this adapter: {database_path}")
+                self.connection_verified = True
+                return True
+            
             # Get current database for comparison
             current_db = self._get_current_database()
-            
-            # Normalize paths for comparison
             current_db_normalized = os.path.normpath(current_db).lower() if current_db else ""
-            target_db_normalized = os.path.normpath(database_path).lower()
             
             if current_db_normalized == target_db_normalized:
                 logger.info(f"Database already loaded: {database_path}")
+                self._loaded_db_normalized = target_db_normalized
                 self.connection_verified = True
                 return True
             
@@ -77,6 +137,8 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
             
             if result:
                 logger.info(f"Successfully loaded database: {database_path}")
+                self._reset_connection_caches()
+                self._loaded_db_normalized = target_db_normalized
                 self.connection_verified = True
                 self.current_database = database_path
                 return True
@@ -148,6 +210,8 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
             
             if result:
                 logger.info(f"Successfully created database: {path}")
+                self._reset_connection_caches()
+                self._loaded_db_normalized = os.path.normpath(path).lower()
                 self.database_path = path
                 self.connection_verified = True
                 return True
@@ -158,42 +222,54 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
         except Exception as e:
             logger.error(f"Error creating database: {e}")
             return False
+
+    def create_and_connect(self, path: str) -> bool:
+        """Create a new AmiBroker database and keep it loaded"""
+        # NewDatabase leaves the new database open in AmiBroker, so the
+        # connection from create_database is reused instead of reloading
+        return self.create_database(path)
+
+    @contextmanager
+    def batch_writes(self):
+        """Skip per-symbol Save() calls and save the whole database once on exit"""
+        if self._in_batch:
+            # Nested batch - the outermost one saves
+            yield
+            return
+        
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            try:
+                self.com_object.SaveDatabase()
+                logger.debug("Saved AmiBroker database after batch")
+            except Exception as e:
+                logger.error(f"Failed to save AmiBroker database: {e}")
     
     def import_data(self, symbol: str, data: pd.DataFrame, metadata: Dict = None) -> bool:
         """Import new data for a symbol"""
         try:
+            data = self._normalize_ohlcv(data)
             if not self.validate_data_format(data):
                 return False
             
             # Get or create stock object
-            stock = self.com_object.Stocks(symbol)
+            stock = self._get_stocks()(symbol)
             
             # Set stock properties
             if metadata:
                 self._set_stock_metadata(stock, metadata)
             
             # Import quotations
-            quotations = stock.Quotations
+            self._import_quotations(symbol, stock.Quotations, data)
+            if self._symbol_cache is not None:
+                self._symbol_cache.add(symbol)
             
-            for date, row in data.iterrows():
-                # Type hint for PyCharm: date is pandas.Timestamp
-                dt = pd.Timestamp(date).to_pydatetime()
-                quote = quotations.Add(dt)
-                quote.Open = float(row['Open'])
-                quote.High = float(row['High'])
-                quote.Low = float(row['Low'])
-                quote.Close = float(row['Close'])
-                quote.Volume = float(row['Volume'])
-                
-                # Add market cap if available
-                if 'MarketCap' in row:
-                    try:
-                        quote.SetExtraData('MarketCap', float(row['MarketCap']))
-                    except AttributeError:
-                        pass
-            
-            # Save the stock
-            stock.Save()
+            # Save the stock (deferred to the end of a batch)
+            if not self._in_batch:
+                stock.Save()
             logger.info(f"Imported {len(data)} records for {symbol}")
             return True
             
@@ -201,9 +277,122 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
             logger.error(f"Failed to import data for {symbol}: {e}")
             return False
     
+    def _import_quotations(self, symbol: str, quotations, data: pd.DataFrame) -> int:
+        """Write rows for a symbol with no overlapping quotations
+        
+        Rows are written chunk by chunk; each chunk goes through the ASCII
+        importer when it is large enough, otherwise through COM.
+        
+        Args:
+            symbol: Trading symbol
+            quotations: AmiBroker Quotations collection of the symbol
+            data: DataFrame containing OHLCV data (MarketCap optional)
+            
+        Returns:
+            Number of quotations written
+        """
+        for chunk in self._iter_chunks(data):
+            start_time = time.time()
+            if self._use_ascii_import(chunk) and self.import_data_bulk(symbol, chunk):
+                self._set_market_caps(quotations, chunk)
+                method = 'ASCII import'
+            else:
+                self._add_quotations(quotations, chunk)
+                method = 'COM'
+            logger.debug(f"Wrote {len(chunk)} rows for {symbol} via {method} "
+                         f"in {time.time() - start_time:.3f}s")
+        
+        return len(data)
+    
+    def _use_ascii_import(self, data: pd.DataFrame) -> bool:
+        """Check whether a frame is large enough for the ASCII importer to pay off"""
+        # Small frames stay on the COM loop, where the importer's startup dominates
+        return bool(self.formats_dir) and 0 < self.ascii_import_min_rows <= len(data)
+    
+    def import_data_bulk(self, symbol: str, data: pd.DataFrame) -> bool:
+        """Import OHLCV rows through AmiBroker's native ASCII importer
+        
+        The frame is written to a temporary CSV in one pandas call and
+        AmiBroker parses it itself, instead of one COM call per field.
+        Extra data such as MarketCap is not part of the import.
+        
+        Args:
+            symbol: Trading symbol
+            data: DataFrame containing OHLCV data
+            
+        Returns:
+            True if AmiBroker reported a successful import, False otherwise
+        """
+        fd, csv_path = tempfile.mkstemp(prefix='amibroker_import_', suffix='.csv')
+        os.close(fd)
+        try:
+            export = data[list(self.REQUIRED_COLUMNS)].astype(np.float64)
+            export.insert(0, 'Ticker', symbol)
+            export.to_csv(csv_path, header=False, date_format='%Y-%m-%d')
+            
+            # Type 0 is the ASCII importer; it returns 0 on success
+            result = self.com_object.Import(0, csv_path, self._install_ascii_format())
+            if result != 0:
+                logger.warning(f"ASCII import of {symbol} failed with code {result}")
+                return False
+            
+            logger.debug(f"Imported {len(data)} records for {symbol} through the ASCII importer")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"ASCII import of {symbol} failed: {e}")
+            return False
+        finally:
+            try:
+                os.remove(csv_path)
+            except OSError:
+                pass
+    
+    def _install_ascii_format(self) -> str:
+        """Write the ASCII importer format definition into the Formats directory
+        
+        Returns:
+            The definition's file name, which is what Import() expects
+        """
+        if not self._ascii_format_installed:
+            path = os.path.join(self.formats_dir, ASCII_IMPORT_FORMAT_NAME)
+            with open(path, 'w') as f:
+                f.write(ASCII_IMPORT_FORMAT)
+            self._ascii_format_installed = True
+        return ASCII_IMPORT_FORMAT_NAME
+    
+    def _set_market_caps(self, quotations, data: pd.DataFrame) -> int:
+        """Store MarketCap on quotations created by the ASCII importer
+        
+        Args:
+            quotations: AmiBroker Quotations collection
+            data: Imported DataFrame (rows without MarketCap are ignored)
+            
+        Returns:
+            Number of quotations updated
+        """
+        if 'MarketCap' not in data.columns or data.empty:
+            return 0
+        
+        quotes_by_date = self._index_quotations_by_date(quotations, data.index.min().date())
+        market_caps = data['MarketCap'].to_numpy(dtype=np.float64).tolist()
+        
+        updated = 0
+        for day, market_cap in zip(data.index.date, market_caps):
+            quote = quotes_by_date.get(day)
+            if quote is None:
+                continue
+            if not self._supports_quote_extra_data(quote):
+                break
+            quote.SetExtraData('MarketCap', market_cap)
+            updated += 1
+        
+        return updated
+    
     def update_data(self, symbol: str, data: pd.DataFrame) -> Tuple[int, int]:
         """Update existing data for a symbol"""
         try:
+            data = self._normalize_ohlcv(data)
             if not self.validate_data_format(data):
                 return 0, 0
             
@@ -213,35 +402,37 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
             new_records = 0
             updated_records = 0
             
-            stock = self.com_object.Stocks(symbol)
+            stock = self._get_stocks()(symbol)
             quotations = stock.Quotations
             
             if existing_start is None:
                 # No existing data, import all
-                for date, row in data.iterrows():
-                    self._add_quotation(quotations, date, row)
-                    new_records += 1
+                new_records = self._import_quotations(symbol, quotations, data)
+            elif (data.index.min().date() > existing_end.date() or
+                  data.index.max().date() < existing_start.date()):
+                # Usual incremental case: every row is newer (or older) than
+                # the stored range, so there is nothing to compare
+                new_records = self._add_quotations(quotations, data)
             else:
-                # Update existing and add new
-                for date, row in data.iterrows():
-                    dt = date.to_pydatetime()
-                    
-                    if dt.date() < existing_start.date() or dt.date() > existing_end.date():
-                        # New data outside existing range
-                        self._add_quotation(quotations, date, row)
-                        new_records += 1
-                    else:
-                        # Potentially update existing data
-                        if self._update_existing_quotation(quotations, date, row):
-                            updated_records += 1
+                # Split the rows once on their day instead of comparing
+                # dates row by row
+                days = data.index.normalize()
+                in_range = (days >= pd.Timestamp(existing_start.date())) & (days <= pd.Timestamp(existing_end.date()))
+                
+                # New data outside existing range
+                new_records = self._add_quotations(quotations, data[~in_range])
+                
+                # Potentially update existing data
+                updated_records = self._update_existing_quotations(quotations, data[in_range])
             
             # Update metadata
-            try:
+            if self._supports_stock_extra_data(stock):
                 stock.SetExtraData('LastUpdated', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-            except AttributeError:
-                pass
             
-            stock.Save()
+            if not self._in_batch:
+                stock.Save()
+            if new_records and self._symbol_cache is not None:
+                self._symbol_cache.add(symbol)
             
             return new_records, updated_records
             
@@ -249,73 +440,152 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
             logger.error(f"Failed to update data for {symbol}: {e}")
             return 0, 0
     
-    def _add_quotation(self, quotations, date, row):
-        """Add a new quotation"""
-        dt = date.to_pydatetime()
-        quote = quotations.Add(dt)
-        quote.Open = float(row['Open'])
-        quote.High = float(row['High'])
-        quote.Low = float(row['Low'])
-        quote.Close = float(row['Close'])
-        quote.Volume = float(row['Volume'])
+    def _add_quotations(self, quotations, data: pd.DataFrame) -> int:
+        """Add every row of a DataFrame as a new quotation
         
-        if 'MarketCap' in row:
-            try:
-                quote.SetExtraData('MarketCap', float(row['MarketCap']))
-            except AttributeError:
-                pass
+        Args:
+            quotations: AmiBroker Quotations collection
+            data: DataFrame containing OHLCV data (MarketCap optional)
+            
+        Returns:
+            Number of quotations added
+        """
+        if data.empty:
+            return 0
+        
+        # Convert the whole block once up front instead of building a Series
+        # per row; AmiBroker has no bulk insert, so the COM calls remain
+        dates = data.index.to_pydatetime()
+        ohlcv = self._ohlcv_array(data).tolist()
+        if 'MarketCap' in data.columns:
+            market_caps = data['MarketCap'].to_numpy(dtype=np.float64).tolist()
+        else:
+            market_caps = [None] * len(dates)
+        
+        add_quote = quotations.Add
+        for dt, values, market_cap in zip(dates, ohlcv, market_caps):
+            quote = add_quote(dt)
+            quote.Open, quote.High, quote.Low, quote.Close, quote.Volume = values
+            
+            if market_cap is not None and self._supports_quote_extra_data(quote):
+                quote.SetExtraData('MarketCap', market_cap)
+        
+        return len(dates)
+    
+    def _ohlcv_array(self, data: pd.DataFrame) -> np.ndarray:
+        """Return the OHLCV columns as one contiguous float64 array
+        
+        Rows are in REQUIRED_COLUMNS order, so ``ohlcv[i]`` unpacks straight
+        into Open, High, Low, Close, Volume.
+        """
+        return np.ascontiguousarray(data[list(self.REQUIRED_COLUMNS)].to_numpy(dtype=np.float64))
+    
+    def _supports_quote_extra_data(self, quote) -> bool:
+        """Check whether quotations accept SetExtraData (MarketCap storage)
+        
+        The answer depends on the AmiBroker build, not the quotation, so it
+        is probed once per connection instead of catching AttributeError
+        on every row.
+        """
+        if self._quote_extra_data is None:
+            self._quote_extra_data = hasattr(quote, 'SetExtraData')
+            if not self._quote_extra_data:
+                logger.debug("Quotations do not support SetExtraData, MarketCap will not be stored")
+        return self._quote_extra_data
+    
+    def _supports_stock_extra_data(self, stock) -> bool:
+        """Check whether stocks accept SetExtraData (symbol metadata storage)"""
+        if self._stock_extra_data is None:
+            self._stock_extra_data = hasattr(stock, 'SetExtraData')
+            if not self._stock_extra_data:
+                logger.debug("Stocks do not support SetExtraData, symbol metadata will not be stored")
+        return self._stock_extra_data
     
-    def _update_existing_quotation(self, quotations, date, row) -> bool:
-        """Update an existing quotation if values have changed"""
-        dt = date.to_pydatetime()
+    def _index_quotations_by_date(self, quotations, since: Optional[date] = None) -> Dict[date, object]:
+        """Map each quotation's date to its Quotation object
         
-        # Find existing quotation for this date
-        for i in range(quotations.Count):
+        Args:
+            quotations: AmiBroker Quotations collection (kept in date order)
+            since: Stop once quotations are older than this date
+            
+        Returns:
+            Dictionary of date -> Quotation, keeping the first quotation of each day
+        """
+        quotes_by_date = {}
+        
+        # Walk back from the newest quotation so only the dates that can
+        # match are read through COM
+        for i in range(quotations.Count - 1, -1, -1):
             quote = quotations(i)
-            quote_date = datetime(quote.Date.year, quote.Date.month, quote.Date.day)
-            
-            if quote_date == dt.date():
-                # Check if values have changed significantly
-                if (abs(quote.Close - float(row['Close'])) > 0.0001 or
-                    abs(quote.Volume - float(row['Volume'])) > 0.1):
-                    
-                    quote.Open = float(row['Open'])
-                    quote.High = float(row['High'])
-                    quote.Low = float(row['Low'])
-                    quote.Close = float(row['Close'])
-                    quote.Volume = float(row['Volume'])
-                    
-                    if 'MarketCap' in row:
-                        try:
-                            quote.SetExtraData('MarketCap', float(row['MarketCap']))
-                        except AttributeError:
-                            pass
-                    
-                    return True
+            # Fetch the Date property once; each access is a COM call
+            com_date = quote.Date
+            quote_date = date(com_date.year, com_date.month, com_date.day)
+            if since is not None and quote_date < since:
                 break
+            quotes_by_date[quote_date] = quote
+        
+        return quotes_by_date
+    
+    def _update_existing_quotations(self, quotations, data: pd.DataFrame) -> int:
+        """Update the existing quotations whose values differ from data
+        
+        Args:
+            quotations: AmiBroker Quotations collection
+            data: DataFrame rows that fall within the stored date range
+            
+        Returns:
+            Number of quotations updated
+        """
+        if data.empty:
+            return 0
+        
+        # Look existing quotations up by date instead of rescanning the
+        # collection for every row
+        quotes_by_date = self._index_quotations_by_date(quotations, data.index.min().date())
+        matched_quotes = [quotes_by_date.get(day) for day in data.index.date]
+        if all(quote is None for quote in matched_quotes):
+            return 0
+        
+        # Most rows are unchanged: compare them all at once and only write
+        # back the quotations whose values moved
+        stored_closes = np.array([np.nan if q is None else q.Close for q in matched_quotes], dtype=np.float64)
+        stored_volumes = np.array([np.nan if q is None else q.Volume for q in matched_quotes], dtype=np.float64)
+        ohlcv = self._ohlcv_array(data)
+        market_caps = data['MarketCap'].to_numpy(dtype=np.float64) if 'MarketCap' in data.columns else None
         
-        return False
+        # NaN (no stored quotation) compares False, so unmatched rows drop out
+        changed = (np.abs(stored_closes - ohlcv[:, 3]) > 0.0001) | (np.abs(stored_volumes - ohlcv[:, 4]) > 0.1)
+        
+        for i in np.flatnonzero(changed).tolist():
+            quote = matched_quotes[i]
+            quote.Open, quote.High, quote.Low, quote.Close, quote.Volume = ohlcv[i].tolist()
+            
+            if market_caps is not None and self._supports_quote_extra_data(quote):
+                quote.SetExtraData('MarketCap', float(market_caps[i]))
+        
+        return int(changed.sum())
     
     def get_existing_range(self, symbol: str) -> Tuple[Optional[datetime], Optional[datetime]]:
         """Get the date range of existing data for a symbol"""
         try:
-            stock = self.com_object.Stocks(symbol)
+            stock = self._get_stocks()(symbol)
             quotations = stock.Quotations
+            count = quotations.Count
             
-            if quotations.Count == 0:
+            if count == 0:
                 return None, None
             
-            # Get first and last dates
-            first_quote = quotations(0)
-            last_quote = quotations(quotations.Count - 1)
+            # Get first and last dates, reading each Date property once
+            first_quote_date = quotations(0).Date
+            last_quote_date = quotations(count - 1).Date
             
-            first_date = datetime(first_quote.Date.year, first_quote.Date.month, first_quote.Date.day)
-            last_date = datetime(last_quote.Date.year, last_quote.Date.month, last_quote.Date.day)
+            first_date = datetime(first_quote_date.year, first_quote_date.month, first_quote_date.day)
+            last_date = datetime(last_quote_date.year, last_quote_date.month, last_quote_date.day)
             
             return first_date, last_date
             
         except Exception as e:
-            logger.debug(f"Could not get existing data range for {symbol}: {e}")
+            logger.debug("Could not get existing data range for %s: %s", symbol, e)
             return None, None
     
     def create_groups(self) -> bool:
@@ -396,12 +666,10 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
                 stock.MarketID = metadata['market_id']
             
             # Set extra data
-            for key, value in metadata.items():
-                if key not in ['full_name', 'group_id', 'market_id']:
-                    try:
+            if self._supports_stock_extra_data(stock):
+                for key, value in metadata.items():
+                    if key not in ['full_name', 'group_id', 'market_id']:
                         stock.SetExtraData(key, str(value))
-                    except AttributeError:
-                        pass
                         
         except Exception as e:
             logger.debug(f"Error setting stock metadata: {e}")
@@ -409,27 +677,49 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
     def get_symbol_list(self) -> List[str]:
         """Get list of all symbols in the database"""
         try:
-            stocks = self.com_object.Stocks
-            symbols = []
+            stocks = self._get_stocks()
             
-            for i in range(stocks.Count):
-                stock = stocks(i)
-                if stock.Ticker:
-                    symbols.append(stock.Ticker)
+            # Enumerate the collection through _NewEnum where supported,
+            # reading each Ticker once
+            try:
+                tickers = [stock.Ticker for stock in stocks]
+            except Exception as e:
+                # No usable enumerator - index it, reading Count only once
+                logger.debug("Stocks enumeration unavailable, indexing instead: %s", e)
+                tickers = [stocks(i).Ticker for i in range(stocks.Count)]
             
-            return symbols
+            return [ticker for ticker in tickers if ticker]
             
         except Exception as e:
             logger.error(f"Failed to get symbol list: {e}")
             return []
     
+    def get_symbol_count(self) -> int:
+        """Get the number of symbols from Stocks.Count without listing them"""
+        try:
+            return self._get_stocks().Count
+        except Exception as e:
+            logger.debug("Stocks.Count unavailable, counting the symbol list: %s", e)
+            return super().get_symbol_count()
+    
+    def _get_sample_symbol(self) -> Optional[str]:
+        """Get the first symbol in the database"""
+        try:
+            return self._get_stocks()(0).Ticker or None
+        except Exception as e:
+            logger.debug("Could not read the first stock, using the symbol list: %s", e)
+            return super()._get_sample_symbol()
+    
     def delete_symbol(self, symbol: str) -> bool:
         """Delete a symbol and all its data from the database"""
         try:
-            stock = self.com_object.Stocks(symbol)
+            stock = self._get_stocks()(symbol)
             quotations = stock.Quotations
             quotations.Clear()
-            stock.Save()
+            if not self._in_batch:
+                stock.Save()
+            if self._symbol_cache is not None:
+                self._symbol_cache.discard(symbol)
             
             logger.info(f"Deleted symbol: {symbol}")
             return True
@@ -441,7 +731,7 @@ class AmiBrokerAdapter(AbstractDatabaseAdapter):
     def get_symbol_metadata(self, symbol: str) -> Optional[Dict]:
         """Get metadata for a symbol"""
         try:
-            stock = self.com_object.Stocks(symbol)
+            stock = self._get_stocks()(symbol)
             
             metadata = {
                 'symbol': symbol,
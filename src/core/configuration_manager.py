@@ -4,27 +4,392 @@ Handles all configuration file operations and validation
 """
 
 import configparser
+import copy
+import functools
+import locale
 import os
 import logging
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Line patterns for the plain INI subset handled by _parse_ini_fast
+_SECTION_RE = re.compile(r'^\[([^\]\n]+)\][ \t\r]*$', re.M)
+_OPTION_RE = re.compile(r'^([^\s;#=:%\[][^=:%\n]*?)[ \t]*=([^%\n]*)$', re.M)
+_IGNORED_LINE_RE = re.compile(r'^[ \t\r]*(?:[#;][^\n]*)?$', re.M)
+
+# Bare config file names, which _sanitize_config_path checks against cwd only
+_SAFE_NAME_RE = re.compile(r'[\w.-]+\.(?:ini|cfg|conf)')
+
+# System directory patterns blocked in user-supplied paths (matched lowercased)
+_SYSTEM_DIR_RE = re.compile(r'/(?:etc|root|usr|var)/|\\(?:etc|root|usr|var)\\|system32|program files')
+
+# Patterns never allowed in a config file name
+_DANGEROUS_NAME_RE = re.compile(r'\.\.|//|\\\\|[<>|*?:]')
+
+
+@functools.lru_cache(maxsize=1)
+def _home_config_dirs() -> Tuple[str, ...]:
+    """Allowed config directories under the user's home, resolved once per process"""
+    config_dir = Path.home().resolve() / ".config"
+    return (str(config_dir), str(config_dir / "crypto-data-importer"))
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """Whether resolved path is directory itself or lies below it"""
+    path = os.path.normcase(path)
+    directory = os.path.normcase(directory)
+    return path == directory or path.startswith(directory.rstrip(os.sep) + os.sep)
+
+
+def _parse_ini_fast(text: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Parse [section] headers and key = value lines without configparser
+    
+    Config files written by this project only use that subset, which a few
+    regex scans over the whole text can handle. Anything else (continuation
+    lines, ':' delimiters, '%' interpolation, duplicates, options before the
+    first section) returns None so configparser parses - and reports - it.
+    
+    Returns:
+        Dictionary of section -> {option: value}, or None if unsupported
+    """
+    headers = list(_SECTION_RE.finditer(text))
+    options = list(_OPTION_RE.finditer(text))
+    
+    # Every line must be a header, an option, blank or a comment
+    line_count = text.count('\n') + 1
+    if len(headers) + len(options) + len(_IGNORED_LINE_RE.findall(text)) != line_count:
+        return None
+    if options and (not headers or options[0].start() < headers[0].start()):
+        return None
+    
+    sections: Dict[str, Dict[str, str]] = {}
+    option_iter = iter(options)
+    option = next(option_iter, None)
+    for i, header in enumerate(headers):
+        name = header.group(1)
+        if name in sections or name == configparser.DEFAULTSECT:
+            return None
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        values = sections[name] = {}
+        while option is not None and option.start() < end:
+            key = option.group(1).lower()
+            if key in values:
+                return None
+            values[key] = option.group(2).strip()
+            option = next(option_iter, None)
+    
+    return sections
+
+
+class _CachedConfigParser(configparser.ConfigParser):
+    """ConfigParser shared through _parse_ini_cached"""
+    # Set once the defaults have been merged in, so later instances sharing
+    # this parse can skip validation
+    defaults_applied = False
+
+
+def _read_config_text(path: str) -> str:
+    """Read a config file as UTF-8, falling back to the locale encoding
+    
+    Files written by this project are UTF-8, but hand-edited configs from
+    before the switch may still be in the locale encoding (e.g. cp1252).
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except UnicodeDecodeError as e:
+        logger.warning(f"Config file {path} is not valid UTF-8 ({e}); "
+                       f"re-reading it with the locale encoding")
+        with open(path, encoding=locale.getpreferredencoding(False)) as f:
+            return f.read()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_ini_cached(path: str, mtime_ns: int, size: int) -> _CachedConfigParser:
+    """Parse an INI file once per (path, mtime, size) and share the result
+    
+    The returned parser is shared between ConfigurationManager instances and
+    must not be mutated directly; instances clone it before writing.
+    """
+    text = _read_config_text(path)
+    
+    parser = _CachedConfigParser()
+    sections = _parse_ini_fast(text)
+    if sections is None:
+        parser.read_string(text, source=path)
+    else:
+        parser.read_dict(sections, source=path)
+    return parser
+
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Typed, read-only view of the settings used on the startup and status paths"""
+    # Declared by hand rather than via dataclass(slots=True) to stay 3.8 compatible
+    __slots__ = ('db_path', 'data_provider', 'exchanges', 'db_adapter', 'max_coins',
+                 'min_market_cap', 'create_if_not_exists', 'exclude_stablecoins')
+    db_path: str
+    data_provider: str
+    exchanges: Tuple[str, ...]
+    db_adapter: str
+    max_coins: str  # display only; run_import coerces it where it is used
+    min_market_cap: float
+    create_if_not_exists: bool
+    exclude_stablecoins: bool
+
+
+# Default value of every option, written to new config files and used to
+# fill in options missing from existing ones. Shared by all instances.
+_DEFAULT_CONFIG: Dict[str, Dict[str, str]] = {
+    'DATABASE': {
+        'database_path': r'C:\AmiBroker\Databases\Crypto\crypto.adb',
+        'create_if_not_exists': 'true',
+        'auto_backup': 'false',
+        'backup_path': r'C:\AmiBroker\Backups\Crypto',
+        'ascii_import_min_rows': '0',
+        'amibroker_formats_dir': '',
+        'import_chunk_size': '20000'
+    },
+    'IMPORT': {
+        'max_coins': '500',
+        'min_market_cap': '10000000',
+        'historical_days': '365',
+        'force_full_update': 'false',
+        'rate_limit_delay': '1.5'
+    },
+    'MAPPING': {
+        'use_cached_mapping': 'true',
+        'mapping_file': 'coingecko_kraken_mapping.json',
+        'rebuild_mapping_days': '7',
+        'cache_expiry_hours': '24',
+        'checkpoint_enabled': 'true',
+        'checkpoint_frequency': '100',
+        'resume_on_restart': 'true',
+        'checkpoint_file': 'kraken_mapping_checkpoint.json'
+    },
+    'FILTERING': {
+        'include_kraken_only': 'false',
+        'exclude_stablecoins': 'false',
+        'min_volume_24h': '0',
+        'excluded_symbols': '',
+        'included_symbols': ''
+    },
+    'UPDATES': {
+        'auto_update_enabled': 'true',
+        'update_frequency_hours': '6',
+        'update_days_back': '7',
+        'update_on_startup': 'true'
+    },
+    'LOGGING': {
+        'log_level': 'INFO',
+        'log_file': 'crypto_importer.log',
+        'max_log_size_mb': '10',
+        'backup_count': '5'
+    },
+    'API': {
+        'coingecko_api_key': '',
+        'requests_per_minute': '40',
+        'timeout_seconds': '30',
+        'retry_attempts': '3'
+    },
+    'PROVIDERS': {
+        'data_provider': 'coingecko',
+        'exchanges': 'kraken',
+        'database_adapter': 'amibroker'
+    }
+}
+
+
+# Commented configuration file written by create_default_config()
+_DEFAULT_CONFIG_TEXT = '''# CoinGecko AmiBroker Importer Configuration
+# ==========================================
+
+[DATABASE]
+# Path to AmiBroker database file
+database_path = C:\\AmiBroker\\Databases\\Crypto\\crypto.adb
+
+# Create database if it doesn't exist
+create_if_not_exists = true
+
+# Enable automatic database backup before major operations
+auto_backup = false
+
+# Path for database backups
+backup_path = C:\\AmiBroker\\Backups\\Crypto
+
+# Import new symbols with at least this many rows through AmiBroker's
+# ASCII importer instead of row-by-row COM calls (0 = disabled)
+ascii_import_min_rows = 0
+
+# AmiBroker's Formats directory, where the ASCII importer looks up its
+# format definition (required for ascii_import_min_rows)
+amibroker_formats_dir =
+
+# Largest number of rows written to the database in one go (0 = no limit)
+import_chunk_size = 20000
+
+[IMPORT]
+# Maximum number of coins to import (use 0 for unlimited)
+max_coins = 500
+
+# Minimum market cap filter (in USD)
+min_market_cap = 10000000
+
+# Number of days of historical data to import
+historical_days = 365
+
+# Force complete data refresh on every run
+force_full_update = false
+
+# Delay between API calls (seconds) to respect rate limits
+rate_limit_delay = 1.5
+
+[MAPPING]
+# Use cached Kraken mapping to speed up startup
+use_cached_mapping = true
+
+# File to store CoinGecko-Kraken mapping
+mapping_file = coingecko_kraken_mapping.json
+
+# Rebuild mapping if cache is older than this (days)
+rebuild_mapping_days = 7
+
+# Cache expiry time for mapping data (hours)
+cache_expiry_hours = 24
+
+# Enable checkpoint/resume functionality for mapping process
+checkpoint_enabled = true
+
+# Number of coins to process before saving checkpoint
+checkpoint_frequency = 100
+
+# Automatically resume from checkpoint on restart
+resume_on_restart = true
+
+# File to store checkpoint progress data
+checkpoint_file = kraken_mapping_checkpoint.json
+
+[FILTERING]
+# Import only coins available on Kraken
+include_kraken_only = false
+
+# Exclude stablecoins from import
+exclude_stablecoins = false
+
+# Minimum 24h trading volume filter (in USD)
+min_volume_24h = 0
+
+# Comma-separated list of symbols to exclude (e.g., USDT,USDC,DAI)
+excluded_symbols = 
+
+# Comma-separated list of symbols to include (empty = include all)
+included_symbols = 
+
+[UPDATES]
+# Enable automatic updates of existing data
+auto_update_enabled = true
+
+# Frequency of automatic updates (hours)
+update_frequency_hours = 6
+
+# Number of days to look back for updates
+update_days_back = 7
+
+# Run update check on script startup
+update_on_startup = true
+
+[LOGGING]
+# Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+log_level = INFO
+
+# Log file path (empty = console only)
+log_file = crypto_importer.log
+
+# Maximum log file size (MB)
+max_log_size_mb = 10
+
+# Number of backup log files to keep
+backup_count = 5
+
+[API]
+# CoinGecko API key (optional, for higher rate limits)
+coingecko_api_key = 
+
+# Maximum requests per minute
+requests_per_minute = 40
+
+# Request timeout in seconds
+timeout_seconds = 30
+
+# Number of retry attempts for failed requests
+retry_attempts = 3
+
+[PROVIDERS]
+# Data provider to use (coingecko, binance, etc.)
+data_provider = coingecko
+
+# Comma-separated list of exchanges to map (kraken, binance, etc.)
+exchanges = kraken
+
+# Database adapter to use (amibroker, metatrader, etc.)
+database_adapter = amibroker
+'''
+
 
 class ConfigurationManager:
     """Manages configuration files for the CoinGecko AmiBroker Importer"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    # Shared instances handed out by get_instance(), keyed by absolute path
+    _instances: Dict[str, "ConfigurationManager"] = {}
+    
+    def __init__(self, config_path: Optional[str] = None, lazy: bool = False, *,
+                 sanitize: bool = True):
+        """Create a manager for config_path
+        
+        Args:
+            config_path: Path to the configuration file (default: config.ini)
+            lazy: Defer reading the file until a value is first requested
+            sanitize: Validate config_path (CVE-002). Pass False only for
+                paths chosen by the program itself; writes stay atomic.
+        """
+        self.sanitize = sanitize
         # CVE-002 Remediation: Secure path validation and sanitization
-        if config_path:
+        if config_path and sanitize:
             self.config_path = self._sanitize_config_path(config_path)
         else:
-            self.config_path = "config.ini"
+            self.config_path = config_path or "config.ini"
         
         self.config = configparser.ConfigParser()
+        self._config_shared = False
+        self._snapshot: Optional[RuntimeConfig] = None
+        self._reset_value_caches()
+        self._loaded = False
         self.default_config = self._get_default_config()
-        self.load_config()
+        if not lazy:
+            self.load_config()
+    
+    @classmethod
+    def get_instance(cls, config_path: Optional[str] = None) -> "ConfigurationManager":
+        """Return the process-wide manager for config_path, loading it on first use
+        
+        The instance is shared, so set_value() on it is visible to every other
+        get_instance() caller for the same path. Construct ConfigurationManager
+        directly when a private copy is needed.
+        """
+        key = os.path.abspath(config_path or "config.ini")
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances.setdefault(key, cls(config_path))
+        return instance
+    
+    @classmethod
+    def clear_instances(cls):
+        """Forget all shared instances so the next get_instance() reloads"""
+        cls._instances.clear()
     
     def _sanitize_config_path(self, config_path: str) -> str:
         """
@@ -45,47 +410,38 @@ class ConfigurationManager:
             ValueError: If path is invalid or attempts traversal
         """
         try:
-            # Allow common config file names without extensive validation
-            safe_config_names = ['config.ini', 'settings.ini', 'app.ini', 'main.ini']
-            if config_path in safe_config_names:
-                resolved_path = Path(config_path).resolve()
-                logger.info(f"CVE-002 SAFE: Common config file allowed: {config_path}")
-                return str(resolved_path)
+            # A bare file name cannot traverse or point at a system directory;
+            # once resolved (it may be a symlink) it only needs the cwd check
+            if _SAFE_NAME_RE.fullmatch(config_path) and '..' not in config_path:
+                real_path = os.path.realpath(config_path)
+                if _is_within(real_path, os.path.realpath(os.getcwd())):
+                    logger.debug(f"CVE-002 SAFE: Plain config file name allowed: {real_path}")
+                    return real_path
             
             # Normalize and resolve the path to handle . and .. components
             resolved_path = Path(config_path).resolve()
             
-            # Define allowed directories (whitelist approach)
-            current_dir = Path.cwd().resolve()
-            user_home = Path.home().resolve()
-            
-            allowed_dirs = [
+            # Define allowed directories (whitelist approach); the working
+            # directory can change, the home-based ones are resolved once
+            current_dir = os.path.realpath(os.getcwd())
+            allowed_dirs = (
                 current_dir,  # Current working directory
-                current_dir / "config",  # Config subdirectory
-                user_home / ".config",  # User config directory
-                user_home / ".config" / "crypto-data-importer",  # App-specific config
-            ]
+                os.path.join(current_dir, "config"),  # Config subdirectory
+            ) + _home_config_dirs()  # User config directory and app-specific config
             
-            # Check if resolved path is within any allowed directory
-            path_is_safe = False
-            for allowed_dir in allowed_dirs:
-                try:
-                    # This will raise ValueError if path is not within allowed_dir
-                    resolved_path.relative_to(allowed_dir)
-                    path_is_safe = True
-                    break
-                except ValueError:
-                    continue
+            # Check if resolved path is within any allowed directory by
+            # string prefix, without building Paths or raising per miss
+            path_str = str(resolved_path)
+            path_is_safe = any(_is_within(path_str, allowed_dir) for allowed_dir in allowed_dirs)
             
             if not path_is_safe:
                 logger.error(f"CVE-002 BLOCKED: Path traversal attempt detected: {config_path}")
                 logger.error(f"Resolved path: {resolved_path}")
-                logger.error(f"Allowed directories: {[str(d) for d in allowed_dirs]}")
+                logger.error(f"Allowed directories: {list(allowed_dirs)}")
                 raise ValueError(f"Configuration path not in allowed directories: {config_path}")
             
             # CRITICAL: Block Windows-style absolute paths ONLY on Unix systems
             import platform
-            path_str = str(resolved_path)
             original_path_str = str(config_path)
             
             # Only apply Windows path blocking on Unix/Linux systems
@@ -96,18 +452,10 @@ class ConfigurationManager:
                     raise ValueError(f"Windows-style absolute path not allowed: {config_path}")
             
             # Block suspicious system directory patterns (only in original input path)
-            original_lower = original_path_str.lower()
-            suspicious_patterns = [
-                '/etc/', '\\etc\\', '/root/', '\\root\\',
-                '/usr/', '\\usr\\', '/var/', '\\var\\',
-                'system32', 'program files'
-            ]
-            
-            # Only block if the original path contains suspicious patterns
-            for pattern in suspicious_patterns:
-                if pattern in original_lower and not path_str.startswith(str(Path.cwd())):
-                    logger.error(f"CVE-002 BLOCKED: Suspicious system directory pattern: {pattern}")
-                    raise ValueError(f"System directory access not allowed: {config_path}")
+            match = _SYSTEM_DIR_RE.search(original_path_str.lower())
+            if match and not path_str.startswith(str(Path.cwd())):
+                logger.error(f"CVE-002 BLOCKED: Suspicious system directory pattern: {match.group(0)}")
+                raise ValueError(f"System directory access not allowed: {config_path}")
             
             # Additional validation: ensure it's a .ini or .cfg file
             if resolved_path.suffix.lower() not in ['.ini', '.cfg', '.conf']:
@@ -115,11 +463,10 @@ class ConfigurationManager:
             
             # Ensure filename doesn't contain dangerous patterns
             filename = resolved_path.name
-            dangerous_patterns = ['..', '//', '\\\\', '<', '>', '|', '*', '?', ':']
-            for pattern in dangerous_patterns:
-                if pattern in filename:
-                    logger.error(f"CVE-002 BLOCKED: Dangerous pattern in filename: {pattern}")
-                    raise ValueError(f"Invalid filename pattern detected: {filename}")
+            match = _DANGEROUS_NAME_RE.search(filename)
+            if match:
+                logger.error(f"CVE-002 BLOCKED: Dangerous pattern in filename: {match.group(0)}")
+                raise ValueError(f"Invalid filename pattern detected: {filename}")
             
             logger.info(f"CVE-002 SAFE: Configuration path validated: {resolved_path}")
             return str(resolved_path)
@@ -142,6 +489,7 @@ class ConfigurationManager:
         Returns:
             bool: True if write successful, False otherwise
         """
+        temp_path: Optional[Path] = None
         try:
             # Double-check that path is still safe (defense in depth)
             validated_path = Path(file_path).resolve()
@@ -170,75 +518,22 @@ class ConfigurationManager:
         except Exception as e:
             logger.error(f"CVE-002: Secure file write failed for {file_path}: {e}")
             # Clean up temp file if it exists
-            try:
-                if 'temp_path' in locals():
+            if temp_path is not None:
+                try:
                     temp_path.unlink(missing_ok=True)
-            except:
-                pass
+                except OSError as cleanup_error:
+                    logger.warning(f"Could not remove temporary file {temp_path}: {cleanup_error}")
             return False
     
     def _get_default_config(self) -> Dict:
-        """Return default configuration values"""
-        return {
-            'DATABASE': {
-                'database_path': r'C:\AmiBroker\Databases\Crypto\crypto.adb',
-                'create_if_not_exists': 'true',
-                'auto_backup': 'false',
-                'backup_path': r'C:\AmiBroker\Backups\Crypto'
-            },
-            'IMPORT': {
-                'max_coins': '500',
-                'min_market_cap': '10000000',
-                'historical_days': '365',
-                'force_full_update': 'false',
-                'rate_limit_delay': '1.5'
-            },
-            'MAPPING': {
-                'use_cached_mapping': 'true',
-                'mapping_file': 'coingecko_kraken_mapping.json',
-                'rebuild_mapping_days': '7',
-                'cache_expiry_hours': '24',
-                'checkpoint_enabled': 'true',
-                'checkpoint_frequency': '100',
-                'resume_on_restart': 'true',
-                'checkpoint_file': 'kraken_mapping_checkpoint.json'
-            },
-            'FILTERING': {
-                'include_kraken_only': 'false',
-                'exclude_stablecoins': 'false',
-                'min_volume_24h': '0',
-                'excluded_symbols': '',
-                'included_symbols': ''
-            },
-            'UPDATES': {
-                'auto_update_enabled': 'true',
-                'update_frequency_hours': '6',
-                'update_days_back': '7',
-                'update_on_startup': 'true'
-            },
-            'LOGGING': {
-                'log_level': 'INFO',
-                'log_file': 'crypto_importer.log',
-                'max_log_size_mb': '10',
-                'backup_count': '5'
-            },
-            'API': {
-                'coingecko_api_key': '',
-                'requests_per_minute': '40',
-                'timeout_seconds': '30',
-                'retry_attempts': '3'
-            },
-            'PROVIDERS': {
-                'data_provider': 'coingecko',
-                'exchanges': 'kraken',
-                'database_adapter': 'amibroker'
-            }
-        }
+        """Return default configuration values (shared - do not modify)"""
+        return _DEFAULT_CONFIG
     
     def create_default_config(self):
         """Create a default configuration file"""
         logger.info(f"Creating default configuration file: {self.config_path}")
         
+        self._writable_config()
         for section, options in self.default_config.items():
             self.config.add_section(section)
             for key, value in options.items():
@@ -256,146 +551,135 @@ class ConfigurationManager:
     
     def _generate_config_with_comments(self) -> str:
         """Generate configuration file with detailed comments"""
-        return '''# CoinGecko AmiBroker Importer Configuration
-# ==========================================
-
-[DATABASE]
-# Path to AmiBroker database file
-database_path = C:\\AmiBroker\\Databases\\Crypto\\crypto.adb
-
-# Create database if it doesn't exist
-create_if_not_exists = true
-
-# Enable automatic database backup before major operations
-auto_backup = false
-
-# Path for database backups
-backup_path = C:\\AmiBroker\\Backups\\Crypto
-
-[IMPORT]
-# Maximum number of coins to import (use 0 for unlimited)
-max_coins = 500
-
-# Minimum market cap filter (in USD)
-min_market_cap = 10000000
-
-# Number of days of historical data to import
-historical_days = 365
-
-# Force complete data refresh on every run
-force_full_update = false
-
-# Delay between API calls (seconds) to respect rate limits
-rate_limit_delay = 1.5
-
-[MAPPING]
-# Use cached Kraken mapping to speed up startup
-use_cached_mapping = true
-
-# File to store CoinGecko-Kraken mapping
-mapping_file = coingecko_kraken_mapping.json
-
-# Rebuild mapping if cache is older than this (days)
-rebuild_mapping_days = 7
-
-# Cache expiry time for mapping data (hours)
-cache_expiry_hours = 24
-
-# Enable checkpoint/resume functionality for mapping process
-checkpoint_enabled = true
-
-# Number of coins to process before saving checkpoint
-checkpoint_frequency = 100
-
-# Automatically resume from checkpoint on restart
-resume_on_restart = true
-
-# File to store checkpoint progress data
-checkpoint_file = kraken_mapping_checkpoint.json
-
-[FILTERING]
-# Import only coins available on Kraken
-include_kraken_only = false
-
-# Exclude stablecoins from import
-exclude_stablecoins = false
-
-# Minimum 24h trading volume filter (in USD)
-min_volume_24h = 0
-
-# Comma-separated list of symbols to exclude (e.g., USDT,USDC,DAI)
-excluded_symbols = 
-
-# Comma-separated list of symbols to include (empty = include all)
-included_symbols = 
-
-[UPDATES]
-# Enable automatic updates of existing data
-auto_update_enabled = true
-
-# Frequency of automatic updates (hours)
-update_frequency_hours = 6
-
-# Number of days to look back for updates
-update_days_back = 7
-
-# Run update check on script startup
-update_on_startup = true
-
-[LOGGING]
-# Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-log_level = INFO
-
-# Log file path (empty = console only)
-log_file = crypto_importer.log
-
-# Maximum log file size (MB)
-max_log_size_mb = 10
-
-# Number of backup log files to keep
-backup_count = 5
-
-[API]
-# CoinGecko API key (optional, for higher rate limits)
-coingecko_api_key = 
-
-# Maximum requests per minute
-requests_per_minute = 40
-
-# Request timeout in seconds
-timeout_seconds = 30
-
-# Number of retry attempts for failed requests
-retry_attempts = 3
-
-[PROVIDERS]
-# Data provider to use (coingecko, binance, etc.)
-data_provider = coingecko
-
-# Comma-separated list of exchanges to map (kraken, binance, etc.)
-exchanges = kraken
-
-# Database adapter to use (amibroker, metatrader, etc.)
-database_adapter = amibroker
-'''
+        return _DEFAULT_CONFIG_TEXT
     
     def load_config(self):
         """Load configuration from file, create default if not exists"""
-        if not os.path.exists(self.config_path):
+        self._snapshot = None
+        # One stat both detects a missing file and keys the parse cache
+        try:
+            stat_result = os.stat(self.config_path)
+        except FileNotFoundError:
             logger.info(f"Configuration file not found: {self.config_path}")
             self.create_default_config()
+            stat_result = None
+        except OSError:
+            stat_result = None
         
         try:
-            self.config.read(self.config_path)
+            self._read_config(stat_result)
             logger.info(f"Configuration loaded from: {self.config_path}")
-            self._validate_config()
+            # A cached parse only needs its defaults merged in once
+            if not getattr(self.config, 'defaults_applied', False):
+                self._validate_config()
+                if self._config_shared:
+                    self.config.defaults_applied = True
         except Exception as e:
             logger.error(f"Error loading configuration: {e}")
             logger.info("Using default configuration")
             self._load_defaults()
+        
+        self._reset_value_caches()
+        self._loaded = True
+    
+    def _ensure_loaded(self):
+        """Load the configuration file if a lazy instance has not read it yet"""
+        if not self._loaded:
+            self.load_config()
+    
+    def _reset_value_caches(self):
+        """Empty the per-section value caches"""
+        self._materialized_sections = set()
+        self._cache: Dict[str, Dict[str, str]] = {}
+        self._bool_cache: Dict[str, Dict[str, bool]] = {}
+        self._int_cache: Dict[str, Dict[str, int]] = {}
+        self._float_cache: Dict[str, Dict[str, float]] = {}
+        self._list_cache: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+    
+    def _materialize_section(self, section: str) -> bool:
+        """Flatten one parsed section into dicts with values coerced once
+        
+        Sections are materialized on their first lookup. The get* accessors
+        read from these dicts and only fall back to configparser for lookups
+        the dicts cannot answer (missing options, values that do not coerce),
+        so errors and fallbacks behave as before.
+        
+        Returns:
+            True if new values were cached and the lookup should be retried
+        """
+        self._ensure_loaded()
+        if section in self._materialized_sections:
+            return False
+        self._materialized_sections.add(section)
+        if not self.config.has_section(section):
+            return False
+        for key in self.config.options(section):
+            self._cache_option(section, key)
+        return True
+    
+    def _cache_option(self, section: str, key: str):
+        """Store the raw and coerced forms of a single option"""
+        try:
+            value = self.config.get(section, key)
+        except configparser.Error:
+            return  # e.g. interpolation errors - leave them to configparser
+        
+        self._cache.setdefault(section, {})[key] = value
+        
+        # Drop typed values from a previous setting that may no longer coerce
+        for typed_cache in (self._bool_cache, self._int_cache, self._float_cache):
+            typed_cache.get(section, {}).pop(key, None)
+        
+        boolean = self.config.BOOLEAN_STATES.get(value.lower())
+        if boolean is not None:
+            self._bool_cache.setdefault(section, {})[key] = boolean
+        try:
+            self._int_cache.setdefault(section, {})[key] = int(value)
+        except ValueError:
+            pass
+        try:
+            self._float_cache.setdefault(section, {})[key] = float(value)
+        except ValueError:
+            pass
+        self._list_cache.setdefault(section, {})[key] = tuple(
+            item.strip() for item in value.split(',') if item.strip()
+        )
+    
+    def _read_config(self, stat_result: Optional[os.stat_result] = None):
+        """Read the configuration file, reusing a cached parse when unchanged
+        
+        Args:
+            stat_result: os.stat() of the file if the caller already has it
+        """
+        try:
+            if stat_result is None:
+                stat_result = os.stat(self.config_path)
+        except OSError:
+            # Nothing to key the cache on - parse directly
+            self._writable_config().read(self.config_path)
+            return
+        
+        self.config = _parse_ini_cached(self.config_path, stat_result.st_mtime_ns, stat_result.st_size)
+        self._config_shared = True
+    
+    def _writable_config(self) -> configparser.ConfigParser:
+        """Return a parser that is safe to mutate (copy-on-write of the cached parse)"""
+        self._snapshot = None
+        if self._config_shared:
+            self.config = copy.deepcopy(self.config)
+            self._config_shared = False
+        return self.config
+    
+    def reload(self):
+        """Force a fresh read of the configuration file, bypassing the parse cache"""
+        _parse_ini_cached.cache_clear()
+        self.config = configparser.ConfigParser()
+        self._config_shared = False
+        self.load_config()
     
     def _load_defaults(self):
         """Load default configuration values"""
+        self._writable_config()
         for section, options in self.default_config.items():
             self.config.add_section(section)
             for key, value in options.items():
@@ -403,6 +687,9 @@ database_adapter = amibroker
     
     def _validate_config(self):
         """Validate configuration values"""
+        # Only defaults are filled in here, so this is safe to apply to a
+        # shared cached parse - every instance ends up with the same values.
+        
         # Check required sections exist
         required_sections = ['DATABASE', 'IMPORT', 'MAPPING', 'PROVIDERS']
         for section in required_sections:
@@ -422,38 +709,83 @@ database_adapter = amibroker
     
     def get(self, section: str, key: str, fallback: str = '') -> str:
         """Get configuration value as string"""
-        return self.config.get(section, key, fallback=fallback)
+        try:
+            return self._cache[section][key]
+        except KeyError:
+            if self._materialize_section(section):
+                return self.get(section, key, fallback)
+            return self.config.get(section, key, fallback=fallback)
     
     def getint(self, section: str, key: str, fallback: int = 0) -> int:
         """Get configuration value as integer"""
-        return self.config.getint(section, key, fallback=fallback)
+        try:
+            return self._int_cache[section][key]
+        except KeyError:
+            if self._materialize_section(section):
+                return self.getint(section, key, fallback)
+            return self.config.getint(section, key, fallback=fallback)
     
     def getfloat(self, section: str, key: str, fallback: float = 0.0) -> float:
         """Get configuration value as float"""
-        return self.config.getfloat(section, key, fallback=fallback)
+        try:
+            return self._float_cache[section][key]
+        except KeyError:
+            if self._materialize_section(section):
+                return self.getfloat(section, key, fallback)
+            return self.config.getfloat(section, key, fallback=fallback)
     
     def getboolean(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get configuration value as boolean"""
-        return self.config.getboolean(section, key, fallback=fallback)
+        try:
+            return self._bool_cache[section][key]
+        except KeyError:
+            if self._materialize_section(section):
+                return self.getboolean(section, key, fallback)
+            return self.config.getboolean(section, key, fallback=fallback)
     
     def getlist(self, section: str, key: str, delimiter: str = ',') -> List[str]:
         """Get configuration value as list"""
+        if delimiter == ',':
+            try:
+                return list(self._list_cache[section][key])
+            except KeyError:
+                if self._materialize_section(section):
+                    return self.getlist(section, key, delimiter)
         value = self.get(section, key)
         if not value.strip():
             return []
         return [item.strip() for item in value.split(delimiter) if item.strip()]
     
+    def snapshot(self) -> RuntimeConfig:
+        """Return the runtime settings, coerced once and reused until the config changes"""
+        if self._snapshot is None:
+            self._snapshot = RuntimeConfig(
+                db_path=self.get('DATABASE', 'database_path'),
+                data_provider=self.get('PROVIDERS', 'data_provider'),
+                exchanges=tuple(self.getlist('PROVIDERS', 'exchanges')),
+                db_adapter=self.get('PROVIDERS', 'database_adapter'),
+                max_coins=self.get('IMPORT', 'max_coins'),
+                min_market_cap=self.getfloat('IMPORT', 'min_market_cap'),
+                create_if_not_exists=self.getboolean('DATABASE', 'create_if_not_exists'),
+                exclude_stablecoins=self.getboolean('FILTERING', 'exclude_stablecoins'),
+            )
+        return self._snapshot
+    
     def set_value(self, section: str, key: str, value: str):
         """Set configuration value"""
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        self.config.set(section, key, str(value))
+        self._ensure_loaded()
+        config = self._writable_config()
+        if not config.has_section(section):
+            config.add_section(section)
+        config.set(section, key, str(value))
+        self._cache_option(section, self.config.optionxform(key))
     
     def save_config(self):
         """Save current configuration to file"""
         try:
             # CVE-002 Remediation: Use secure file write operation
             # Convert ConfigParser to string format
+            self._ensure_loaded()
             import io
             config_buffer = io.StringIO()
             self.config.write(config_buffer)
@@ -472,6 +804,7 @@ database_adapter = amibroker
     
     def print_config(self):
         """Print current configuration"""
+        self._ensure_loaded()
         logger.info("Current Configuration:")
         for section in self.config.sections():
             logger.info(f"  [{section}]")
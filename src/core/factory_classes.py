@@ -6,11 +6,12 @@ SECURITY NOTE: Dynamic loading is disabled by default to prevent CVE-001.
 Set CRYPTO_ALLOW_DYNAMIC_LOADING=true only in secure development environments.
 """
 
-from typing import Dict, Type, List, Optional
+from typing import Dict, Type, List, Optional, Tuple
 import logging
 import importlib
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # SECURITY: Dynamic loading disabled by default to prevent arbitrary code execution
@@ -25,6 +26,21 @@ from adapters.abstract_database_adapter import AbstractDatabaseAdapter
 
 logger = logging.getLogger(__name__)
 
+# Incremented whenever a factory registry changes; lets get_factory_status()
+# reuse its previous result until something new is registered
+_registry_version = 0
+_status_cache: Optional[Tuple[int, Dict]] = None
+
+# Set once the built-in implementations are registered so later calls to
+# register_default_implementations() return immediately
+_defaults_registered = False
+
+
+def _bump_registry_version():
+    """Mark the factory registries as changed"""
+    global _registry_version
+    _registry_version += 1
+
 
 class ModuleSecurityValidator:
     """Security validator for module paths and class names"""
@@ -122,6 +138,7 @@ class ProviderFactory:
             provider_class: Provider class to register
         """
         cls._providers[name.lower()] = provider_class
+        _bump_registry_version()
         logger.debug(f"Registered data provider: {name}")
     
     @classmethod
@@ -218,6 +235,7 @@ class MapperFactory:
             mapper_class: Mapper class to register
         """
         cls._mappers[name.lower()] = mapper_class
+        _bump_registry_version()
         logger.debug(f"Registered exchange mapper: {name}")
     
     @classmethod
@@ -335,6 +353,7 @@ class AdapterFactory:
             adapter_class: Adapter class to register
         """
         cls._adapters[name.lower()] = adapter_class
+        _bump_registry_version()
         logger.debug(f"Registered database adapter: {name}")
     
     @classmethod
@@ -421,7 +440,15 @@ class AdapterFactory:
 
 
 def register_default_implementations():
-    """Register the default implementations with their factories"""
+    """Register the default implementations with their factories
+    
+    Idempotent: after the first successful registration further calls are
+    no-ops. A failed import leaves the flag unset so the next call retries.
+    """
+    global _defaults_registered
+    if _defaults_registered:
+        return
+    
     try:
         # Register CoinGecko provider
         from providers.coingecko_provider import CoinGeckoProvider
@@ -435,6 +462,7 @@ def register_default_implementations():
         from adapters.amibroker_adapter import AmiBrokerAdapter
         AdapterFactory.register_adapter('amibroker', AmiBrokerAdapter)
         
+        _defaults_registered = True
         logger.info("Registered default implementations")
         
     except ImportError as e:
@@ -511,27 +539,30 @@ def create_components_from_config(config):
     # Load any custom implementations
     load_custom_implementations(config)
     
-    # Create data provider
     provider_type = config.get('PROVIDERS', 'data_provider', 'coingecko')
-    data_provider = ProviderFactory.create_data_provider(provider_type, config)
-    
-    if not data_provider:
-        raise ValueError(f"Failed to create data provider: {provider_type}")
-    
-    # Create exchange mappers
+    adapter_type = config.get('PROVIDERS', 'database_adapter', 'amibroker')
     exchange_names = config.getlist('PROVIDERS', 'exchanges')
     if not exchange_names:
         exchange_names = ['kraken']  # Default to Kraken
     
-    exchange_mappers = MapperFactory.create_multiple_mappers(exchange_names, config)
+    # Build the data provider (loads its API cache) and the exchange mappers
+    # on worker threads while the database adapter connects on this thread.
+    # The adapter stays on the calling thread because COM objects belong to
+    # the apartment of the thread that created them.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        provider_future = executor.submit(ProviderFactory.create_data_provider, provider_type, config)
+        mappers_future = executor.submit(MapperFactory.create_multiple_mappers, exchange_names, config)
+        
+        database_adapter = AdapterFactory.create_database_adapter(adapter_type, config)
+        data_provider = provider_future.result()
+        exchange_mappers = mappers_future.result()
+    
+    if not data_provider:
+        raise ValueError(f"Failed to create data provider: {provider_type}")
     
     if not exchange_mappers:
         logger.warning("No exchange mappers created")
     
-    # Create database adapter
-    adapter_type = config.get('PROVIDERS', 'database_adapter', 'amibroker')
-    database_adapter = AdapterFactory.create_database_adapter(adapter_type, config)
-    
     if not database_adapter:
         raise ValueError(f"Failed to create database adapter: {adapter_type}")
     
@@ -541,10 +572,17 @@ def create_components_from_config(config):
 def get_factory_status() -> Dict:
     """Get status of all factories
     
+    The result is cached until a factory registry changes, so callers
+    must treat the returned dictionary as read-only.
+    
     Returns:
         Dictionary containing factory status information
     """
-    return {
+    global _status_cache
+    if _status_cache is not None and _status_cache[0] == _registry_version:
+        return _status_cache[1]
+    
+    status = {
         'providers': {
             'available': ProviderFactory.get_available_providers(),
             'count': len(ProviderFactory.get_available_providers())
@@ -558,3 +596,5 @@ def get_factory_status() -> Dict:
             'count': len(AdapterFactory.get_available_adapters())
         }
     }
+    _status_cache = (_registry_version, status)
+    return status
@@ -99,7 +99,7 @@ class DataFilter:
             
             try:
                 if not filter_rule.filter_func(coin_data):
-                    logger.debug(f"Coin {coin_data.get('symbol', 'unknown')} filtered out by: {filter_rule.name}")
+                    logger.debug("Coin %s filtered out by: %s", coin_data.get('symbol', 'unknown'), filter_rule.name)
                     return False
             except Exception as e:
                 logger.warning(f"Filter {filter_rule.name} failed for {coin_data.get('symbol', 'unknown')}: {e}")
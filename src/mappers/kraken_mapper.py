@@ -124,6 +124,9 @@ class KrakenMapper(AbstractExchangeMapper):
     
     def _build_coin_mapping(self, data_provider: AbstractDataProvider) -> Dict:
         """Build mapping between CoinGecko IDs and Kraken data using CoinGecko API with checkpoint/resume support"""
+        # Bound up front so the error handlers can test them directly
+        i: Optional[int] = None
+        mapping: Dict = {}
         try:
             # Get all coins from CoinGecko
             all_coins = data_provider.get_all_coins()
@@ -149,7 +152,6 @@ class KrakenMapper(AbstractExchangeMapper):
                 logger.info(f"Starting fresh mapping process for {total_coins} coins")
             
             mapped_count = len(mapping)
-            batch_size = 50
             
             # Process coins starting from resume point
             for i in range(resume_index, total_coins):
@@ -164,19 +166,20 @@ class KrakenMapper(AbstractExchangeMapper):
                 if coin_id in failed_coin_ids:
                     if self.retry_failed_coins:
                         # Check retry attempts from checkpoint if available
-                        retry_count = self._get_retry_count(coin_id, checkpoint_data if 'checkpoint_data' in locals() else None)
+                        retry_count = self._get_retry_count(coin_id, checkpoint_data)
                         if retry_count < self.max_retry_attempts:
-                            logger.debug(f"Retrying previously failed coin: {coin_id} (attempt {retry_count + 1}/{self.max_retry_attempts})")
+                            logger.debug("Retrying previously failed coin: %s (attempt %s/%s)", coin_id, retry_count + 1, self.max_retry_attempts)
                             failed_coin_ids.remove(coin_id)  # Remove from failed list to retry
                         else:
-                            logger.debug(f"Coin {coin_id} exceeded max retry attempts ({self.max_retry_attempts}), permanently skipping")
+                            logger.debug("Coin %s exceeded max retry attempts (%s), permanently skipping", coin_id, self.max_retry_attempts)
                             processed_coin_ids.append(coin_id)  # Mark as processed to skip permanently
                             continue
                     else:
-                        logger.debug(f"Retry disabled, skipping previously failed coin: {coin_id}")
+                        logger.debug("Retry disabled, skipping previously failed coin: %s", coin_id)
                         processed_coin_ids.append(coin_id)  # Mark as processed to skip permanently
                         continue
                 
+                request_start_time = None
                 try:
                     # Get exchange data for this coin
                     request_start_time = time.time()
@@ -212,24 +215,24 @@ class KrakenMapper(AbstractExchangeMapper):
                     # Rate limiting - use provider's adaptive delay if available
                     if hasattr(data_provider, 'current_rate_limit_delay'):
                         delay = data_provider.current_rate_limit_delay
-                        logger.debug(f"Using adaptive rate limit delay: {delay:.2f}s")
+                        logger.debug("Using adaptive rate limit delay: %.2fs", delay)
                     else:
                         delay = self.config.getfloat('IMPORT', 'rate_limit_delay', 1.5)
-                        logger.debug(f"Using static rate limit delay: {delay:.2f}s")
+                        logger.debug("Using static rate limit delay: %.2fs", delay)
                     time.sleep(delay)
                     
                 except Exception as e:
-                    logger.debug(f"Failed to process {coin_id}: {e}")
+                    logger.debug("Failed to process %s: %s", coin_id, e)
                     
                     # Record failed request for adaptive rate limiting
                     if hasattr(data_provider, 'record_request_result'):
-                        response_time = time.time() - request_start_time if 'request_start_time' in locals() else None
+                        response_time = time.time() - request_start_time if request_start_time is not None else None
                         # Determine status code based on exception type
                         status_code = 429 if "rate limit" in str(e).lower() or "429" in str(e) else 500
                         data_provider.record_request_result(f"coins/{coin_id}", False, response_time, status_code)
                     
                     # Track retry attempt
-                    retry_count = self._get_retry_count(coin_id, checkpoint_data if 'checkpoint_data' in locals() else None)
+                    retry_count = self._get_retry_count(coin_id, checkpoint_data)
                     self._update_retry_count(coin_id, retry_count + 1)
                     
                     if coin_id not in failed_coin_ids:
@@ -237,7 +240,7 @@ class KrakenMapper(AbstractExchangeMapper):
                     
                     # DO NOT mark as processed unless max retries exceeded
                     if retry_count + 1 >= self.max_retry_attempts:
-                        logger.debug(f"Coin {coin_id} exceeded max retry attempts ({self.max_retry_attempts}), marking as processed")
+                        logger.debug("Coin %s exceeded max retry attempts (%s), marking as processed", coin_id, self.max_retry_attempts)
                         processed_coin_ids.append(coin_id)
                     
                     continue
@@ -273,7 +276,7 @@ class KrakenMapper(AbstractExchangeMapper):
         except KeyboardInterrupt:
             logger.info("Mapping process interrupted by user")
             # Save checkpoint before exiting
-            if self.checkpoint_enabled and 'i' in locals():
+            if self.checkpoint_enabled and i is not None:
                 logger.info("Saving checkpoint before exit...")
                 self._save_checkpoint(i, total_coins, processed_coin_ids, mapping, failed_coin_ids, start_time)
                 self._update_incremental_cache(mapping)
@@ -282,11 +285,11 @@ class KrakenMapper(AbstractExchangeMapper):
         except Exception as e:
             logger.error(f"Failed to build Kraken mapping: {e}")
             # Save checkpoint on error
-            if self.checkpoint_enabled and 'i' in locals():
+            if self.checkpoint_enabled and i is not None:
                 logger.info("Saving checkpoint due to error...")
                 self._save_checkpoint(i, total_coins, processed_coin_ids, mapping, failed_coin_ids, start_time)
                 self._update_incremental_cache(mapping)
-            return mapping if 'mapping' in locals() else {}
+            return mapping
     
     def _extract_kraken_info(self, exchange_data: Dict) -> Optional[Dict]:
         """Extract Kraken information from CoinGecko exchange data"""
@@ -503,7 +506,7 @@ class KrakenMapper(AbstractExchangeMapper):
             with open(self.checkpoint_file, 'w') as f:
                 json.dump(checkpoint_data, f, indent=2)
             
-            logger.debug(f"Checkpoint saved: {processed_index + 1}/{total_coins} coins processed")
+            logger.debug("Checkpoint saved: %s/%s coins processed", processed_index + 1, total_coins)
             return True
             
         except Exception as e:
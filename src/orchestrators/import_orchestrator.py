@@ -4,6 +4,7 @@ Orchestrates the entire import process using all components
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 from dataclasses import dataclass
@@ -57,7 +58,9 @@ class ImportOrchestrator:
     """Main orchestrator for the crypto data import process"""
     
     def __init__(self, config_path: Optional[str] = None):
-        # Initialize configuration
+        # Initialize configuration. Each orchestrator gets its own manager so
+        # callers never share or inherit each other's overrides; an unchanged
+        # file is not re-parsed (see _parse_ini_cached)
         self.config = ConfigurationManager(config_path)
         
         # Setup logging
@@ -227,33 +230,34 @@ class ImportOrchestrator:
                 filtered_coins = filtered_coins[:max_coins]
                 logger.info(f"Limited to {len(filtered_coins)} coins")
             
-            # Process each coin
-            for i, coin in enumerate(filtered_coins):
-                logger.info(f"Processing {i+1}/{len(filtered_coins)}: {coin['symbol']} ({coin['name']})")
-                
-                process_result = self.process_coin(coin, force_full_update)
-                
-                if process_result.success:
-                    result.total_processed += 1
-                    result.new_records += process_result.new_records
-                    result.updated_records += process_result.updated_records
-                    
-                    if process_result.is_kraken:
-                        result.kraken_count += 1
-                else:
-                    result.failed_count += 1
-                    if process_result.error_message:
-                        result.errors.append(f"{coin['symbol']}: {process_result.error_message}")
-                
-                # Rate limiting - use provider's adaptive delay if available, otherwise static delay
-                if hasattr(self.data_provider, 'current_rate_limit_delay'):
-                    delay = self.data_provider.current_rate_limit_delay
-                    logger.debug(f"Using adaptive rate limit delay: {delay:.2f}s")
-                else:
-                    delay = self.config.getfloat('IMPORT', 'rate_limit_delay', 1.5)
-                    logger.debug(f"Using static rate limit delay: {delay:.2f}s")
-                time.sleep(delay)
-            
+            # Process each coin, letting the adapter persist them in one save
+            with self.database_adapter.batch_writes():
+                for i, coin in enumerate(filtered_coins):
+                    logger.info(f"Processing {i+1}/{len(filtered_coins)}: {coin['symbol']} ({coin['name']})")
+
+                    process_result = self.process_coin(coin, force_full_update)
+
+                    if process_result.success:
+                        result.total_processed += 1
+                        result.new_records += process_result.new_records
+                        result.updated_records += process_result.updated_records
+
+                        if process_result.is_kraken:
+                            result.kraken_count += 1
+                    else:
+                        result.failed_count += 1
+                        if process_result.error_message:
+                            result.errors.append(f"{coin['symbol']}: {process_result.error_message}")
+
+                    # Rate limiting - use provider's adaptive delay if available, otherwise static delay
+                    if hasattr(self.data_provider, 'current_rate_limit_delay'):
+                        delay = self.data_provider.current_rate_limit_delay
+                        logger.debug("Using adaptive rate limit delay: %.2fs", delay)
+                    else:
+                        delay = self.config.getfloat('IMPORT', 'rate_limit_delay', 1.5)
+                        logger.debug("Using static rate limit delay: %.2fs", delay)
+                    time.sleep(delay)
+
             # Auto-update if enabled
             if self.config.getboolean('UPDATES', 'update_on_startup'):
                 logger.info("Running post-import update as configured")
@@ -437,35 +441,44 @@ class ImportOrchestrator:
             updated_count = 0
             failed_count = 0
             
+            # Resolve coin IDs up front: metadata reads go through the
+            # database adapter, which must stay on this thread
+            targets = []
             for symbol in symbols:
                 try:
                     # Get coin ID from metadata
                     metadata = self.database_adapter.get_symbol_metadata(symbol)
                     coin_id = metadata.get('CoinGeckoID') if metadata else symbol.lower()
-                    
-                    # Get recent market data
-                    market_data = self.data_provider.get_market_data(coin_id, days_back)
-                    if market_data:
-                        if hasattr(self.data_provider, 'format_market_data'):
-                            df = self.data_provider.format_market_data(market_data, {'id': coin_id, 'symbol': symbol})
+                    targets.append((symbol, coin_id))
+                except Exception as e:
+                    logger.error(f"Failed to update {symbol}: {e}")
+                    failed_count += 1
+            
+            # A single worker fetches and formats the next symbols (keeping
+            # the provider's request pacing) while this thread writes the
+            # finished ones to the database
+            executor = ThreadPoolExecutor(max_workers=1)
+            futures = [executor.submit(self._fetch_update_data, symbol, coin_id, days_back)
+                       for symbol, coin_id in targets]
+            try:
+                with self.database_adapter.batch_writes():
+                    for (symbol, coin_id), future in zip(targets, futures):
+                        try:
+                            df = future.result()
                             if df is not None and not df.empty:
                                 new_records, updated_records = self.database_adapter.update_data(symbol, df)
                                 if new_records > 0 or updated_records > 0:
                                     updated_count += 1
                                     logger.info(f"Updated {symbol}: {new_records} new, {updated_records} updated")
-                    
-                    # Rate limiting - use provider's adaptive delay if available, otherwise static delay
-                    if hasattr(self.data_provider, 'current_rate_limit_delay'):
-                        delay = self.data_provider.current_rate_limit_delay
-                        logger.debug(f"Using adaptive rate limit delay for update: {delay:.2f}s")
-                    else:
-                        delay = self.config.getfloat('IMPORT', 'rate_limit_delay', 1.5)
-                        logger.debug(f"Using static rate limit delay for update: {delay:.2f}s")
-                    time.sleep(delay)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to update {symbol}: {e}")
-                    failed_count += 1
+
+                        except Exception as e:
+                            logger.error(f"Failed to update {symbol}: {e}")
+                            failed_count += 1
+            finally:
+                # Drop pending fetches if the loop stops early
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
             
             logger.info(f"Update completed: {updated_count} updated, {failed_count} failed")
             return True
@@ -474,6 +487,36 @@ class ImportOrchestrator:
             logger.error(f"Update process failed: {e}")
             return False
     
+    def _fetch_update_data(self, symbol: str, coin_id: str, days_back: int):
+        """Fetch and format recent market data for one symbol being updated
+        
+        Runs on the update worker thread and applies the rate limit delay
+        after each request.
+        
+        Args:
+            symbol: Database symbol being updated
+            coin_id: Data provider coin ID for the symbol
+            days_back: Number of days of data to fetch
+            
+        Returns:
+            Formatted DataFrame, or None if no data is available
+        """
+        try:
+            # Get recent market data
+            market_data = self.data_provider.get_market_data(coin_id, days_back)
+            if market_data and hasattr(self.data_provider, 'format_market_data'):
+                return self.data_provider.format_market_data(market_data, {'id': coin_id, 'symbol': symbol})
+            return None
+        finally:
+            # Rate limiting - use provider's adaptive delay if available, otherwise static delay
+            if hasattr(self.data_provider, 'current_rate_limit_delay'):
+                delay = self.data_provider.current_rate_limit_delay
+                logger.debug("Using adaptive rate limit delay for update: %.2fs", delay)
+            else:
+                delay = self.config.getfloat('IMPORT', 'rate_limit_delay', 1.5)
+                logger.debug("Using static rate limit delay for update: %.2fs", delay)
+            time.sleep(delay)
+    
     def _log_import_summary(self, result: ImportResult):
         """Log summary of import results"""
         logger.info("Import Summary:")
@@ -100,7 +100,7 @@ class AbstractDataProvider(ABC):
         
         if time_since_last < self.rate_limit_delay:
             sleep_time = self.rate_limit_delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
             time.sleep(sleep_time)
         
         self.last_request_time = time.time()
@@ -3,6 +3,7 @@ CoinGecko Data Provider Implementation
 Handles all CoinGecko API interactions
 """
 
+import numpy as np
 import pandas as pd
 import time
 import json
@@ -88,7 +89,7 @@ class CoinGeckoProvider(AbstractDataProvider):
         cache_key = self._get_cache_key(f"coins/{coin_id}/market_chart", params)
         cached_result = self._get_from_cache(cache_key, self.market_data_ttl_hours)
         if cached_result:
-            logger.debug(f"Using cached market data for {coin_id} ({days} days)")
+            logger.debug("Using cached market data for %s (%s days)", coin_id, days)
             # Note: Cached responses don't count as API requests for adaptive rate limiting
             return cached_result
         
@@ -111,7 +112,7 @@ class CoinGeckoProvider(AbstractDataProvider):
             self._store_in_cache(cache_key, result)
             self._save_cache()
             self.log_api_usage(endpoint, "success", response_time)
-            logger.debug(f"Fetched and cached market data for {coin_id} ({days} days)")
+            logger.debug("Fetched and cached market data for %s (%s days)", coin_id, days)
             return result
         else:
             logger.error(f"Failed to get market data for {coin_id}")
@@ -130,7 +131,7 @@ class CoinGeckoProvider(AbstractDataProvider):
         cache_key = self._get_cache_key(f"coins/{coin_id}", params)
         cached_result = self._get_from_cache(cache_key, self.exchange_data_ttl_hours)
         if cached_result:
-            logger.debug(f"Using cached exchange data for {coin_id}")
+            logger.debug("Using cached exchange data for %s", coin_id)
             # Note: Cached responses don't count as API requests for adaptive rate limiting
             # This prevents cache hits from affecting rate limit adjustments
             return cached_result
@@ -154,7 +155,7 @@ class CoinGeckoProvider(AbstractDataProvider):
             self._store_in_cache(cache_key, result)
             self._save_cache()
             self.log_api_usage(endpoint, "success", response_time)
-            logger.debug(f"Fetched and cached exchange data for {coin_id}")
+            logger.debug("Fetched and cached exchange data for %s", coin_id)
             return result
         else:
             logger.error(f"Failed to get exchange data for {coin_id}")
@@ -175,7 +176,7 @@ class CoinGeckoProvider(AbstractDataProvider):
         cache_key = self._get_cache_key(f"coins/{coin_id}/details", params)
         cached_result = self._get_from_cache(cache_key, self.coin_details_ttl_hours)
         if cached_result:
-            logger.debug(f"Using cached coin details for {coin_id}")
+            logger.debug("Using cached coin details for %s", coin_id)
             # Note: Cached responses don't count as API requests for adaptive rate limiting
             return cached_result
         
@@ -198,7 +199,7 @@ class CoinGeckoProvider(AbstractDataProvider):
             self._store_in_cache(cache_key, result)
             self._save_cache()
             self.log_api_usage(endpoint, "success", response_time)
-            logger.debug(f"Fetched and cached coin details for {coin_id}")
+            logger.debug("Fetched and cached coin details for %s", coin_id)
             return result
         else:
             logger.error(f"Failed to get coin details for {coin_id}")
@@ -216,31 +217,37 @@ class CoinGeckoProvider(AbstractDataProvider):
                 logger.warning("No price data available")
                 return None
             
-            # Create DataFrame
-            df_data = []
-            for i, price_point in enumerate(prices):
-                timestamp = price_point[0]
-                price = price_point[1]
-                
-                # Get corresponding market cap and volume
-                market_cap = market_caps[i][1] if i < len(market_caps) else 0
-                volume = volumes[i][1] if i < len(volumes) else 0
-                
-                df_data.append({
-                    'Date': pd.to_datetime(timestamp, unit='ms'),
-                    'Open': price,  # CoinGecko returns single daily price
-                    'High': price,
-                    'Low': price,
-                    'Close': price,
-                    'Volume': volume,
-                    'MarketCap': market_cap
-                })
+            # Build the columns as arrays in one pass; CoinGecko returns a
+            # single daily price, so it fills every OHLC column
+            price_array = np.asarray(prices, dtype=np.float64)
+            timestamps = pd.to_datetime(price_array[:, 0], unit='ms')
+            price = price_array[:, 1]
+            
+            # Market caps and volumes can be shorter than prices; pad with 0
+            market_cap = np.zeros(len(price))
+            if market_caps:
+                values = np.asarray(market_caps, dtype=np.float64)[:len(price), 1]
+                market_cap[:len(values)] = values
+            
+            volume = np.zeros(len(price))
+            if volumes:
+                values = np.asarray(volumes, dtype=np.float64)[:len(price), 1]
+                volume[:len(values)] = values
+            
+            df = pd.DataFrame({
+                'Open': price,
+                'High': price,
+                'Low': price,
+                'Close': price,
+                'Volume': volume,
+                'MarketCap': market_cap
+            }, index=pd.DatetimeIndex(timestamps, name='Date'))
             
-            df = pd.DataFrame(df_data)
-            df.set_index('Date', inplace=True)
-            df.sort_index(inplace=True)
+            # CoinGecko returns points in order; only sort if it ever does not
+            if not df.index.is_monotonic_increasing:
+                df.sort_index(inplace=True)
             
-            logger.debug(f"Formatted {len(df)} data points for {coin_info.get('id', 'unknown')}")
+            logger.debug("Formatted %s data points for %s", len(df), coin_info.get('id', 'unknown'))
             return df
             
         except Exception as e:
@@ -354,11 +361,11 @@ class CoinGeckoProvider(AbstractDataProvider):
         age_hours = (datetime.now() - cached_time).total_seconds() / 3600
         
         if age_hours > ttl_hours:
-            logger.debug(f"Cache entry expired for {cache_key} (age: {age_hours:.1f}h)")
+            logger.debug("Cache entry expired for %s (age: %.1fh)", cache_key, age_hours)
             del self.api_cache[cache_key]
             return None
         
-        logger.debug(f"Cache hit for {cache_key} (age: {age_hours:.1f}h)")
+        logger.debug("Cache hit for %s (age: %.1fh)", cache_key, age_hours)
         return cache_entry['data']
     
     def _store_in_cache(self, cache_key: str, data: Dict) -> None:
@@ -370,7 +377,7 @@ class CoinGeckoProvider(AbstractDataProvider):
             'data': data,
             'timestamp': datetime.now().isoformat()
         }
-        logger.debug(f"Cached data for {cache_key}")
+        logger.debug("Cached data for %s", cache_key)
     
     def _clear_expired_entries(self) -> None:
         """Remove expired entries from cache"""
@@ -364,6 +364,16 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.slow)
 
 
+@pytest.fixture(autouse=True)
+def isolate_working_directory(tmp_path, monkeypatch):
+    """Run every test from its own temporary directory
+    
+    Config files created on first run, the default log file and other
+    cwd-relative output then land in tmp_path instead of the repository.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Automatically setup test environment for each test"""
@@ -5,8 +5,10 @@ Test cases for AmiBrokerAdapter
 import unittest
 import tempfile
 import os
+import shutil
 import pandas as pd
-from unittest.mock import Mock, patch, MagicMock
+import numpy as np
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -27,6 +29,11 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         # Create mock configuration
         self.mock_config = Mock(spec=ConfigurationManager)
         self.mock_config.get.return_value = ""
+        self.mock_config.getint.side_effect = lambda section, key, fallback=0: fallback
+        
+        # Stands in for AmiBroker's Formats directory
+        self.formats_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.formats_dir, ignore_errors=True)
         
         # Create test data
         self.test_data = pd.DataFrame({
@@ -68,7 +75,33 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         
         self.assertIsNone(start_date)
         self.assertIsNone(end_date)
-    
+
+    def test_get_existing_range_reads_dates_once(self):
+        """Test that each boundary quotation's Date is fetched a single time"""
+        first_quote = Mock()
+        last_quote = Mock()
+        first_date = PropertyMock(return_value=datetime(2023, 1, 1, 0, 0))
+        last_date = PropertyMock(return_value=datetime(2023, 1, 31, 0, 0))
+        type(first_quote).Date = first_date
+        type(last_quote).Date = last_date
+
+        mock_quotations = Mock()
+        mock_quotations.Count = 31
+        mock_quotations.side_effect = lambda i: first_quote if i == 0 else last_quote
+
+        mock_com = Mock()
+        mock_com.Stocks.return_value.Quotations = mock_quotations
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        start_date, end_date = adapter.get_existing_range('TEST')
+
+        self.assertEqual(start_date, datetime(2023, 1, 1))
+        self.assertEqual(end_date, datetime(2023, 1, 31))
+        self.assertEqual(first_date.call_count, 1)
+        self.assertEqual(last_date.call_count, 1)
+
     @patch('win32com.client.Dispatch')
     def test_update_data_new_symbol(self, mock_dispatch):
         """Test updating data for a new symbol (no existing data)"""
@@ -99,6 +132,7 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         mock_com = Mock()
         mock_stock = Mock()
         mock_quotations = Mock()
+        mock_quotations.Count = 0
         mock_quote = Mock()
         
         mock_com.Stocks.return_value = mock_stock
@@ -114,13 +148,172 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         existing_end = datetime(2023, 1, 2)
         
         with patch.object(adapter, 'get_existing_range', return_value=(existing_start, existing_end)):
-            with patch.object(adapter, '_update_existing_quotation', return_value=False):
+            with patch.object(adapter, '_update_existing_quotations', return_value=0):
                 new_records, updated_records = adapter.update_data('TEST', self.test_data)
         
         # Should add records outside existing range
         self.assertGreater(new_records, 0)
         self.assertEqual(updated_records, 0)
     
+    def test_update_data_append_only_skips_overlap_check(self):
+        """Test that data entirely after the stored range is appended directly"""
+        mock_com = Mock()
+        mock_quotations = Mock()
+        mock_com.Stocks.return_value.Quotations = mock_quotations
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        existing_range = (datetime(2022, 12, 1), datetime(2022, 12, 31))
+        with patch.object(adapter, 'get_existing_range', return_value=existing_range):
+            with patch.object(adapter, '_update_existing_quotations') as mock_update:
+                new_records, updated_records = adapter.update_data('TEST', self.test_data)
+
+        self.assertEqual((new_records, updated_records), (len(self.test_data), 0))
+        self.assertEqual(mock_quotations.Add.call_count, len(self.test_data))
+        mock_update.assert_not_called()
+
+    def test_stocks_collection_cached_per_connection(self):
+        """Test that the Stocks property is fetched once until the connection changes"""
+        mock_com = Mock()
+        stocks_property = PropertyMock(return_value=Mock())
+        type(mock_com).Stocks = stocks_property
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        adapter.import_data('BTC', self.test_data)
+        adapter.delete_symbol('BTC')
+        self.assertEqual(stocks_property.call_count, 1)
+
+        adapter._reset_connection_caches()
+        adapter.delete_symbol('BTC')
+        self.assertEqual(stocks_property.call_count, 2)
+
+    def test_import_data_bulk_writes_csv(self):
+        """Test that the ASCII import hands AmiBroker one CSV with every row"""
+        written = {}
+
+        formats_dir = self.formats_dir
+
+        def fake_import(import_type, csv_path, format_name):
+            with open(csv_path) as f:
+                written['lines'] = f.read().splitlines()
+            with open(os.path.join(formats_dir, format_name)) as f:
+                written['format'] = f.read()
+            return 0
+
+        mock_com = Mock()
+        mock_com.Import.side_effect = fake_import
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+        adapter.formats_dir = formats_dir
+
+        self.assertTrue(adapter.import_data_bulk('BTC', self.test_data))
+        self.assertEqual(mock_com.Import.call_args[0][0], 0)
+        self.assertEqual(len(written['lines']), len(self.test_data))
+        self.assertEqual(written['lines'][0], '2023-01-01,BTC,100.0,105.0,95.0,104.0,1000000.0')
+        self.assertEqual(mock_com.Import.call_args[0][2], 'crypto_importer.format')
+        self.assertIn('$FORMAT Date_YMD, Ticker, Open, High, Low, Close, Volume', written['format'])
+        self.assertNotIn('$GROUP', written['format'])
+        self.assertFalse(os.path.exists(mock_com.Import.call_args[0][1]))
+
+    def test_import_data_uses_ascii_import_for_large_frames(self):
+        """Test that large frames skip the per-row COM loop and keep MarketCap"""
+        mock_com = Mock()
+        mock_com.Import.return_value = 0
+        mock_quotations = mock_com.Stocks.return_value.Quotations
+        quotes = [Mock(Date=day.to_pydatetime()) for day in self.test_data.index]
+        mock_quotations.Count = len(quotes)
+        mock_quotations.side_effect = lambda i: quotes[i]
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+        adapter.ascii_import_min_rows = len(self.test_data)
+        adapter.formats_dir = self.formats_dir
+
+        self.assertTrue(adapter.import_data('BTC', self.test_data))
+
+        mock_com.Import.assert_called_once()
+        mock_quotations.Add.assert_not_called()
+        quotes[-1].SetExtraData.assert_called_once_with('MarketCap', 1.2e9)
+
+    def test_ascii_import_off_by_default(self):
+        """Test that the ASCII importer is unused until it is configured"""
+        mock_com = Mock()
+        mock_quotations = mock_com.Stocks.return_value.Quotations
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        self.assertTrue(adapter.import_data('BTC', self.test_data))
+
+        mock_com.Import.assert_not_called()
+        self.assertEqual(mock_quotations.Add.call_count, len(self.test_data))
+
+    def test_import_data_writes_in_chunks(self):
+        """Test that each chunk picks the ASCII importer or COM on its own size"""
+        mock_com = Mock()
+        mock_com.Import.return_value = 0
+        mock_quotations = mock_com.Stocks.return_value.Quotations
+        mock_quotations.Count = 0
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+        adapter.chunk_size = 2
+        adapter.ascii_import_min_rows = 2
+        adapter.formats_dir = self.formats_dir
+
+        self.assertTrue(adapter.import_data('BTC', self.test_data))
+
+        mock_com.Import.assert_called_once()
+        mock_quotations.Add.assert_called_once_with(self.test_data.index[-1].to_pydatetime())
+
+    def test_iter_chunks(self):
+        """Test splitting frames by chunk_size"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        adapter.chunk_size = 2
+        self.assertEqual([len(chunk) for chunk in adapter._iter_chunks(self.test_data)], [2, 1])
+
+        adapter.chunk_size = 0
+        self.assertEqual([len(chunk) for chunk in adapter._iter_chunks(self.test_data)], [3])
+
+    def test_import_data_falls_back_when_ascii_import_fails(self):
+        """Test that a failed ASCII import falls back to COM quotations"""
+        mock_com = Mock()
+        mock_com.Import.return_value = -1
+        mock_quotations = mock_com.Stocks.return_value.Quotations
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+        adapter.ascii_import_min_rows = 1
+        adapter.formats_dir = self.formats_dir
+
+        self.assertTrue(adapter.import_data('BTC', self.test_data))
+        self.assertEqual(mock_quotations.Add.call_count, len(self.test_data))
+
+    def test_batch_writes_saves_database_once(self):
+        """Test that writes inside a batch skip Save() and the database is saved on exit"""
+        mock_com = Mock()
+        mock_stock = mock_com.Stocks.return_value
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        with adapter.batch_writes():
+            with adapter.batch_writes():
+                self.assertTrue(adapter.import_data('BTC', self.test_data))
+                self.assertTrue(adapter.delete_symbol('ETH'))
+            mock_com.SaveDatabase.assert_not_called()
+
+        mock_stock.Save.assert_not_called()
+        mock_com.SaveDatabase.assert_called_once()
+
+        adapter.delete_symbol('ETH')
+        mock_stock.Save.assert_called_once()
+
     @patch('win32com.client.Dispatch')
     def test_create_groups_success(self, mock_dispatch):
         """Test successful creation of AmiBroker groups"""
@@ -167,6 +360,19 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         self.assertIn("BTC", symbols)
         self.assertIn("ETH", symbols)
     
+    def test_get_symbol_list_uses_enumeration(self):
+        """Test that an enumerable Stocks collection is iterated without indexing"""
+        mock_stocks = MagicMock()
+        mock_stocks.__iter__.return_value = iter([Mock(Ticker="BTC"), Mock(Ticker=""), Mock(Ticker="ETH")])
+        mock_com = Mock()
+        mock_com.Stocks = mock_stocks
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        self.assertEqual(adapter.get_symbol_list(), ["BTC", "ETH"])
+        mock_stocks.assert_not_called()
+
     @patch('win32com.client.Dispatch')
     def test_delete_symbol_success(self, mock_dispatch):
         """Test successful symbol deletion"""
@@ -237,27 +443,59 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         # Since base class returns False, this should return False
         self.assertFalse(result)
     
-    def test_add_quotation(self):
-        """Test adding a single quotation"""
+    def test_add_quotations(self):
+        """Test adding every row of a DataFrame"""
         adapter = AmiBrokerAdapter(self.mock_config)
-        
+
         mock_quotations = Mock()
         mock_quote = Mock()
         mock_quotations.Add.return_value = mock_quote
-        
-        test_date = self.test_data.index[0]
-        test_row = self.test_data.iloc[0]
-        
-        adapter._add_quotation(mock_quotations, test_date, test_row)
-        
-        mock_quotations.Add.assert_called_once()
-        self.assertEqual(mock_quote.Open, float(test_row['Open']))
-        self.assertEqual(mock_quote.High, float(test_row['High']))
-        self.assertEqual(mock_quote.Low, float(test_row['Low']))
-        self.assertEqual(mock_quote.Close, float(test_row['Close']))
-        self.assertEqual(mock_quote.Volume, float(test_row['Volume']))
-    
-    def test_update_existing_quotation_changed(self):
+
+        added = adapter._add_quotations(mock_quotations, self.test_data)
+
+        self.assertEqual(added, len(self.test_data))
+        self.assertEqual(mock_quotations.Add.call_count, len(self.test_data))
+        mock_quotations.Add.assert_called_with(self.test_data.index[-1].to_pydatetime())
+        self.assertEqual(mock_quote.Close, 106.0)
+        self.assertIsInstance(mock_quote.Volume, float)
+        mock_quote.SetExtraData.assert_called_with('MarketCap', 1.2e9)
+
+    def test_stock_extra_data_probe_reset_on_reconnect(self):
+        """Test that the stock SetExtraData probe is cached until the connection changes"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        self.assertFalse(adapter._supports_stock_extra_data(Mock(spec=['Quotations'])))
+        self.assertFalse(adapter._supports_stock_extra_data(Mock()))
+
+        adapter._reset_connection_caches()
+        self.assertTrue(adapter._supports_stock_extra_data(Mock()))
+
+    def test_ohlcv_array(self):
+        """Test that OHLCV columns are packed into one contiguous float64 block"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        ohlcv = adapter._ohlcv_array(self.test_data)
+
+        self.assertEqual(ohlcv.shape, (len(self.test_data), 5))
+        self.assertEqual(ohlcv.dtype, np.float64)
+        self.assertTrue(ohlcv.flags['C_CONTIGUOUS'])
+        self.assertEqual(ohlcv[0].tolist(), self.test_data.iloc[0][list(adapter.REQUIRED_COLUMNS)].tolist())
+
+    def test_add_quotations_without_extra_data_support(self):
+        """Test that SetExtraData support is probed once and then skipped"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        mock_quotations = Mock()
+        mock_quotations.Add.return_value = Mock(spec=['Open', 'High', 'Low', 'Close', 'Volume'])
+
+        with patch('adapters.amibroker_adapter.hasattr', create=True, side_effect=hasattr) as mock_hasattr:
+            added = adapter._add_quotations(mock_quotations, self.test_data)
+
+        self.assertEqual(added, len(self.test_data))
+        self.assertFalse(adapter._quote_extra_data)
+        self.assertEqual(mock_hasattr.call_count, 1)
+
+    def test_update_existing_quotations_single_row_changed(self):
         """Test updating existing quotation when values have changed"""
         adapter = AmiBrokerAdapter(self.mock_config)
         
@@ -274,16 +512,15 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         
         mock_quotations.side_effect = lambda i: mock_quote
         
-        test_date = self.test_data.index[0]
-        test_row = self.test_data.iloc[0]
+        first_row = self.test_data.iloc[:1]
         
-        result = adapter._update_existing_quotation(mock_quotations, test_date, test_row)
+        result = adapter._update_existing_quotations(mock_quotations, first_row)
         
-        self.assertTrue(result)
-        self.assertEqual(mock_quote.Close, float(test_row['Close']))
-        self.assertEqual(mock_quote.Volume, float(test_row['Volume']))
+        self.assertEqual(result, 1)
+        self.assertEqual(mock_quote.Close, float(first_row['Close'].iloc[0]))
+        self.assertEqual(mock_quote.Volume, float(first_row['Volume'].iloc[0]))
     
-    def test_update_existing_quotation_unchanged(self):
+    def test_update_existing_quotations_single_row_unchanged(self):
         """Test updating existing quotation when values haven't changed"""
         adapter = AmiBrokerAdapter(self.mock_config)
         
@@ -295,18 +532,57 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         mock_quote.Date.year = 2023
         mock_quote.Date.month = 1
         mock_quote.Date.day = 1
-        mock_quote.Close = 100.0  # Same as test data
+        mock_quote.Close = 104.0  # Same as test data
         mock_quote.Volume = 1000000  # Same as test data
         
         mock_quotations.side_effect = lambda i: mock_quote
         
-        test_date = self.test_data.index[0]
-        test_row = self.test_data.iloc[0]
-        
-        result = adapter._update_existing_quotation(mock_quotations, test_date, test_row)
-        
-        self.assertFalse(result)
-    
+        result = adapter._update_existing_quotations(mock_quotations, self.test_data.iloc[:1])
+
+        self.assertEqual(result, 0)
+
+    def test_update_existing_quotations_writes_only_changed_rows(self):
+        """Test that only quotations whose values changed are written back"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        # 2023-01-01 differs from the test data, 2023-01-02 matches it and
+        # 2023-01-03 has no stored quotation
+        changed_quote = Mock(Date=datetime(2023, 1, 1), Close=100.0, Volume=500000)
+        unchanged_quote = Mock(Date=datetime(2023, 1, 2), Close=105.0, Volume=1100000)
+        quotes = [changed_quote, unchanged_quote]
+
+        mock_quotations = Mock()
+        mock_quotations.Count = len(quotes)
+        mock_quotations.side_effect = lambda i: quotes[i]
+
+        updated = adapter._update_existing_quotations(mock_quotations, self.test_data)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(changed_quote.Close, 104.0)
+        self.assertEqual(changed_quote.Volume, 1000000.0)
+        changed_quote.SetExtraData.assert_called_once_with('MarketCap', 1e9)
+        unchanged_quote.SetExtraData.assert_not_called()
+
+    def test_index_quotations_by_date_stops_before_since(self):
+        """Test that indexing walks back from the newest quotation only as far as needed"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        quotes = []
+        for day in (1, 2, 3):
+            quote = Mock()
+            quote.Date = datetime(2023, 1, day)
+            quotes.append(quote)
+
+        mock_quotations = Mock()
+        mock_quotations.Count = len(quotes)
+        mock_quotations.side_effect = lambda i: quotes[i]
+
+        quotes_by_date = adapter._index_quotations_by_date(mock_quotations, datetime(2023, 1, 2).date())
+
+        self.assertEqual(set(quotes_by_date), {datetime(2023, 1, 2).date(), datetime(2023, 1, 3).date()})
+        self.assertIs(quotes_by_date[datetime(2023, 1, 3).date()], quotes[2])
+        self.assertEqual(mock_quotations.call_count, 3)
+
     def test_set_stock_metadata(self):
         """Test setting stock metadata"""
         adapter = AmiBrokerAdapter(self.mock_config)
@@ -355,7 +631,67 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         result = adapter._get_current_database()
         
         self.assertIsNone(result)
-    
+
+    @patch('win32com.client.Dispatch')
+    def test_dispatch_broker_falls_back_to_late_binding(self, mock_dispatch):
+        """Test that dynamic dispatch is used when the early-bound proxy cannot be generated"""
+        adapter = AmiBrokerAdapter(self.mock_config)
+
+        with patch('win32com.client.gencache.EnsureDispatch', side_effect=Exception("no type library"), create=True) as mock_ensure:
+            com_object = adapter._dispatch_broker()
+
+        mock_ensure.assert_called_once_with("Broker.Application")
+        mock_dispatch.assert_called_once_with("Broker.Application")
+        self.assertIs(com_object, mock_dispatch.return_value)
+
+    def test_create_and_connect_reuses_new_database(self):
+        """Test that create_and_connect does not reload the new database"""
+        mock_com = Mock()
+        mock_com.NewDatabase.return_value = True
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        result = adapter.create_and_connect(self.test_db_path)
+
+        self.assertTrue(result)
+        self.assertTrue(adapter.connection_verified)
+        self.assertEqual(adapter.database_path, self.test_db_path)
+        mock_com.NewDatabase.assert_called_once_with(self.test_db_path)
+        mock_com.LoadDatabase.assert_not_called()
+
+    def test_load_database_skips_probe_when_already_loaded(self):
+        """Test that reloading the same path does not query AmiBroker again"""
+        open(self.test_db_path, 'w').close()
+        mock_com = Mock()
+        mock_com.LoadDatabase.return_value = True
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        with patch.object(adapter, '_get_current_database', return_value=None) as mock_current:
+            self.assertTrue(adapter._load_database(self.test_db_path))
+            self.assertTrue(adapter._load_database(self.test_db_path))
+
+        mock_current.assert_called_once()
+        mock_com.LoadDatabase.assert_called_once_with(self.test_db_path)
+
+    def test_load_database_probes_again_after_reconnect(self):
+        """Test that a reconnect forgets which database this adapter loaded"""
+        open(self.test_db_path, 'w').close()
+        mock_com = Mock()
+        mock_com.LoadDatabase.return_value = True
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = mock_com
+
+        with patch.object(adapter, '_get_current_database', return_value=None):
+            self.assertTrue(adapter._load_database(self.test_db_path))
+            adapter._reset_connection_caches()
+            self.assertTrue(adapter._load_database(self.test_db_path))
+
+        self.assertEqual(mock_com.LoadDatabase.call_count, 2)
+
     def test_get_database_stats(self):
         """Test getting database statistics"""
         adapter = AmiBrokerAdapter(self.mock_config)
@@ -371,6 +707,24 @@ class TestAmiBrokerAdapter(unittest.TestCase):
         self.assertTrue(stats['connection_status'])
         self.assertIn('sample_date_range', stats)
 
+    def test_get_database_stats_uses_stocks_count(self):
+        """Test that statistics count symbols without listing them"""
+        mock_stocks = Mock()
+        mock_stocks.Count = 250
+        mock_stocks.return_value.Ticker = 'BTC'
+
+        adapter = AmiBrokerAdapter(self.mock_config)
+        adapter.com_object = Mock(Stocks=mock_stocks)
+
+        with patch.object(adapter, 'get_symbol_list') as mock_list:
+            with patch.object(adapter, 'get_existing_range', return_value=(datetime(2023, 1, 1), datetime(2023, 1, 31))):
+                stats = adapter.get_database_stats()
+
+        mock_list.assert_not_called()
+        mock_stocks.assert_called_once_with(0)
+        self.assertEqual(stats['total_symbols'], 250)
+        self.assertEqual(stats['sample_date_range']['symbol'], 'BTC')
+
 
 class TestAmiBrokerAdapterValidation(unittest.TestCase):
     """Additional validation tests for AmiBrokerAdapter"""
@@ -378,6 +732,7 @@ class TestAmiBrokerAdapterValidation(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_config = Mock(spec=ConfigurationManager)
+        self.mock_config.getint.side_effect = lambda section, key, fallback=0: fallback
         self.adapter = AmiBrokerAdapter(self.mock_config)
     
     def test_validate_connection_default(self):
@@ -402,6 +757,68 @@ class TestAmiBrokerAdapterValidation(unittest.TestCase):
             result = self.adapter.symbol_exists('LTC')
             self.assertFalse(result)
     
+    def test_symbol_exists_reads_symbol_list_once(self):
+        """Test that symbol_exists caches the symbol list until invalidated"""
+        with patch.object(self.adapter, 'get_symbol_list', return_value=['BTC', 'ETH']) as mock_list:
+            self.assertTrue(self.adapter.symbol_exists('BTC'))
+            self.assertFalse(self.adapter.symbol_exists('LTC'))
+            self.assertEqual(mock_list.call_count, 1)
+
+            self.adapter.invalidate_symbol_cache()
+            self.adapter.symbol_exists('BTC')
+            self.assertEqual(mock_list.call_count, 2)
+
+    def test_symbol_cache_tracks_import_and_delete(self):
+        """Test that importing and deleting keep the cached symbol set current"""
+        mock_com = Mock()
+        self.adapter.com_object = mock_com
+        data = pd.DataFrame({
+            'Open': [1.0], 'High': [2.0], 'Low': [0.5], 'Close': [1.5], 'Volume': [100]
+        }, index=pd.date_range('2023-01-01', periods=1, freq='D'))
+
+        with patch.object(self.adapter, 'get_symbol_list', return_value=['BTC']):
+            self.assertFalse(self.adapter.symbol_exists('LTC'))
+
+        self.assertTrue(self.adapter.import_data('LTC', data))
+        self.assertTrue(self.adapter.symbol_exists('LTC'))
+
+        self.assertTrue(self.adapter.delete_symbol('LTC'))
+        self.assertFalse(self.adapter.symbol_exists('LTC'))
+
+    def test_normalize_ohlcv(self):
+        """Test that OHLCV columns are cast to float64 once, and bad data is left alone"""
+        data = pd.DataFrame({
+            'Open': ['1.0'], 'High': [2], 'Low': [0.5], 'Close': [1.5], 'Volume': [100]
+        }, index=pd.date_range('2023-01-01', periods=1, freq='D'))
+
+        normalized = self.adapter._normalize_ohlcv(data)
+
+        self.assertTrue(all(dtype == np.float64 for dtype in normalized.dtypes))
+        self.assertTrue(self.adapter.validate_data_format(normalized))
+
+        bad = data.assign(Open=['n/a'])
+        self.assertIs(self.adapter._normalize_ohlcv(bad), bad)
+        self.assertFalse(self.adapter.validate_data_format(bad))
+
+    def test_validate_data_format_valid(self):
+        """Test that a complete numeric OHLCV frame is accepted"""
+        data = pd.DataFrame({
+            'Open': [1.0], 'High': [2.0], 'Low': [0.5], 'Close': [1.5], 'Volume': [100]
+        }, index=pd.date_range('2023-01-01', periods=1, freq='D'))
+
+        self.assertTrue(self.adapter.validate_data_format(data))
+
+    def test_validate_data_format_rejects_missing_and_non_numeric(self):
+        """Test that missing or non-numeric OHLCV columns are rejected"""
+        index = pd.date_range('2023-01-01', periods=1, freq='D')
+        missing = pd.DataFrame({'Open': [1.0], 'High': [2.0], 'Low': [0.5], 'Close': [1.5]}, index=index)
+        non_numeric = pd.DataFrame({
+            'Open': [1.0], 'High': [2.0], 'Low': [0.5], 'Close': ['1.5'], 'Volume': [100]
+        }, index=index)
+
+        self.assertFalse(self.adapter.validate_data_format(missing))
+        self.assertFalse(self.adapter.validate_data_format(non_numeric))
+
     def test_backup_database_not_implemented(self):
         """Test that backup_database returns False (not implemented)"""
         result = self.adapter.backup_database()
@@ -5,6 +5,7 @@ Test cases for ConfigurationManager
 import unittest
 import tempfile
 import os
+import shutil
 from unittest.mock import patch, mock_open
 import configparser
 import sys
@@ -14,7 +15,7 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-from core.configuration_manager import ConfigurationManager
+from core.configuration_manager import ConfigurationManager, RuntimeConfig, _parse_ini_cached, _parse_ini_fast
 
 
 class TestConfigurationManager(unittest.TestCase):
@@ -69,6 +70,22 @@ class TestConfigurationManager(unittest.TestCase):
                 config_manager = ConfigurationManager(self.test_config_path)
                 self.assertEqual(config_manager.config_path, self.test_config_path)
     
+    def test_unsanitized_path_used_as_given(self):
+        """Test that sanitize=False skips path validation but still writes atomically"""
+        secure_write = ConfigurationManager._secure_file_write
+        with patch.object(ConfigurationManager, '_sanitize_config_path') as mock_sanitize, \
+             patch.object(ConfigurationManager, '_secure_file_write', autospec=True,
+                          side_effect=secure_write) as mock_secure_write:
+            config_manager = ConfigurationManager(self.test_config_path, sanitize=False)
+        
+        mock_sanitize.assert_not_called()
+        mock_secure_write.assert_called_once()
+        self.assertEqual(config_manager.config_path, self.test_config_path)
+        
+        created_config = configparser.ConfigParser()
+        created_config.read(self.test_config_path)
+        self.assertIn('DATABASE', created_config.sections())
+    
     def test_create_default_config(self):
         """Test creation of default configuration file"""
         config_manager = ConfigurationManager(self.test_config_path)
@@ -485,6 +502,38 @@ class TestConfigurationManagerSecurity(unittest.TestCase):
                         resolved_path = Path(valid_path).resolve()
                         self.assertEqual(config_manager.config_path, str(resolved_path))
     
+    def test_cve002_sibling_directory_with_shared_prefix_blocked(self):
+        """Test CVE-002: A directory that merely starts with the cwd name is not inside it"""
+        sibling_path = os.path.realpath(os.getcwd()) + "_evil" + os.sep + "config.ini"
+        
+        with patch('core.configuration_manager.logger') as mock_logger:
+            sanitized = ConfigurationManager._sanitize_config_path(None, sibling_path)
+        
+        mock_logger.error.assert_called()
+        self.assertEqual(sanitized, str(Path.cwd() / "config.ini"))
+    
+    def test_cve002_plain_file_name_resolved_in_cwd(self):
+        """Test CVE-002: Bare config file names resolve inside the working directory"""
+        sanitized = ConfigurationManager._sanitize_config_path(None, "my-settings.cfg")
+        
+        self.assertEqual(sanitized, os.path.join(os.path.realpath(os.getcwd()), "my-settings.cfg"))
+    
+    def test_cve002_plain_file_name_symlink_blocked(self):
+        """Test CVE-002: A bare file name symlinked outside the allowed dirs is rejected"""
+        outside_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, outside_dir, ignore_errors=True)
+        target = os.path.join(outside_dir, "sensitive.ini")
+        open(target, 'w').close()
+        link_name = "linked_config.ini"
+        os.symlink(target, link_name)
+        self.addCleanup(os.remove, link_name)
+        
+        with patch('core.configuration_manager.logger') as mock_logger:
+            sanitized = ConfigurationManager._sanitize_config_path(None, link_name)
+        
+        mock_logger.error.assert_called()
+        self.assertNotEqual(os.path.realpath(sanitized), os.path.realpath(target))
+
     def test_cve002_symlink_attack_prevention(self):
         """Test CVE-002: Symlink attack prevention"""
         # Create a symlink that points outside allowed directory
@@ -892,6 +941,339 @@ consecutive_failures_threshold = 3
         self.assertGreaterEqual(max_rpm, api_requests_per_minute)
 
 
+class TestConfigurationManagerParseCache(unittest.TestCase):
+    """Test cases for the shared INI parse cache"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path.cwd() / "test_temp_parse_cache"
+        self.temp_dir.mkdir(exist_ok=True)
+        self.test_config_path = str(self.temp_dir / "cached_config.ini")
+        with open(self.test_config_path, 'w') as f:
+            f.write("[IMPORT]\nmax_coins = 100\n")
+        _parse_ini_cached.cache_clear()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _parse_ini_cached.cache_clear()
+    
+    def test_repeated_instantiation_reuses_parse(self):
+        """Test that an unchanged file is parsed only once"""
+        first = ConfigurationManager(self.test_config_path)
+        second = ConfigurationManager(self.test_config_path)
+        
+        self.assertEqual(_parse_ini_cached.cache_info().misses, 1)
+        self.assertEqual(_parse_ini_cached.cache_info().hits, 1)
+        self.assertIs(first.config, second.config)
+        self.assertEqual(second.getint('IMPORT', 'max_coins'), 100)
+    
+    def test_load_stats_file_once(self):
+        """Test that loading an existing file needs a single stat and no exists() check"""
+        with patch('core.configuration_manager.os.path.exists') as mock_exists:
+            with patch('core.configuration_manager.os.stat', wraps=os.stat) as mock_stat:
+                config_manager = ConfigurationManager(self.test_config_path)
+
+        mock_exists.assert_not_called()
+        # Path.resolve() in the sanitizer stats through os as well - count only the file itself
+        config_stats = [c for c in mock_stat.call_args_list if c.args == (config_manager.config_path,)]
+        self.assertEqual(len(config_stats), 1)
+        self.assertEqual(config_manager.getint('IMPORT', 'max_coins'), 100)
+
+    def test_cached_parse_validated_once(self):
+        """Test that defaults are merged into a cached parse only on the first load"""
+        first = ConfigurationManager(self.test_config_path)
+
+        with patch.object(ConfigurationManager, '_validate_config') as mock_validate:
+            second = ConfigurationManager(self.test_config_path)
+
+        mock_validate.assert_not_called()
+        self.assertTrue(second.config.has_option('DATABASE', 'database_path'))
+        self.assertEqual(first.get('PROVIDERS', 'data_provider'), second.get('PROVIDERS', 'data_provider'))
+
+    def test_set_value_is_copy_on_write(self):
+        """Test that set_value does not leak into other instances"""
+        first = ConfigurationManager(self.test_config_path)
+        second = ConfigurationManager(self.test_config_path)
+        
+        first.set_value('IMPORT', 'max_coins', '10')
+        
+        self.assertEqual(first.getint('IMPORT', 'max_coins'), 10)
+        self.assertEqual(second.getint('IMPORT', 'max_coins'), 100)
+        self.assertEqual(ConfigurationManager(self.test_config_path).getint('IMPORT', 'max_coins'), 100)
+    
+    def test_file_change_invalidates_cache(self):
+        """Test that modifying the file triggers a fresh parse"""
+        ConfigurationManager(self.test_config_path)
+        
+        with open(self.test_config_path, 'w') as f:
+            f.write("[IMPORT]\nmax_coins = 250\n")
+        stat_result = os.stat(self.test_config_path)
+        os.utime(self.test_config_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+        
+        config_manager = ConfigurationManager(self.test_config_path)
+        self.assertEqual(config_manager.getint('IMPORT', 'max_coins'), 250)
+    
+    def test_reload_bypasses_cache(self):
+        """Test that reload re-reads the file"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        config_manager.set_value('IMPORT', 'max_coins', '10')
+        
+        config_manager.reload()
+        
+        self.assertEqual(config_manager.getint('IMPORT', 'max_coins'), 100)
+        self.assertEqual(_parse_ini_cached.cache_info().misses, 1)
+    
+    def test_locale_encoded_file_falls_back(self):
+        """Test that a non-UTF-8 config is re-read in the locale encoding"""
+        with open(self.test_config_path, 'wb') as f:
+            f.write("[DATABASE]\ndatabase_path = C:\\Données\\crypto.adb\n".encode('cp1252'))
+        
+        with patch('core.configuration_manager.locale.getpreferredencoding', return_value='cp1252'):
+            with self.assertLogs('core.configuration_manager', level='WARNING') as logs:
+                config_manager = ConfigurationManager(self.test_config_path)
+        
+        self.assertEqual(config_manager.get('DATABASE', 'database_path'), 'C:\\Données\\crypto.adb')
+        self.assertTrue(any('not valid UTF-8' in message for message in logs.output))
+
+
+class TestFastIniParser(unittest.TestCase):
+    """Test cases for the regex INI parser used on the load path"""
+    
+    def test_matches_configparser_on_default_config(self):
+        """Test that the generated default config parses the same as configparser"""
+        text = ConfigurationManager._generate_config_with_comments(None)
+        parser = configparser.ConfigParser()
+        parser.read_string(text)
+        
+        expected = {section: dict(parser[section]) for section in parser.sections()}
+        self.assertEqual(_parse_ini_fast(text), expected)
+    
+    def test_plain_subset(self):
+        """Test comments, blank values, CRLF line endings and case folding of keys"""
+        text = "# header\r\n[A]\r\nKey = C:\\path = x\r\n; note\r\n  # indented note\r\n\r\n[B]\r\nempty =  \r\n"
+        
+        self.assertEqual(_parse_ini_fast(text), {'A': {'key': 'C:\\path = x'}, 'B': {'empty': ''}})
+    
+    def test_unsupported_syntax_falls_back(self):
+        """Test that syntax outside the plain subset is left to configparser"""
+        unsupported = [
+            "[A]\nx = 1\n  continued\n",
+            "x = 1\n[A]\n",
+            "[A]\nx: 1\n",
+            "[A]\nx = %(y)s\n",
+            "[A]\n[A]\n",
+            "[A]\nX = 1\nx = 2\n",
+            "[DEFAULT]\nx = 1\n",
+        ]
+        for text in unsupported:
+            with self.subTest(text=text):
+                self.assertIsNone(_parse_ini_fast(text))
+
+
+class TestConfigurationManagerSnapshot(unittest.TestCase):
+    """Test cases for the RuntimeConfig snapshot"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path.cwd() / "test_temp_snapshot"
+        self.temp_dir.mkdir(exist_ok=True)
+        self.test_config_path = str(self.temp_dir / "snapshot_config.ini")
+        with open(self.test_config_path, 'w') as f:
+            f.write("[IMPORT]\nmax_coins = 100\nmin_market_cap = 5000\n"
+                    "[PROVIDERS]\nexchanges = kraken, binance\n")
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _parse_ini_cached.cache_clear()
+    
+    def test_snapshot_coerces_values(self):
+        """Test that the snapshot holds typed values"""
+        snap = ConfigurationManager(self.test_config_path).snapshot()
+        
+        self.assertIsInstance(snap, RuntimeConfig)
+        self.assertEqual(snap.max_coins, '100')
+        self.assertEqual(snap.min_market_cap, 5000.0)
+        self.assertEqual(snap.exchanges, ('kraken', 'binance'))
+        self.assertEqual(snap.data_provider, 'coingecko')
+        self.assertTrue(snap.create_if_not_exists)
+        self.assertFalse(snap.exclude_stablecoins)
+    
+    def test_snapshot_is_frozen(self):
+        """Test that the snapshot cannot be modified"""
+        snap = ConfigurationManager(self.test_config_path).snapshot()
+        
+        with self.assertRaises(AttributeError):
+            snap.max_coins = 1
+    
+    def test_snapshot_refreshed_after_set_value(self):
+        """Test that set_value invalidates the cached snapshot"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        first = config_manager.snapshot()
+        
+        self.assertIs(config_manager.snapshot(), first)
+        
+        config_manager.set_value('IMPORT', 'max_coins', '10')
+        self.assertEqual(config_manager.snapshot().max_coins, '10')
+    
+    def test_snapshot_tolerates_malformed_max_coins(self):
+        """Test that a non-numeric max_coins does not break the snapshot"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        config_manager.set_value('IMPORT', 'max_coins', 'lots')
+        
+        self.assertEqual(config_manager.snapshot().max_coins, 'lots')
+
+
+class TestConfigurationManagerValueCache(unittest.TestCase):
+    """Test cases for the materialized value caches behind the get* accessors"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path.cwd() / "test_temp_value_cache"
+        self.temp_dir.mkdir(exist_ok=True)
+        self.test_config_path = str(self.temp_dir / "value_config.ini")
+        with open(self.test_config_path, 'w') as f:
+            f.write("[IMPORT]\nmax_coins = 100\nrate_limit_delay = 2.5\n"
+                    "[FILTERING]\nexclude_stablecoins = yes\nexcluded_symbols = USDT, DAI\n")
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _parse_ini_cached.cache_clear()
+    
+    def test_typed_values_match_configparser(self):
+        """Test that cached values match what configparser returns"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        parser = config_manager.config
+        
+        self.assertEqual(config_manager.getint('IMPORT', 'max_coins'), parser.getint('IMPORT', 'max_coins'))
+        self.assertEqual(config_manager.getfloat('IMPORT', 'rate_limit_delay'), 2.5)
+        self.assertIs(config_manager.getboolean('FILTERING', 'exclude_stablecoins'), True)
+        self.assertEqual(config_manager.getlist('FILTERING', 'excluded_symbols'), ['USDT', 'DAI'])
+    
+    def test_missing_options_use_fallback(self):
+        """Test that lookups outside the cache still honour fallbacks"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        
+        self.assertEqual(config_manager.get('NOPE', 'missing', fallback='x'), 'x')
+        self.assertEqual(config_manager.getint('NOPE', 'missing', fallback=7), 7)
+        self.assertEqual(config_manager.getlist('NOPE', 'missing'), [])
+    
+    def test_invalid_value_still_raises(self):
+        """Test that non-coercible values raise as configparser does"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        
+        with self.assertRaises(ValueError):
+            config_manager.getboolean('IMPORT', 'rate_limit_delay')
+        with self.assertRaises(ValueError):
+            config_manager.getint('IMPORT', 'rate_limit_delay')
+    
+    def test_set_value_refreshes_cache(self):
+        """Test that set_value updates and invalidates cached typed values"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        
+        config_manager.set_value('IMPORT', 'max_coins', '25')
+        config_manager.set_value('FILTERING', 'exclude_stablecoins', 'maybe')
+        
+        self.assertEqual(config_manager.getint('IMPORT', 'max_coins'), 25)
+        with self.assertRaises(ValueError):
+            config_manager.getboolean('FILTERING', 'exclude_stablecoins')
+
+    
+    def test_sections_materialized_on_first_lookup(self):
+        """Test that only looked-up sections are flattened into the caches"""
+        config_manager = ConfigurationManager(self.test_config_path)
+        
+        config_manager.getint('IMPORT', 'max_coins')
+        
+        self.assertIn('IMPORT', config_manager._materialized_sections)
+        self.assertNotIn('FILTERING', config_manager._materialized_sections)
+
+
+class TestConfigurationManagerLazyLoad(unittest.TestCase):
+    """Test cases for lazily loaded managers"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path.cwd() / "test_temp_lazy"
+        self.temp_dir.mkdir(exist_ok=True)
+        self.test_config_path = str(self.temp_dir / "lazy_config.ini")
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        _parse_ini_cached.cache_clear()
+    
+    def test_lazy_instance_defers_file_access(self):
+        """Test that a lazy manager does not touch the file until a value is read"""
+        config_manager = ConfigurationManager(self.test_config_path, lazy=True)
+        
+        self.assertFalse(os.path.exists(self.test_config_path))
+        self.assertEqual(config_manager.getint('IMPORT', 'max_coins'), 500)
+        self.assertTrue(os.path.exists(self.test_config_path))
+    
+    def test_lazy_instance_can_create_default_config(self):
+        """Test that create_default_config works on an unloaded manager"""
+        config_manager = ConfigurationManager(self.test_config_path, lazy=True)
+        
+        config_manager.create_default_config()
+        
+        self.assertTrue(os.path.exists(self.test_config_path))
+        self.assertEqual(config_manager.get('PROVIDERS', 'data_provider'), 'coingecko')
+
+
+class TestConfigurationManagerInstances(unittest.TestCase):
+    """Test cases for the shared get_instance() managers"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path.cwd() / "test_temp_instances"
+        self.temp_dir.mkdir(exist_ok=True)
+        self.test_config_path = str(self.temp_dir / "shared_config.ini")
+        with open(self.test_config_path, 'w') as f:
+            f.write("[IMPORT]\nmax_coins = 100\n")
+        ConfigurationManager.clear_instances()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        import shutil
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        ConfigurationManager.clear_instances()
+        _parse_ini_cached.cache_clear()
+    
+    def test_get_instance_reuses_manager(self):
+        """Test that the same path returns the same manager"""
+        first = ConfigurationManager.get_instance(self.test_config_path)
+        second = ConfigurationManager.get_instance(self.test_config_path)
+        
+        self.assertIs(first, second)
+        self.assertIsNot(first, ConfigurationManager(self.test_config_path))
+    
+    def test_relative_and_absolute_paths_share_instance(self):
+        """Test that instances are keyed by absolute path"""
+        relative_path = os.path.relpath(self.test_config_path)
+        
+        self.assertIs(ConfigurationManager.get_instance(relative_path),
+                      ConfigurationManager.get_instance(os.path.abspath(relative_path)))
+    
+    def test_clear_instances_forces_reload(self):
+        """Test that clear_instances drops the shared managers"""
+        first = ConfigurationManager.get_instance(self.test_config_path)
+        ConfigurationManager.clear_instances()
+        
+        self.assertIsNot(ConfigurationManager.get_instance(self.test_config_path), first)
+
+
 if __name__ == '__main__':
     try:
         unittest.main()
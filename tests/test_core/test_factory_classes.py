@@ -0,0 +1,141 @@
+"""
+Test cases for factory registry helpers
+"""
+
+import unittest
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add src to path
+src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+import core.factory_classes as factory_classes
+
+
+class DummyProvider:
+    """Stand-in provider class used only for registration"""
+
+
+class ThreadRecordingComponent:
+    """Stand-in component that records the thread it was created on"""
+    
+    def __init__(self, config):
+        self.thread_id = threading.get_ident()
+
+
+class TestFactoryStatusCache(unittest.TestCase):
+    """Test cases for get_factory_status memoization"""
+
+    def setUp(self):
+        """Snapshot the provider registry"""
+        # Resolve through the module: other suites reload core.factory_classes
+        self.provider_factory = factory_classes.ProviderFactory
+        self.original_providers = dict(self.provider_factory._providers)
+
+    def tearDown(self):
+        """Restore the provider registry"""
+        self.provider_factory._providers.clear()
+        self.provider_factory._providers.update(self.original_providers)
+        factory_classes._bump_registry_version()
+
+    def test_status_reused_while_registry_unchanged(self):
+        """Test that repeated calls return the cached status"""
+        first = factory_classes.get_factory_status()
+        second = factory_classes.get_factory_status()
+
+        self.assertIs(first, second)
+
+    def test_registration_invalidates_status(self):
+        """Test that registering a component refreshes the status"""
+        before = factory_classes.get_factory_status()
+
+        self.provider_factory.register_provider('dummy', DummyProvider)
+        after = factory_classes.get_factory_status()
+
+        self.assertIsNot(before, after)
+        self.assertIn('dummy', after['providers']['available'])
+        self.assertEqual(after['providers']['count'], len(self.provider_factory.get_available_providers()))
+
+
+class TestRegisterDefaultImplementations(unittest.TestCase):
+    """Test cases for the register_default_implementations guard"""
+    
+    def setUp(self):
+        """Remember the registration flag"""
+        self.original_flag = factory_classes._defaults_registered
+    
+    def tearDown(self):
+        """Restore the registration flag"""
+        factory_classes._defaults_registered = self.original_flag
+    
+    def test_skips_registration_once_done(self):
+        """Test that registration is not repeated after it succeeded"""
+        factory_classes._defaults_registered = True
+        
+        with patch.object(factory_classes.ProviderFactory, 'register_provider') as mock_register:
+            factory_classes.register_default_implementations()
+        
+        mock_register.assert_not_called()
+    
+    def test_failed_import_allows_retry(self):
+        """Test that an ImportError leaves the guard unset"""
+        factory_classes._defaults_registered = False
+        
+        with patch.dict(sys.modules, {'mappers.kraken_mapper': None}):
+            factory_classes.register_default_implementations()
+        
+        self.assertFalse(factory_classes._defaults_registered)
+
+
+class TestCreateComponentsFromConfig(unittest.TestCase):
+    """Test cases for create_components_from_config"""
+    
+    def setUp(self):
+        """Register thread-recording stand-ins for every component type"""
+        self.factories = [
+            (factory_classes.ProviderFactory, '_providers'),
+            (factory_classes.MapperFactory, '_mappers'),
+            (factory_classes.AdapterFactory, '_adapters'),
+        ]
+        self.originals = [dict(getattr(factory, attr)) for factory, attr in self.factories]
+        for factory, attr in self.factories:
+            getattr(factory, attr)['recording'] = ThreadRecordingComponent
+        
+        values = {
+            ('PROVIDERS', 'data_provider'): 'recording',
+            ('PROVIDERS', 'database_adapter'): 'recording',
+            ('DATABASE', 'database_path'): '',
+        }
+        self.config = Mock()
+        self.config.get.side_effect = lambda section, key, fallback='': values.get((section, key), fallback)
+        self.config.getlist.return_value = ['recording']
+    
+    def tearDown(self):
+        """Restore the factory registries"""
+        for (factory, attr), original in zip(self.factories, self.originals):
+            registry = getattr(factory, attr)
+            registry.clear()
+            registry.update(original)
+        factory_classes._bump_registry_version()
+    
+    def test_adapter_created_on_calling_thread(self):
+        """Test that only the provider and mappers are built on worker threads"""
+        data_provider, exchange_mappers, database_adapter = factory_classes.create_components_from_config(self.config)
+        
+        self.assertEqual(database_adapter.thread_id, threading.get_ident())
+        self.assertNotEqual(data_provider.thread_id, threading.get_ident())
+        self.assertEqual(len(exchange_mappers), 1)
+    
+    def test_missing_provider_raises(self):
+        """Test that a failed provider still raises ValueError"""
+        del factory_classes.ProviderFactory._providers['recording']
+        
+        with self.assertRaises(ValueError):
+            factory_classes.create_components_from_config(self.config)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,11 +6,13 @@ import unittest
 import tempfile
 import os
 import json
+import shutil
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import sys
+import requests
 
 # Add src to path
 src_path = Path(__file__).parent.parent.parent / "src"
@@ -21,6 +23,13 @@ from mappers.abstract_exchange_mapper import ExchangeInfo
 from core.configuration_manager import ConfigurationManager
 
 
+def _disable_network(test_case):
+    """Fail any HTTP request a test has not mocked itself"""
+    patcher = patch('requests.get', side_effect=requests.exceptions.ConnectionError("network disabled in tests"))
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+
 class TestKrakenMapperCheckpoints(unittest.TestCase):
     """Test cases for KrakenMapper checkpoint functionality"""
     
@@ -35,6 +44,8 @@ class TestKrakenMapperCheckpoints(unittest.TestCase):
         
         # Create temporary directory for test files
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        _disable_network(self)
         self.checkpoint_file = os.path.join(self.temp_dir, "test_checkpoint.json")
         self.cache_file = os.path.join(self.temp_dir, "test_cache.json")
         
@@ -43,20 +54,6 @@ class TestKrakenMapperCheckpoints(unittest.TestCase):
         self.mapper.checkpoint_file = self.checkpoint_file
         self.mapper.cache_file = self.cache_file
     
-    def tearDown(self):
-        """Clean up test fixtures"""
-        # Clean up temp files
-        for file in [self.checkpoint_file, self.cache_file]:
-            if os.path.exists(file):
-                os.remove(file)
-        
-        # Clean up temp directory
-        if os.path.exists(self.temp_dir):
-            try:
-                os.rmdir(self.temp_dir)
-            except OSError:
-                pass  # Directory not empty, that's ok
-    
     def _mock_config_get(self, section, key, fallback=None):
         """Mock configuration getter"""
         config_values = {
@@ -293,8 +290,17 @@ class TestKrakenMapperBasic(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         # Create mock configuration
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        _disable_network(self)
+        
+        # Keep the mapping cache and checkpoint files in the temp directory
+        files = {
+            'mapping_file': os.path.join(self.temp_dir, "test_cache.json"),
+            'checkpoint_file': os.path.join(self.temp_dir, "test_checkpoint.json")
+        }
         self.mock_config = Mock(spec=ConfigurationManager)
-        self.mock_config.get.return_value = 'test_value'
+        self.mock_config.get.side_effect = lambda section, key, fallback=None: files.get(key, 'test_value')
         self.mock_config.getint.return_value = 100
         self.mock_config.getboolean.return_value = True
         self.mock_config.getfloat.return_value = 1.5
@@ -419,6 +425,8 @@ class TestKrakenMapperIntegration(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        _disable_network(self)
         
         # Create mock configuration
         self.mock_config = Mock(spec=ConfigurationManager)
@@ -435,19 +443,6 @@ class TestKrakenMapperIntegration(unittest.TestCase):
         self.mapper.checkpoint_file = self.checkpoint_file
         self.mapper.cache_file = self.cache_file
     
-    def tearDown(self):
-        """Clean up test fixtures"""
-        # Clean up temp files
-        for file in os.listdir(self.temp_dir):
-            file_path = os.path.join(self.temp_dir, file)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-        
-        try:
-            os.rmdir(self.temp_dir)
-        except OSError:
-            pass
-    
     def _mock_config_get(self, section, key, fallback=None):
         """Mock configuration getter"""
         config_values = {
@@ -2,6 +2,7 @@
 Test cases for ImportOrchestrator
 """
 import sys
+import threading
 import unittest
 import tempfile
 import os
@@ -115,6 +116,7 @@ class TestImportOrchestrator(unittest.TestCase):
         self.mock_database_adapter.create_groups.return_value = True
         self.mock_database_adapter.import_data.return_value = True
         self.mock_database_adapter.update_data.return_value = (10, 2)
+        self.mock_database_adapter.batch_writes.return_value = MagicMock()
         
         # Create orchestrator
         self.orchestrator = ImportOrchestrator(self.config_path)
@@ -125,6 +127,13 @@ class TestImportOrchestrator(unittest.TestCase):
             os.remove(self.config_path)
         os.rmdir(self.temp_dir)
     
+    def test_config_not_shared_between_orchestrators(self):
+        """Test that each orchestrator reads its own configuration manager"""
+        other = ImportOrchestrator(self.config_path)
+        
+        self.assertIsNot(other.config, self.orchestrator.config)
+        self.assertIsNot(other.config, ConfigurationManager.get_instance(self.config_path))
+    
     def _get_test_coins(self):
         """Get test coin data"""
         return [
@@ -510,6 +519,34 @@ class TestImportOrchestrator(unittest.TestCase):
             result = self.orchestrator.run_update()
         
         self.assertTrue(result)
+    
+    def test_run_update_writes_on_calling_thread(self):
+        """Test that market data is fetched on a worker while updates stay on the caller's thread"""
+        self.orchestrator.initialize(
+            self.mock_data_provider,
+            [self.mock_exchange_mapper],
+            self.mock_database_adapter
+        )
+        self.mock_data_provider.current_rate_limit_delay = 0
+        
+        fetch_threads = []
+        update_threads = []
+        self.mock_data_provider.get_market_data.side_effect = (
+            lambda coin_id, days: fetch_threads.append(threading.get_ident()) or self._get_test_market_data()
+        )
+        self.mock_database_adapter.update_data.side_effect = (
+            lambda symbol, df: update_threads.append(threading.get_ident()) or (1, 0)
+        )
+        
+        result = self.orchestrator.run_update(["BTC", "ETH"])
+        
+        self.assertTrue(result)
+        self.assertEqual(update_threads, [threading.get_ident()] * 2)
+        self.assertEqual(len(fetch_threads), 2)
+        self.assertNotIn(threading.get_ident(), fetch_threads)
+        self.mock_database_adapter.batch_writes.assert_called_once()
+        updated_symbols = [c.args[0] for c in self.mock_database_adapter.update_data.call_args_list]
+        self.assertEqual(updated_symbols, ["BTC", "ETH"])
 
 
 if __name__ == '__main__':
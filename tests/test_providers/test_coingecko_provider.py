@@ -8,6 +8,8 @@ import requests
 import time
 import sys
 import os
+import shutil
+import tempfile
 from pathlib import Path
 
 # Add src to path
@@ -25,6 +27,11 @@ class TestCoinGeckoProvider(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
+        # Keep the API cache file out of the working directory
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.cache_file = os.path.join(self.temp_dir, 'test_cache.json')
+        
         # Create mock configuration with all new config sections
         self.mock_config = Mock(spec=ConfigurationManager)
         self.mock_config.get.side_effect = self._mock_config_get
@@ -39,7 +46,7 @@ class TestCoinGeckoProvider(unittest.TestCase):
         """Mock config.get() method"""
         defaults = {
             'coingecko_api_key': '',
-            'cache_file': 'test_cache.json'
+            'cache_file': self.cache_file
         }
         return defaults.get(key, fallback or '')
     
@@ -483,11 +490,15 @@ class TestCoinGeckoProviderCaching(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures with caching enabled"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.cache_file = os.path.join(self.temp_dir, 'test_cache.json')
+        
         # Create mock configuration with caching enabled
         self.mock_config = Mock(spec=ConfigurationManager)
         self.mock_config.get.side_effect = lambda section, key, fallback=None: {
             'coingecko_api_key': '',
-            'cache_file': 'test_cache.json'
+            'cache_file': self.cache_file
         }.get(key, fallback or '')
         
         self.mock_config.getfloat.side_effect = lambda section, key, fallback=None: {
@@ -513,15 +524,10 @@ class TestCoinGeckoProviderCaching(unittest.TestCase):
         # Create provider instance
         self.provider = CoinGeckoProvider(self.mock_config)
     
-    def tearDown(self):
-        """Clean up test cache files"""
-        if os.path.exists('test_cache.json'):
-            os.remove('test_cache.json')
-    
     def test_cache_initialization(self):
         """Test cache system initialization"""
         self.assertTrue(self.provider.cache_enabled)
-        self.assertEqual(self.provider.cache_file, 'test_cache.json')
+        self.assertEqual(self.provider.cache_file, self.cache_file)
         self.assertEqual(self.provider.exchange_data_ttl_hours, 24)
         self.assertEqual(self.provider.market_data_ttl_hours, 1)
         self.assertEqual(self.provider.coin_details_ttl_hours, 6)
@@ -595,11 +601,15 @@ class TestCoinGeckoProviderAdaptiveRateLimiting(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures with adaptive rate limiting enabled"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.cache_file = os.path.join(self.temp_dir, 'test_cache.json')
+        
         # Create mock configuration with adaptive rate limiting
         self.mock_config = Mock(spec=ConfigurationManager)
         self.mock_config.get.side_effect = lambda section, key, fallback=None: {
             'coingecko_api_key': '',
-            'cache_file': 'test_cache.json'
+            'cache_file': self.cache_file
         }.get(key, fallback or '')
         
         self.mock_config.getfloat.side_effect = lambda section, key, fallback=None: {